@@ -0,0 +1,59 @@
+"""
+ja.normalize のベンチマーク
+
+プラグインによる1パスの正規化と、str.replace_all を連結した従来の実装を比較します。
+
+    python benchmarks/bench_normalize.py --rows 1000000
+"""
+
+import argparse
+import time
+
+import polars as pl
+import polars_japanese  # noqa: F401
+from polars_japanese.normalize_util import _normalize_with_replace
+
+_SAMPLES = [
+    "ｶﾌﾞｼｷｶﾞｲｼｬ　ﾃｽﾄ",
+    "東京都千代田区丸の内１－１－１",
+    "株式会社テスト〜サンプル〜",
+    "ＡＢＣ１２３！？",
+    "  前後に空白があるテキスト　",
+    "customer-000123",
+    "大阪府大阪市北区梅田２丁目４−９",
+]
+
+
+def _bench(df: pl.DataFrame, expr: pl.Expr, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df.select(expr)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    texts = (_SAMPLES * (args.rows // len(_SAMPLES) + 1))[: args.rows]
+    df = pl.DataFrame({"text": texts})
+
+    native = pl.col("text").ja.normalize()
+    chain = _normalize_with_replace(pl.col("text"))
+
+    assert df.select(native).equals(df.select(chain))
+
+    t_native = _bench(df, native, args.repeat)
+    t_chain = _bench(df, chain, args.repeat)
+    print(f"rows: {args.rows:,}")
+    print(f"str.replace_all chain : {t_chain:.3f} s")
+    print(f"ja.normalize (plugin) : {t_native:.3f} s")
+    print(f"speedup               : {t_chain / t_native:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
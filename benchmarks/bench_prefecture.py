@@ -0,0 +1,99 @@
+"""
+ja_pref のベンチマーク
+
+プラグインによる都道府県名の照合と、ja.normalize・ja.to_katakana で正規化してから
+replace_strict で表を引く従来の実装を比較します。
+1億行のスループットは次のように測定します (メモリは 10GB 程度必要です)。
+
+    python benchmarks/bench_prefecture.py --rows 100000000 --repeat 1
+"""
+
+import argparse
+import random
+import string
+import time
+
+import polars as pl
+import polars_japanese  # noqa: F401
+from polars_japanese.normalize_util import register_normalize_profile
+from polars_japanese.prefecture import _PREFECTURE_DATA
+
+# 従来の照合で使う正規化プロファイル (英字を大文字に統一)
+register_normalize_profile(
+    "_bench_prefecture",
+    mapping={
+        **{c: c.upper() for c in string.ascii_lowercase},
+        **{chr(ord(c) + 0xFEE0): c.upper() for c in string.ascii_lowercase},
+    },
+)
+
+
+def _legacy_code_map() -> dict[str, int]:
+    """従来の実装の照合用の表 (漢字・カタカナ・ローマ字と「都」「府」「県」の有無)"""
+    code_map: dict[str, int] = {}
+    for code, data in _PREFECTURE_DATA.items():
+        kanji, kana, roman = str(data["kanji"]), str(data["kana"]), str(data["roman"])
+        code_map[str(code)] = code
+        code_map[kanji] = code
+        code_map[kana] = code
+        code_map[roman] = code
+        for kanji_suffix, kana_suffix in (("都", "ト"), ("府", "フ"), ("県", "ケン")):
+            if kanji.endswith(kanji_suffix):
+                code_map[kanji.removesuffix(kanji_suffix)] = code
+                code_map[kana.removesuffix(kana_suffix)] = code
+    code_map["イバラギ"] = code_map["イバラギケン"] = 8
+    return code_map
+
+
+def _legacy_to_code(expr: pl.Expr) -> pl.Expr:
+    return (
+        expr.ja.normalize(profile="_bench_prefecture")
+        .ja.to_katakana()
+        .cast(pl.Utf8)
+        .replace_strict(_legacy_code_map(), default=None, return_dtype=pl.Int64)
+    )
+
+
+def _bench(df: pl.DataFrame, expr: pl.Expr, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df.select(expr)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    random.seed(0)
+    # 漢字・ひらがな・ローマ字・コードの表記が混在した住所マスタを想定
+    samples = [
+        value
+        for code, data in _PREFECTURE_DATA.items()
+        for value in (data["kanji"], data["hira"], str(data["roman"]).lower(), code)
+    ]
+    names = [str(value) for value in random.choices(samples, k=args.rows)]
+    df = pl.DataFrame({"pref": names})
+
+    native = pl.col("pref").ja_pref.to_code()
+    legacy = _legacy_to_code(pl.col("pref"))
+
+    assert df.select(native).equals(df.select(legacy))
+
+    print(f"rows: {args.rows:,}")
+    for name, expr in [
+        ("normalize + replace_strict", legacy),
+        ("ja_pref.to_code (plugin)", native),
+        ("ja_pref.to_kanji (plugin)", pl.col("pref").ja_pref.to_kanji()),
+        ("ja_pref.to_region (plugin)", pl.col("pref").ja_pref.to_region()),
+    ]:
+        elapsed = _bench(df, expr, args.repeat)
+        print(f"{name:<28}: {elapsed:.3f} s ({args.rows / elapsed / 1e6:.1f} M rows/s)")
+
+
+if __name__ == "__main__":
+    main()
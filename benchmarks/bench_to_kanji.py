@@ -0,0 +1,64 @@
+"""
+ja.to_kanji のベンチマーク
+
+プラグインによる変換と、kanjize.number2kanji を map_elements で呼ぶ従来の実装を
+比較します。
+
+    python benchmarks/bench_to_kanji.py --rows 1000000
+"""
+
+import argparse
+import random
+import time
+
+import kanjize
+import polars as pl
+import polars_japanese  # noqa: F401
+
+_CONFIGS = {
+    "all": kanjize.KanjizeConfiguration(),
+    "mixed": kanjize.KanjizeConfiguration(style=kanjize.KanjizeStyle.MIXED),
+    "daiji": kanjize.KanjizeConfiguration(use_daiji=True),
+}
+
+
+def _bench(df: pl.DataFrame, expr: pl.Expr, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df.select(expr)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    random.seed(0)
+    # 請求書の金額を想定した 1〜12 桁の金額
+    amounts = [random.randint(0, 10 ** random.randint(1, 12)) for _ in range(args.rows)]
+    df = pl.DataFrame({"amount": amounts})
+
+    print(f"rows: {args.rows:,}")
+    for name, config in _CONFIGS.items():
+        native = pl.col("amount").ja.to_kanji(config=config)
+        python = pl.col("amount").map_elements(
+            lambda x, config=config: kanjize.number2kanji(x, config=config),
+            return_dtype=pl.String,
+        )
+
+        assert df.select(native).equals(df.select(python))
+
+        t_native = _bench(df, native, args.repeat)
+        t_python = _bench(df, python, args.repeat)
+        print(f"[{name}]")
+        print(f"  kanjize (map_elements) : {t_python:.3f} s")
+        print(f"  ja.to_kanji (plugin)   : {t_native:.3f} s")
+        print(f"  speedup                : {t_python / t_native:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,10 @@
 from importlib.metadata import version
 
-from . import common  # noqa: F401
+from . import calendar, common  # noqa: F401
 from .japanera_util import JapaneraExpr
-from .jpholiday_util import JpholidayExpr
+from .jpholiday_util import JpholidayExpr, business_date_range
 from .kanjize_util import KanjizeExpr
-from .normalize_util import NormalizeExpr
+from .normalize_util import NormalizeExpr, register_normalize_profile
 from .prefecture import PrefectureExpr
 
 __version__ = version(__name__)
@@ -15,4 +15,6 @@ __all__ = [
     "JpholidayExpr",
     "NormalizeExpr",
     "PrefectureExpr",
+    "business_date_range",
+    "register_normalize_profile",
 ]
@@ -0,0 +1,85 @@
+from typing import Optional
+
+import polars as pl
+from polars._typing import PolarsDataType
+
+from polars_japanese.plugin import format_amount, parse_amount
+
+# Decimal の小数点以下の桁数の上限 (プラグインの固定小数点の桁数)
+_MAX_DECIMAL_SCALE = 18
+# format_amount の表記
+_AMOUNT_STYLES = ("mixed", "daiji", "comma")
+
+
+class AmountExpr:
+    def __init__(self, expr: pl.Expr):
+        self._expr = expr
+
+    def parse_amount(self, dtype: PolarsDataType = pl.Int64) -> pl.Expr:
+        """
+        金額の文字列を数値に変換します。
+
+        "1,234円", "１２万円", "1.2億", "1億2,345万円", "¥1,234" のような
+        全角数字・桁区切りのカンマ・万/億/兆 の単位・円記号・"円" を含む金額と、
+        "△1,234", "▲500" のように三角の記号で負の数を表す会計の表記を
+        プラグインで1回の走査で解析します。
+        解析できない値と、出力の型の範囲を超える値は null になります。
+
+        Args:
+            dtype (PolarsDataType, optional): 出力の型。`pl.Int64` または
+                `pl.Decimal(scale=...)` を指定します。小数は 0 方向に
+                切り捨てます。デフォルトは `pl.Int64`。
+
+        Returns:
+            pl.Expr: 金額を数値に変換したエクスプレッション。
+
+        Raises:
+            ValueError: dtype が Int64 または Decimal でない場合、
+                Decimal の小数点以下の桁数が 18 を超える場合。
+        """
+        return parse_amount(self._expr, kwargs={"scale": _decimal_scale(dtype)})
+
+    def format_amount(self, style: str = "mixed", suffix: str = "円") -> pl.Expr:
+        """
+        数値を金額の表記に変換します。
+
+        表記:
+            - "mixed": 万・億・兆 の単位とカンマ ("1億2,345万6,789円")
+            - "daiji": 大字 ("壱億弐阡参佰肆拾伍萬陸阡漆佰捌拾玖円")。
+              証書などの書き方に合わせて "壱拾", "壱阡" のように 1 も省略しません。
+            - "comma": 3桁ごとのカンマ区切り ("123,456,789円")
+
+        整数型と Decimal 型の列に対応し、Decimal 型の小数点以下の桁は
+        "mixed", "comma" ではそのまま残し、"daiji" では切り捨てます。
+        浮動小数点数は 0 方向に切り捨てた整数として扱います。
+
+        Args:
+            style (str, optional): 表記。デフォルトは "mixed"。
+            suffix (str, optional): 金額の後に付ける文字列。デフォルトは "円"。
+
+        Returns:
+            pl.Expr: 金額の表記の文字列のエクスプレッション。
+
+        Raises:
+            ValueError: 未対応の表記が指定された場合。
+        """
+        if style not in _AMOUNT_STYLES:
+            raise ValueError(
+                f"未対応の表記です: {style} (指定できる値: {', '.join(_AMOUNT_STYLES)})"
+            )
+        return format_amount(self._expr, kwargs={"style": style, "suffix": suffix})
+
+
+def _decimal_scale(dtype: PolarsDataType) -> Optional[int]:
+    """出力の型から Decimal の小数点以下の桁数を求める (Int64 の場合は None)"""
+    if dtype == pl.Int64:
+        return None
+    if not dtype.is_decimal():
+        raise ValueError(f"出力の型は Int64 または Decimal を指定してください: {dtype}")
+    scale = dtype.scale if isinstance(dtype, pl.Decimal) else 0
+    if scale > _MAX_DECIMAL_SCALE:
+        raise ValueError(
+            f"Decimal の小数点以下の桁数は {_MAX_DECIMAL_SCALE} 以下にしてください: "
+            f"{scale}"
+        )
+    return scale
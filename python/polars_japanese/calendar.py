@@ -0,0 +1,382 @@
+import datetime as dt
+import functools
+import io
+import pathlib
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Callable, Optional, Union
+
+import jpholiday
+import polars as pl
+from jpholiday import OriginalHolidayCheckerInterface
+from jpholiday.checker.checker import NationalHolidayChecker, TransferHolidayChecker
+from jpholiday.checker.interface import HolidayCheckerInterface
+
+# 祝日の表の範囲 (祝日法の施行年から)
+# 範囲外の日付は jpholiday で1日ずつ判定します
+_CALENDAR_START = dt.date(1948, 1, 1)
+_CALENDAR_END = dt.date(2099, 12, 31)
+_CALENDAR_START_DAYS = (_CALENDAR_START - dt.date(1970, 1, 1)).days
+_CALENDAR_LENGTH = (_CALENDAR_END - _CALENDAR_START).days + 1
+
+# 振替休日が施行された年
+_TRANSFER_HOLIDAY_START_YEAR = 1973
+
+# 五十日 (月末を除く)
+_GOTOBI_DAYS = [5, 10, 15, 20, 25]
+
+# 名前を指定せずに追加した休日の名前
+_DEFAULT_HOLIDAY_NAME = "休日"
+
+# CSV のエンコーディングを指定しない場合に試すエンコーディング
+# (内閣府の syukujitsu.csv は Shift_JIS)
+_CSV_ENCODINGS = ("utf-8-sig", "cp932")
+
+# 日付として扱う CSV の書式
+_CSV_DATE_FORMATS = ("%Y/%m/%d", "%Y-%m-%d", "%Y%m%d")
+
+HolidaySpec = Union[Iterable[Union[dt.date, str]], Mapping[Union[dt.date, str], str]]
+
+
+def _holiday_name(
+    checkers: Sequence[HolidayCheckerInterface], date: dt.date
+) -> Optional[str]:
+    for checker in checkers:
+        if checker.is_holiday(date):
+            return checker.holiday_name(date)
+    return None
+
+
+def _jpholiday_names() -> pl.Series:
+    """
+    祝日の表の範囲の日付ごとの祝日名 (祝日でない日は null) を返します。
+
+    jpholiday の振替休日・国民の休日の判定は前後の日の祝日を毎回判定し直すため、
+    その他の祝日を1日ずつ判定した結果から、jpholiday と同じ規則で求めます。
+    結果は `jpholiday.is_holiday_name` と一致します。
+    """
+    checkers = jpholiday.new_api.registry.checkers()
+    base_checkers = [
+        checker
+        for checker in checkers
+        if not isinstance(
+            checker,
+            (
+                TransferHolidayChecker,
+                NationalHolidayChecker,
+                OriginalHolidayCheckerInterface,
+            ),
+        )
+    ]
+    original_checkers = [
+        checker
+        for checker in checkers
+        if isinstance(checker, OriginalHolidayCheckerInterface)
+    ]
+
+    # 国民の休日の判定のため、前後1日を含めて判定する
+    dates = [
+        _CALENDAR_START + dt.timedelta(days=i) for i in range(-1, _CALENDAR_LENGTH + 1)
+    ]
+    base = [_holiday_name(base_checkers, date) for date in dates]
+
+    # 振替休日: 日曜日から続く祝日の翌日 (日曜日・祝日を除く)
+    transfer: list[Optional[str]] = [None] * len(dates)
+    for i, date in enumerate(dates):
+        if (
+            date.year < _TRANSFER_HOLIDAY_START_YEAR
+            or date.isoweekday() == 7
+            or base[i] is not None
+        ):
+            continue
+        j = i - 1
+        while j >= 0 and base[j] is not None:
+            if dates[j].isoweekday() == 7:
+                transfer[i] = f"{base[j]} 振替休日"
+                break
+            j -= 1
+
+    names: list[Optional[str]] = []
+    for i in range(1, len(dates) - 1):
+        date = dates[i]
+        name = base[i] or transfer[i]
+        # 国民の休日: 前後の日が祝日の日 (日曜日・祝日を除く)
+        if (
+            name is None
+            and date.isoweekday() != 7
+            and (base[i - 1] or transfer[i - 1])
+            and (base[i + 1] or transfer[i + 1])
+        ):
+            name = "国民の休日"
+        if name is None and original_checkers:
+            name = _holiday_name(original_checkers, date)
+        names.append(name)
+
+    return pl.Series(names, dtype=pl.String)
+
+
+@functools.cache
+def _calendar_dates() -> pl.Series:
+    """祝日の表の範囲の日付"""
+    return pl.date_range(_CALENDAR_START, _CALENDAR_END, eager=True)
+
+
+class _Calendar:
+    """
+    祝日の表の範囲の日付ごとの祝日名と営業日の表
+
+    表は初回の利用時に作成し、以降はキャッシュした表を参照します。
+    Boolean の表は polars の内部でビット単位に詰めて保持されます。
+    """
+
+    def __init__(
+        self,
+        build_names: Callable[[], pl.Series],
+        workdays: Optional[pl.Series] = None,
+        use_jpholiday_outside: bool = False,
+    ):
+        self._build_names = build_names
+        # 土日祝日でも営業日とする日
+        self.workdays = (
+            workdays
+            if workdays is not None
+            else pl.repeat(False, _CALENDAR_LENGTH, eager=True)
+        )
+        # 表の範囲外の日付を jpholiday で判定するかどうか
+        self.use_jpholiday_outside = use_jpholiday_outside
+
+    @functools.cached_property
+    def holiday_names(self) -> pl.Series:
+        """日付ごとの祝日名 (祝日でない日は null)"""
+        return self._build_names()
+
+    @functools.cached_property
+    def holiday_flags(self) -> pl.Series:
+        """日付ごとの祝日かどうか"""
+        return self.holiday_names.is_not_null()
+
+    @functools.cached_property
+    def holiday_name_enum(self) -> pl.Enum:
+        """祝日名の Enum 型 (祝日の表に現れる順)"""
+        return pl.Enum(self.holiday_names.drop_nulls().unique(maintain_order=True))
+
+    @functools.cached_property
+    def holiday_name_table(self) -> pl.Series:
+        """日付ごとの祝日名 (Enum 型)"""
+        return self.holiday_names.cast(self.holiday_name_enum)
+
+    @functools.cached_property
+    def business_day_flags(self) -> pl.Series:
+        """日付ごとの営業日かどうか"""
+        weekend = _calendar_dates().dt.weekday() >= 6
+        return ~(self.holiday_flags | weekend) | self.workdays
+
+    @functools.cached_property
+    def business_day_counts(self) -> pl.Series:
+        """日付ごとの、表の先頭からその日までの営業日の数"""
+        return self.business_day_flags.cast(pl.Int32).cum_sum()
+
+    @functools.cached_property
+    def business_day_prefix_counts(self) -> pl.Series:
+        """表の位置ごとの、その位置より前の営業日の数 (長さは表の長さ + 1)"""
+        return pl.concat([pl.Series([0], dtype=pl.Int32), self.business_day_counts])
+
+    @functools.cached_property
+    def business_day_offsets(self) -> pl.Series:
+        """営業日の表の先頭からの位置 (昇順)"""
+        return self.business_day_flags.arg_true().cast(pl.Int32)
+
+    @functools.cached_property
+    def next_business_day_offsets(self) -> pl.Series:
+        """日付ごとの、その日以降で最初の営業日の表の先頭からの位置"""
+        return self._business_day_positions().fill_null(strategy="backward")
+
+    @functools.cached_property
+    def previous_business_day_offsets(self) -> pl.Series:
+        """日付ごとの、その日以前で最後の営業日の表の先頭からの位置"""
+        return self._business_day_positions().fill_null(strategy="forward")
+
+    @functools.cached_property
+    def gotobi_flags(self) -> pl.Series:
+        """
+        日付ごとの五十日かどうか
+
+        5, 10, 15, 20, 25日と月末日が営業日でない場合は前営業日を五十日とします。
+        """
+        dates = _calendar_dates()
+        nominal = dates.dt.day().is_in(_GOTOBI_DAYS) | (dates == dates.dt.month_end())
+        indices = self.previous_business_day_offsets.filter(nominal)
+        # 同じ前営業日を指す日付があるため、重複を除いてから書き込む
+        flags = pl.repeat(False, _CALENDAR_LENGTH, eager=True)
+        return flags.scatter(indices.drop_nulls().unique(), True)
+
+    def _business_day_positions(self) -> pl.Series:
+        """営業日は表の先頭からの位置、営業日でない日は null"""
+        return pl.select(
+            pl.when(self.business_day_flags).then(
+                pl.int_range(_CALENDAR_LENGTH, dtype=pl.Int32)
+            )
+        ).to_series()
+
+
+# 登録済みのカレンダー (カレンダー名 -> カレンダー)
+_CALENDARS: dict[str, _Calendar] = {
+    "jpholiday": _Calendar(_jpholiday_names, use_jpholiday_outside=True),
+}
+
+
+def register(
+    name: str,
+    *,
+    base: str = "jpholiday",
+    extra_holidays: Optional[HolidaySpec] = None,
+    extra_workdays: Optional[Iterable[Union[dt.date, str]]] = None,
+    from_csv: Optional[Union[str, pathlib.Path]] = None,
+    encoding: Optional[str] = None,
+) -> None:
+    """
+    独自の休日・営業日を持つカレンダーを登録します。
+
+    登録したカレンダーは `ja.is_holiday(calendar=name)` のように、
+    祝日・営業日を扱うエクスプレッションの `calendar` 引数で利用できます。
+    カレンダーは登録時に1度だけ祝日の表 (1948年〜2099年) に変換され、
+    エクスプレッションの評価では表を参照するだけで判定します。
+
+    休日・営業日は "2024-12-29" のような日付のほか、"12-29" のような
+    月日で指定でき、月日の場合は毎年の休日・営業日になります。
+    営業日は土日祝日でない日と extra_workdays で指定した日です。
+
+    Args:
+        name (str): カレンダー名。
+        base (str, optional): 元にするカレンダー名。デフォルトは "jpholiday"
+            (jpholiday の祝日)。
+        extra_holidays (Optional[HolidaySpec], optional): 追加する休日。
+            日付 (または月日) のリスト、または日付から休日名への辞書。
+            リストで指定した休日の名前は "休日" になります。
+        extra_workdays (Optional[Iterable[Union[dt.date, str]]], optional):
+            土日祝日でも営業日とする日付 (または月日)。
+        from_csv (Optional[Union[str, pathlib.Path]], optional):
+            祝日の一覧の CSV ファイル。指定した場合は base の祝日の代わりに
+            CSV の祝日を使います。内閣府の `syukujitsu.csv` と同じく、
+            ヘッダー行と、1列目に日付 ("1955/1/1" など)、2列目に祝日名
+            (省略可) を持つ形式を読み込めます。
+        encoding (Optional[str], optional): CSV ファイルのエンコーディング。
+            None の場合は UTF-8、Shift_JIS (cp932) の順に試します。
+
+    Raises:
+        ValueError: base が未登録の場合、日付が表の範囲外の場合、
+            または CSV の日付を解析できない場合。
+
+    Note:
+        "jpholiday" 以外のカレンダーでは、祝日の表の範囲外の日付は null になります。
+
+    Examples:
+        >>> import polars_japanese
+        >>> polars_japanese.calendar.register(
+        ...     "acme",
+        ...     extra_holidays=["12-29", "12-30", "12-31", "01-02", "01-03"],
+        ...     extra_workdays=["2024-11-16"],
+        ... )
+        >>> # pl.col("date").ja.is_business_day(calendar="acme")
+    """
+    base_calendar = _get_calendar(base)
+
+    if from_csv is not None:
+        csv_names = _read_holiday_csv(from_csv, encoding)
+        # 表の範囲内の祝日を、日付の表の先頭からの位置に書き込む
+        offsets = csv_names["date"].cast(pl.Int32) - _CALENDAR_START_DAYS
+        in_range = offsets.is_between(0, _CALENDAR_LENGTH - 1)
+        names = pl.repeat(None, _CALENDAR_LENGTH, dtype=pl.String, eager=True)
+        names = names.scatter(
+            offsets.filter(in_range), csv_names["name"].filter(in_range)
+        )
+    else:
+        names = base_calendar.holiday_names.clone()
+
+    # 追加した休日は、base で営業日としていた日でも営業日にしない
+    workdays = base_calendar.workdays.clone()
+    if isinstance(extra_holidays, Mapping):
+        for day, holiday_name in extra_holidays.items():
+            indices = _spec_indices(day)
+            names = names.scatter(indices, holiday_name)
+            workdays = workdays.scatter(indices, False)
+    else:
+        for day in extra_holidays or []:
+            indices = _spec_indices(day)
+            names = names.scatter(
+                indices,
+                names.gather(indices).fill_null(_DEFAULT_HOLIDAY_NAME),
+            )
+            workdays = workdays.scatter(indices, False)
+
+    for day in extra_workdays or []:
+        workdays = workdays.scatter(_spec_indices(day), True)
+
+    _CALENDARS[name] = _Calendar(lambda: names, workdays)
+
+
+def _get_calendar(calendar: str) -> _Calendar:
+    try:
+        return _CALENDARS[calendar]
+    except KeyError:
+        raise ValueError(f"未登録のカレンダーです: {calendar}")
+
+
+def _spec_indices(day: Union[dt.date, str]) -> pl.Series:
+    """日付または月日 ("MM-DD") に当たる祝日の表の位置"""
+    if isinstance(day, str) and len(day) == 5:
+        month, _, day_of_month = day.partition("-")
+        dates = _calendar_dates()
+        return (
+            (dates.dt.month() == int(month)) & (dates.dt.day() == int(day_of_month))
+        ).arg_true()
+
+    if isinstance(day, str):
+        day = dt.date.fromisoformat(day)
+    elif isinstance(day, dt.datetime):
+        day = day.date()
+    if not _CALENDAR_START <= day <= _CALENDAR_END:
+        raise ValueError(
+            f"日付は {_CALENDAR_START} から {_CALENDAR_END} の範囲で指定してください:"
+            f" {day}"
+        )
+    return pl.Series([(day - _CALENDAR_START).days], dtype=pl.UInt32)
+
+
+def _read_holiday_csv(
+    path: Union[str, pathlib.Path], encoding: Optional[str]
+) -> pl.DataFrame:
+    """祝日の一覧の CSV を日付 (date) と祝日名 (name) の DataFrame に読み込みます。"""
+    data = pathlib.Path(path).read_bytes()
+    for candidate in [encoding] if encoding else _CSV_ENCODINGS:
+        try:
+            text = data.decode(candidate)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        raise ValueError(f"CSV ファイルを読み込めません: {path}")
+
+    df = pl.read_csv(io.StringIO(text), infer_schema_length=0)
+    column = df.to_series(0).str.strip_chars()
+    dates = pl.select(
+        pl.coalesce(
+            column.str.to_date(date_format, strict=False)
+            for date_format in _CSV_DATE_FORMATS
+        )
+    ).to_series()
+    invalid = dates.is_null() & column.is_not_null()
+    if invalid.any():
+        raise ValueError(f"日付を解析できません: {column.filter(invalid)[0]!r}")
+
+    if df.width >= 2:
+        holiday_names = (
+            df.to_series(1).str.strip_chars().fill_null(_DEFAULT_HOLIDAY_NAME)
+        )
+    else:
+        holiday_names = pl.repeat(_DEFAULT_HOLIDAY_NAME, df.height, eager=True)
+
+    return (
+        pl.DataFrame({"date": dates, "name": holiday_names})
+        .drop_nulls("date")
+        .unique("date", keep="first", maintain_order=True)
+    )
@@ -1,17 +1,25 @@
 import pathlib
+from collections.abc import Sequence
 from typing import Any, Optional, Union
 
 import kanjize
 import polars as pl
+from polars._typing import IntoExpr, PolarsDataType
 from polars.api import register_dataframe_namespace, register_expr_namespace
 
-from polars_japanese.plugin import to_full_width, to_half_width
+from polars_japanese.plugin import (
+    to_full_width,
+    to_half_width,
+    to_hiragana,
+    to_katakana,
+)
 
+from .amount_util import AmountExpr
 from .datetime_util import DatetimeUtilityExpr
 from .japanera_util import JapaneraExpr
 from .jpholiday_util import JpholidayExpr
 from .kanjize_util import KanjizeExpr
-from .normalize_util import NormalizeExpr
+from .normalize_util import NormalizeExpr, PipelineStep
 
 
 @register_expr_namespace("ja")
@@ -19,27 +27,108 @@ class JapaneseExpr:
     def __init__(self, expr: pl.Expr):
         self._expr = expr
 
-    def to_half_width(self) -> pl.Expr:
+    def to_half_width(
+        self,
+        ascii: bool = True,
+        digit: bool = True,
+        kana: bool = True,
+        ignore: str = "",
+    ) -> pl.Expr:
         """
         エクスプレッションの文字列に含まれる全角文字を半角に変換します。
         カタカナ、ASCII、数字に適用されます。
+        Categorical/Enum の場合はカテゴリの辞書に対してのみ変換を行い、
+        Categorical を返します。
+
+        Args:
+            ascii (bool, optional): 英字・記号・スペースを変換するかどうか。
+                デフォルトは True。
+            digit (bool, optional): 数字を変換するかどうか。デフォルトは True。
+            kana (bool, optional): カタカナ・句読点などの記号を変換するかどうか。
+                デフォルトは True。
+            ignore (str, optional): 変換せずにそのまま残す文字
+                (例: 全角スペースを残す場合は "　")。デフォルトは ""。
 
         Returns:
             pl.Expr: 半角に変換された文字列を含むエクスプレッション。
+
+        Examples:
+            >>> # カタカナのみを半角に変換
+            >>> # pl.col("name").ja.to_half_width(ascii=False, digit=False)
         """
-        return to_half_width(self._expr)
+        return to_half_width(
+            self._expr,
+            {"ascii": ascii, "digit": digit, "kana": kana, "ignore": ignore},
+        )
 
-    def to_full_width(self) -> pl.Expr:
+    def to_full_width(
+        self,
+        ascii: bool = True,
+        digit: bool = True,
+        kana: bool = True,
+        ignore: str = "",
+    ) -> pl.Expr:
         """
         エクスプレッションの文字列に含まれる半角文字を全角に変換します。
         カタカナ、ASCII、数字に適用されます。
+        半角カタカナに続く濁点・半濁点は1文字に結合されます。
+        Categorical/Enum の場合はカテゴリの辞書に対してのみ変換を行い、
+        Categorical を返します。
+
+        Args:
+            ascii (bool, optional): 英字・記号・スペースを変換するかどうか。
+                デフォルトは True。
+            digit (bool, optional): 数字を変換するかどうか。デフォルトは True。
+            kana (bool, optional): カタカナ・句読点などの記号を変換するかどうか。
+                デフォルトは True。
+            ignore (str, optional): 変換せずにそのまま残す文字。デフォルトは ""。
 
         Returns:
             pl.Expr: 全角に変換された文字列を含むエクスプレッション。
         """
-        return to_full_width(self._expr)
+        return to_full_width(
+            self._expr,
+            {"ascii": ascii, "digit": digit, "kana": kana, "ignore": ignore},
+        )
 
-    def normalize(self) -> pl.Expr:
+    def to_katakana(self, ignore: str = "") -> pl.Expr:
+        """
+        エクスプレッションの文字列に含まれるひらがなをカタカナに変換します。
+
+        'ゔ', 'ゕ', 'ゖ' や踊り字 'ゝ', 'ゞ' も対応するカタカナに変換され、
+        'わ', 'ゐ', 'ゑ', 'を' と結合文字の濁点は 'ヷ', 'ヸ', 'ヹ', 'ヺ' になります。
+        Categorical/Enum の場合はカテゴリの辞書に対してのみ変換を行い、
+        Categorical を返します。
+
+        Args:
+            ignore (str, optional): 変換せずにそのまま残す文字。デフォルトは ""。
+
+        Returns:
+            pl.Expr: カタカナに変換された文字列を含むエクスプレッション。
+        """
+        return to_katakana(self._expr, {"ignore": ignore})
+
+    def to_hiragana(self, ignore: str = "") -> pl.Expr:
+        """
+        エクスプレッションの文字列に含まれるカタカナをひらがなに変換します。
+
+        'ヴ', 'ヵ', 'ヶ' や踊り字 'ヽ', 'ヾ' も対応するひらがなに変換され、
+        'ヷ', 'ヸ', 'ヹ', 'ヺ' はひらがなと結合文字の濁点になります。
+        半角カタカナは変換されないため、必要に応じて先に `to_full_width` を
+        適用してください。
+        Categorical/Enum の場合はカテゴリの辞書に対してのみ変換を行い、
+        Categorical を返します。
+
+        Args:
+            ignore (str, optional): 変換せずにそのまま残す文字
+                (例: 「霞ヶ関」の'ヶ'を残す場合は "ヶ")。デフォルトは ""。
+
+        Returns:
+            pl.Expr: ひらがなに変換された文字列を含むエクスプレッション。
+        """
+        return to_hiragana(self._expr, {"ignore": ignore})
+
+    def normalize(self, profile: str = "default") -> pl.Expr:
         """
         式内の日本語テキストを正規化します。
 
@@ -51,13 +140,81 @@ class JapaneseExpr:
         - 疑問符を半角'?'に統一
         - スペースを半角スペース' 'に統一
 
+        Categorical/Enum の場合はカテゴリの辞書に対してのみ正規化を行い、
+        Categorical を返します。
+
         正規化ルールは以下を参考にしています：
         https://github.com/ikegami-yukino/jaconv
 
+        Args:
+            profile (str, optional): 使用する正規化プロファイル名。
+                `polars_japanese.register_normalize_profile` で登録した
+                プロファイルを指定できます。デフォルトは "default"。
+
         Returns:
             pl.Expr: 正規化された文字列を表す式
+
+        Raises:
+            ValueError: 未登録のプロファイルが指定された場合。
+        """
+        return NormalizeExpr(self._expr).normalize(profile=profile)
+
+    def is_normalized(self, profile: str = "default") -> pl.Expr:
+        """
+        文字列が正規化済み (`normalize` で変化しない) かどうかを判定します。
+
+        Args:
+            profile (str, optional): 使用する正規化プロファイル名。
+                デフォルトは "default"。
+
+        Returns:
+            pl.Expr: 正規化済みの場合は True、そうでない場合は False を含む
+                Boolean エクスプレッション。
+
+        Raises:
+            ValueError: 未登録のプロファイルが指定された場合。
         """
-        return NormalizeExpr(self._expr).normalize()
+        return NormalizeExpr(self._expr).is_normalized(profile=profile)
+
+    def pipeline(self, steps: Sequence[PipelineStep]) -> pl.Expr:
+        """
+        複数の文字列変換をまとめて1回の走査で適用します。
+
+        `ja.normalize().ja.to_half_width().str.to_uppercase()` のように
+        式を連結すると変換ごとに中間結果の列が作られますが、
+        パイプラインでは各行に全てのステップを続けて適用し、
+        結果の列だけを作ります。
+
+        利用できるステップ (括弧内はオプション):
+            - "normalize" (profile): `ja.normalize` と同じ正規化
+            - "half_width" (ascii, digit, kana, ignore): `ja.to_half_width` と同じ変換
+            - "full_width" (ascii, digit, kana, ignore): `ja.to_full_width` と同じ変換
+            - "katakana" (ignore): `ja.to_katakana` と同じ変換
+            - "hiragana" (ignore): `ja.to_hiragana` と同じ変換
+            - "upper": 大文字に変換
+            - "lower": 小文字に変換
+            - "strip": 前後の空白を削除
+
+        Categorical/Enum の場合はカテゴリの辞書に対してのみ変換を行い、
+        Categorical を返します。
+
+        Args:
+            steps (Sequence[PipelineStep]): 適用するステップ。
+                ステップ名、または (ステップ名, オプション) のタプルで指定します。
+
+        Returns:
+            pl.Expr: 変換された文字列を含むエクスプレッション。
+
+        Raises:
+            ValueError: 未対応のステップまたはオプション、
+                未登録のプロファイルが指定された場合。
+
+        Examples:
+            >>> expr = pl.col("name").ja.pipeline(
+            ...     ["normalize", ("half_width", {"ascii": False}), "upper"]
+            ... )
+        """
+        return NormalizeExpr(self._expr).pipeline(steps)
 
     def to_datetime(
         self, format: str = "%-K%-y年%m月%d日", raise_error: bool = True
@@ -80,6 +237,23 @@ class JapaneseExpr:
             format=format, raise_error=raise_error
         )
 
+    def parse_wareki(self, return_pattern: bool = False) -> pl.Expr:
+        """
+        エクスプレッションの和暦文字列をフォーマットを指定せずに日付に変換します。
+
+        "R5.1.1", "H31/4/30", "令和5年1月1日", "平成元年", "令和五年十二月一日" や
+        全角の表記をまとめて解析します。解析できない文字列は null になります。
+
+        Args:
+            return_pattern (bool, optional):
+                一致したパターン ("alphabet", "kanji", "kanji_numeral") も
+                `{date, pattern}` の構造体で返すかどうか。
+
+        Returns:
+            pl.Expr: Date 型 (または Struct 型) に変換されたエクスプレッション。
+        """
+        return JapaneraExpr(self._expr).parse_wareki(return_pattern=return_pattern)
+
     def to_wareki(
         self,
         format: str = "%-K%-Y年%m月%d日",
@@ -91,7 +265,8 @@ class JapaneseExpr:
         Args:
             format (str, optional): 出力する和暦のフォーマット文字列。
             raise_error (bool, optional):
-                変換エラー時に例外を発生させるかどうか。
+                和暦に変換できない日付 (0001-01-01〜9999-12-30 の範囲外) で
+                例外を発生させるかどうか。False の場合は null になります。
 
         Returns:
             pl.Expr: 和暦文字列に変換されたエクスプレッション。
@@ -103,6 +278,35 @@ class JapaneseExpr:
             format=format, raise_error=raise_error
         )
 
+    def era(self) -> pl.Expr:
+        """
+        エクスプレッションのDateまたはDatetimeから元号名を求めます。
+
+        Returns:
+            pl.Expr: 元号名 (漢字) の Enum 型のエクスプレッション。
+                カテゴリは元号の開始日の順に並びます。
+        """
+        return JapaneraExpr(self._expr).era()
+
+    def era_year(self) -> pl.Expr:
+        """
+        エクスプレッションのDateまたはDatetimeから元号の年を求めます。
+
+        Returns:
+            pl.Expr: 元号の年 (令和2年なら 2) の Int32 型のエクスプレッション。
+        """
+        return JapaneraExpr(self._expr).era_year()
+
+    def to_wareki_struct(self) -> pl.Expr:
+        """
+        エクスプレッションのDateまたはDatetimeを元号・年・月・日の構造体に変換します。
+
+        Returns:
+            pl.Expr: `era`, `year`, `month`, `day` のフィールドを持つ
+                Struct 型のエクスプレッション。
+        """
+        return JapaneraExpr(self._expr).to_wareki_struct()
+
     def to_kanji(
         self, config: Optional[kanjize.KanjizeConfiguration] = None
     ) -> pl.Expr:
@@ -121,43 +325,246 @@ class JapaneseExpr:
         """
         return KanjizeExpr(self._expr).to_kanji(config=config)
 
-    def to_number(self) -> pl.Expr:
+    def to_number(self, return_error: bool = False) -> pl.Expr:
         """
         エクスプレッションの漢数字を数値に変換します。
 
+        "1万2千", "一二三四", "壱萬弐阡" のような混在した表記や大字にも
+        対応し、解析できない値は null になります。
+
+        Args:
+            return_error (bool, optional): True の場合は、変換した値と
+                解析できなかった理由の `{value, error}` の構造体を返します。
+                デフォルトは False。
+
         Returns:
             pl.Expr: 数値に変換されたエクスプレッション (Int64)。
+                `return_error=True` の場合は Struct 型のエクスプレッション。
 
         References:
             <https://github.com/nagataaaas/kanjize>
         """
-        return KanjizeExpr(self._expr).to_number()
+        return KanjizeExpr(self._expr).to_number(return_error)
 
-    def is_holiday(self) -> pl.Expr:
+    def extract_numbers(self) -> pl.Expr:
+        """
+        エクスプレッションの文字列の中の数 (漢数字・アラビア数字・全角数字)
+        を取り出します。
+
+        "三丁目十二番地" -> [3, 12] のように、`to_number` と同じ文法で
+        解析できる部分を順に取り出します。
+
+        Returns:
+            pl.Expr: 取り出した数のリストのエクスプレッション (List(Int64))。
+        """
+        return KanjizeExpr(self._expr).extract_numbers()
+
+    def replace_kanji_numerals(self) -> pl.Expr:
+        """
+        エクスプレッションの文字列の中の漢数字・全角数字を含む数を
+        半角のアラビア数字に置き換えます。
+
+        "三丁目十二番地" -> "3丁目12番地" のように置き換えます。
+
+        Returns:
+            pl.Expr: 数を置き換えた文字列のエクスプレッション。
+        """
+        return KanjizeExpr(self._expr).replace_kanji_numerals()
+
+    def parse_amount(self, dtype: PolarsDataType = pl.Int64) -> pl.Expr:
+        """
+        エクスプレッションの金額の文字列を数値に変換します。
+
+        "1,234円", "１２万円", "1.2億", "△1,234" (負の数) のような金額を
+        解析し、解析できない値は null になります。
+
+        Args:
+            dtype (PolarsDataType, optional): 出力の型。`pl.Int64` または
+                `pl.Decimal(scale=...)`。デフォルトは `pl.Int64`。
+
+        Returns:
+            pl.Expr: 金額を数値に変換したエクスプレッション。
+        """
+        return AmountExpr(self._expr).parse_amount(dtype)
+
+    def format_amount(self, style: str = "mixed", suffix: str = "円") -> pl.Expr:
+        """
+        エクスプレッションの数値を金額の表記に変換します。
+
+        Args:
+            style (str, optional): 表記。"mixed" ("1億2,345万6,789円"),
+                "daiji" ("壱億弐阡参佰肆拾伍萬陸阡漆佰捌拾玖円"),
+                "comma" ("123,456,789円") のいずれか。デフォルトは "mixed"。
+            suffix (str, optional): 金額の後に付ける文字列。デフォルトは "円"。
+
+        Returns:
+            pl.Expr: 金額の表記の文字列のエクスプレッション。
+        """
+        return AmountExpr(self._expr).format_amount(style, suffix)
+
+    def is_holiday(self, calendar: str = "jpholiday") -> pl.Expr:
         """
         指定された日付が祝日かどうかを判定します。
 
+        Args:
+            calendar (str, optional): カレンダー名。
+                `polars_japanese.calendar.register` で登録したカレンダーを
+                指定できます。デフォルトは "jpholiday"。
+
         Returns:
             pl.Expr: 祝日の場合は True、そうでない場合は False を含む
                 Boolean エクスプレッション。
         """
-        return JpholidayExpr(self._expr).is_holiday()
+        return JpholidayExpr(self._expr).is_holiday(calendar)
 
-    def is_business_day(self) -> pl.Expr:
+    def is_business_day(self, calendar: str = "jpholiday") -> pl.Expr:
         """
         指定された日付が営業日かどうかを判定します。
-        (土日祝日でない場合に True)
+        (土日祝日でない場合、またはカレンダーで営業日とした日の場合に True)
+
+        Args:
+            calendar (str, optional): カレンダー名。
+                `polars_japanese.calendar.register` で登録したカレンダーを
+                指定できます。デフォルトは "jpholiday"。
 
         Returns:
             pl.Expr: 営業日の場合は True、そうでない場合は False を含む
                 Boolean エクスプレッション。
         """
-        return JpholidayExpr(self._expr).is_business_day()
+        return JpholidayExpr(self._expr).is_business_day(calendar)
+
+    def holiday_name(self, calendar: str = "jpholiday") -> pl.Expr:
+        """
+        指定された日付の祝日名を返します。
+
+        Args:
+            calendar (str, optional): カレンダー名。
+                `polars_japanese.calendar.register` で登録したカレンダーを
+                指定できます。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: 祝日名の Enum 型のエクスプレッション (祝日でない日は null)。
+        """
+        return JpholidayExpr(self._expr).holiday_name(calendar)
+
+    def add_business_days(self, n: IntoExpr, calendar: str = "jpholiday") -> pl.Expr:
+        """
+        指定された日付から n 営業日後 (n が負の場合は前) の日付を求めます。
+
+        Args:
+            n (IntoExpr): 営業日数。整数またはエクスプレッション
+                (文字列の場合は列名) を指定できます。
+            calendar (str, optional): カレンダー名。
+                `polars_japanese.calendar.register` で登録したカレンダーを
+                指定できます。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: Date 型のエクスプレッション。
+        """
+        return JpholidayExpr(self._expr).add_business_days(n, calendar)
+
+    def business_days_between(
+        self, other: IntoExpr, calendar: str = "jpholiday"
+    ) -> pl.Expr:
+        """
+        指定された日付から other までの営業日の数を求めます。
+
+        指定された日付を含み、other を含まない期間の営業日を数えます。
+
+        Args:
+            other (IntoExpr): 期間の終わりの日付。エクスプレッション
+                (文字列の場合は列名) または日付を指定できます。
+            calendar (str, optional): カレンダー名。
+                `polars_japanese.calendar.register` で登録したカレンダーを
+                指定できます。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: Int32 型のエクスプレッション。
+        """
+        return JpholidayExpr(self._expr).business_days_between(other, calendar)
+
+    def roll_business_day(
+        self, convention: str = "forward", calendar: str = "jpholiday"
+    ) -> pl.Expr:
+        """
+        営業日でない日付を前後の営業日に調整します。
+
+        Args:
+            convention (str, optional): 調整方法。"forward" (翌営業日),
+                "backward" (前営業日), "modified_following" (翌営業日。ただし
+                月をまたぐ場合は前営業日) のいずれか。デフォルトは "forward"。
+            calendar (str, optional): カレンダー名。
+                `polars_japanese.calendar.register` で登録したカレンダーを
+                指定できます。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: Date 型のエクスプレッション。
+        """
+        return JpholidayExpr(self._expr).roll_business_day(convention, calendar)
+
+    def month_end_business_day(self, calendar: str = "jpholiday") -> pl.Expr:
+        """
+        指定された日付の月の最終営業日 (月末最終営業日) を求めます。
+
+        Args:
+            calendar (str, optional): カレンダー名。
+                `polars_japanese.calendar.register` で登録したカレンダーを
+                指定できます。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: Date 型のエクスプレッション。
+        """
+        return JpholidayExpr(self._expr).month_end_business_day(calendar)
+
+    def business_day_of_month(self, calendar: str = "jpholiday") -> pl.Expr:
+        """
+        指定された日付がその月の何営業日目かを求めます。
+
+        Args:
+            calendar (str, optional): カレンダー名。
+                `polars_japanese.calendar.register` で登録したカレンダーを
+                指定できます。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: 1始まりの Int32 型のエクスプレッション (営業日でない日は null)。
+        """
+        return JpholidayExpr(self._expr).business_day_of_month(calendar)
+
+    def nth_business_day(self, n: IntoExpr, calendar: str = "jpholiday") -> pl.Expr:
+        """
+        指定された日付の月の第 n 営業日を求めます。
+
+        Args:
+            n (IntoExpr): 1始まりの営業日の番号。負の数の場合は月末から数えます。
+            calendar (str, optional): カレンダー名。
+                `polars_japanese.calendar.register` で登録したカレンダーを
+                指定できます。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: Date 型のエクスプレッション。
+        """
+        return JpholidayExpr(self._expr).nth_business_day(n, calendar)
+
+    def is_gotobi(self, calendar: str = "jpholiday") -> pl.Expr:
+        """
+        指定された日付が五十日 (5, 10, 15, 20, 25日と月末日。営業日でない場合は
+        前営業日) かどうかを判定します。
+
+        Args:
+            calendar (str, optional): カレンダー名。
+                `polars_japanese.calendar.register` で登録したカレンダーを
+                指定できます。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: Boolean 型のエクスプレッション。
+        """
+        return JpholidayExpr(self._expr).is_gotobi(calendar)
 
     def to_weekday_name(self, format: str = "%A") -> pl.Expr:
         """
-        Date型またはDatetime型のエクスプレッションを日本語の曜日文字列に変換します。
+        Date型またはDatetime型のエクスプレッションを日本語の曜日に変換します。
 
+        結果は月曜日から順の Enum 型です。
         入力データがNoneの場合はNoneを返します。
 
         Args:
@@ -166,7 +573,7 @@ class JapaneseExpr:
                 "%a": "月", "火", ...
 
         Returns:
-            pl.Expr: 日本語の曜日文字列を含むエクスプレッション。
+            pl.Expr: 日本語の曜日を含む Enum 型のエクスプレッション。
 
         Raises:
             ValueError: サポートされていないフォーマットが指定された場合。
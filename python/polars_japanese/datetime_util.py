@@ -1,24 +1,18 @@
 import polars as pl
 
-# 日本語の曜日マッピング
-_JAPANESE_WEEKDAYS_FULL = {
-    1: "月曜日",
-    2: "火曜日",
-    3: "水曜日",
-    4: "木曜日",
-    5: "金曜日",
-    6: "土曜日",
-    7: "日曜日",
-}
-_JAPANESE_WEEKDAYS_SHORT = {
-    1: "月",
-    2: "火",
-    3: "水",
-    4: "木",
-    5: "金",
-    6: "土",
-    7: "日",
-}
+from .japanera_util import _keep_name
+
+# 日本語の曜日 (月曜日から順) の Enum 型
+WEEKDAY_ENUM = pl.Enum(
+    ["月曜日", "火曜日", "水曜日", "木曜日", "金曜日", "土曜日", "日曜日"]
+)
+# 日本語の曜日の省略形の Enum 型
+WEEKDAY_SHORT_ENUM = pl.Enum(["月", "火", "水", "木", "金", "土", "日"])
+
+
+def _enum_literal(dtype: pl.Enum) -> pl.Expr:
+    """Enum 型のカテゴリを順に並べたリテラル (位置で参照して Enum の値を作る)"""
+    return pl.lit(pl.Series(dtype.categories, dtype=dtype))
 
 
 class DatetimeUtilityExpr:
@@ -27,8 +21,10 @@ class DatetimeUtilityExpr:
 
     def to_weekday_name(self, format: str = "%A") -> pl.Expr:
         """
-        Date型またはDatetime型のエクスプレッションを日本語の曜日文字列に変換します。
+        Date型またはDatetime型のエクスプレッションを日本語の曜日に変換します。
 
+        結果は月曜日から順の Enum 型 (`WEEKDAY_ENUM`, `WEEKDAY_SHORT_ENUM`) で、
+        曜日の番号から文字列を経由せずに作ります。
         入力データがNoneの場合はNoneを返します。
 
         Args:
@@ -37,24 +33,23 @@ class DatetimeUtilityExpr:
                 "%a": "月", "火", ...
 
         Returns:
-            pl.Expr: 日本語の曜日文字列を含むエクスプレッション。
+            pl.Expr: 日本語の曜日を含む Enum 型のエクスプレッション。
 
         Raises:
             ValueError: サポートされていないフォーマットが指定された場合。
         """
         if format == "%A":
-            mapping = _JAPANESE_WEEKDAYS_FULL
+            dtype = WEEKDAY_ENUM
         elif format == "%a":
-            mapping = _JAPANESE_WEEKDAYS_SHORT
+            dtype = WEEKDAY_SHORT_ENUM
         else:
             raise ValueError(
                 f"Unsupported format string: {format}. Supported formats: '%A', '%a'."
             )
 
-        return (
-            self._expr.dt.weekday()
-            .replace_strict(mapping, default=None)
-            .cast(pl.String)
+        # 曜日の番号 (月曜日が 1) の位置で Enum のカテゴリを参照する
+        return _keep_name(
+            _enum_literal(dtype).gather(self._expr.dt.weekday() - 1), self._expr
         )
 
     def to_jst(self, time_zone: str | None = None) -> pl.Expr:
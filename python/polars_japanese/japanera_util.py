@@ -1,8 +1,269 @@
 import datetime as dt
-from typing import Optional
+import functools
+import hashlib
+import json
+import re
+from typing import Any, Optional
 
 import polars as pl
-from japanera import EraDate
+from japanera import (
+    ERA_DATA_COMMON,
+    ERA_DATA_DAIKAKUJI,
+    ERA_DATA_GENERAL,
+    ERA_DATA_JIMYOUIN,
+    EraDate,
+)
+from kanjize import number2kanji
+
+from polars_japanese.plugin import parse_wareki, to_datetime
+
+_EPOCH = dt.date(1970, 1, 1)
+# 和暦に変換できる日付の範囲 (1970-01-01 からの日数)
+# japanera は元号の終了日を含まないため、dt.date.max は変換できない
+_MIN_DAYS = (dt.date.min - _EPOCH).days
+_MAX_DAYS = (dt.date.max - _EPOCH).days - 1
+
+# japanera が元号の年を1年ずらして数える期間 (天保・弘化・安政)
+_YEAR_OFFSET_SPLIT_YEARS = range(1831, 1862)
+
+_WEEKDAYS_KANJI = "月火水木金土日"
+
+# フォーマット文字列の字句 (japanera の指定子、その他の strftime の指定子、文字列)
+_FORMAT_TOKEN = re.compile(r"%-[KEehnNyYmda]|%.|%$|[^%]+", re.DOTALL)
+
+# japanera の指定子
+_JAPANERA_DIRECTIVE = re.compile(r"%-[KEehnNyYmda]")
+
+# strftime の指定子のうち、`dt.strftime` で japanera (C ライブラリの strftime) と
+# 同じ結果になるもの。その他の指定子を含むフォーマットは japanera で1行ずつ変換する
+_NATIVE_STRFTIME_DIRECTIVES = frozenset(
+    "%Y %m %d %y %H %M %S %I %p %A %a %B %b %h %j %e %u %w %%".split()
+)
+
+# ネイティブの和暦文字列パーサーが扱えない strptime の指定子
+# (週番号・通日・タイムゾーン・ロケール依存の日時表記)
+_UNSUPPORTED_PARSE_DIRECTIVES = frozenset(
+    ["%G", "%j", "%U", "%W", "%V", "%z", "%Z", "%c", "%x", "%X"]
+)
+
+
+@functools.cache
+def _era_table() -> pl.DataFrame:
+    """
+    元号の切り替わり日ごとの元号の情報を返します。
+
+    japanera の元号データの開始日・終了日で日付を区間に分け、各区間の先頭の日付を
+    `EraDate.from_date` で変換して元号と年の数え方を求めます。
+    区間内では元号と年の数え方が変わらないため、日付の元号は
+    区間の開始日 (1970-01-01 からの日数) の二分探索で求められます。
+
+    Returns:
+        pl.DataFrame: 区間の開始日の昇順に並んだ元号の表。
+            - start: 区間の開始日 (1970-01-01 からの日数)
+            - kanji, english, english_vowel_shortened, english_head: 元号名
+            - year_offset: 西暦の年から引くと元号の年になる値
+    """
+    eras = ERA_DATA_COMMON + ERA_DATA_GENERAL + ERA_DATA_DAIKAKUJI + ERA_DATA_JIMYOUIN
+    boundaries = {dt.date.min}
+    for era in eras:
+        boundaries.add(era.since)
+        if era.until is not None:
+            boundaries.add(era.until)
+    boundaries.update(dt.date(year, 1, 1) for year in _YEAR_OFFSET_SPLIT_YEARS)
+
+    rows: list[tuple[int, str, str, str, str, int]] = []
+    for start in sorted(boundaries):
+        era_date = EraDate.from_date(start)
+        era = era_date.era
+        row = (
+            (start - _EPOCH).days,
+            era.kanji,
+            era.english,
+            era.english_vowel_shortened,
+            era.english_head,
+            start.year - int(era_date.strftime("%-Y")),
+        )
+        # 直前の区間と同じ元号・年の数え方の場合はまとめる
+        if rows and rows[-1][1:] == row[1:]:
+            continue
+        rows.append(row)
+
+    return pl.DataFrame(
+        rows,
+        schema={
+            "start": pl.Int32,
+            "kanji": pl.String,
+            "english": pl.String,
+            "english_vowel_shortened": pl.String,
+            "english_head": pl.String,
+            "year_offset": pl.Int32,
+        },
+        orient="row",
+    )
+
+
+@functools.cache
+def _era_enum() -> pl.Enum:
+    """元号名 (漢字) の Enum 型 (元号の開始日の順)"""
+    return pl.Enum(_era_table()["kanji"].unique(maintain_order=True))
+
+
+@functools.cache
+def _era_data() -> tuple[list[dict[str, Any]], str]:
+    """
+    和暦文字列のパーサーに渡す元号データと、そのハッシュ値を返します。
+
+    元号は japanera の `find_era_and_date` と同じく、開始日・種類の順に並べます。
+    開始日・終了日は 1970-01-01 からの日数です。
+    """
+    eras = sorted(
+        ERA_DATA_COMMON + ERA_DATA_GENERAL + ERA_DATA_DAIKAKUJI + ERA_DATA_JIMYOUIN,
+        key=lambda era: (era.since, era.era_type.value),
+    )
+    data = [
+        {
+            "kanji": era.kanji,
+            "english": era.english,
+            "english_vowel_shortened": era.english_vowel_shortened,
+            "english_head": era.english_head,
+            "since": (era.since - _EPOCH).days,
+            "until": None if era.until is None else (era.until - _EPOCH).days,
+        }
+        for era in eras
+    ]
+    digest = hashlib.sha1(json.dumps(data, ensure_ascii=False).encode()).hexdigest()
+    return data, digest
+
+
+@functools.cache
+def _kanji_numbers() -> pl.Series:
+    """0〜9999 の漢数字表記 (japanera と同じく kanjize で変換)"""
+    return pl.Series([number2kanji(i) for i in range(10000)], dtype=pl.String)
+
+
+class _EraLookup:
+    """
+    日付のエクスプレッションから元号の情報を引くためのヘルパー
+
+    日付を 1970-01-01 からの日数にして元号の表を二分探索し、
+    得られた位置で元号の表の各列を参照します。
+    """
+
+    def __init__(self, expr: pl.Expr):
+        self.table = _era_table()
+        self.date = expr.dt.date()
+        days = self.date.cast(pl.Int32)
+        # 範囲外・null の日付は位置も null にする
+        self.index = pl.when(days.is_between(_MIN_DAYS, _MAX_DAYS)).then(
+            pl.lit(self.table["start"]).search_sorted(days, side="right").cast(pl.Int64)
+            - 1
+        )
+
+    def column(self, name: str) -> pl.Expr:
+        return pl.lit(self.table[name]).gather(self.index)
+
+    def era(self) -> pl.Expr:
+        return pl.lit(self.table["kanji"].cast(_era_enum())).gather(self.index)
+
+    def relative_year(self) -> pl.Expr:
+        return self.date.dt.year() - self.column("year_offset")
+
+
+def _keep_name(result: pl.Expr, expr: pl.Expr) -> pl.Expr:
+    """
+    結果の列名を入力の列名にします。
+
+    元号の表の参照結果は表の列名になるため、入力の列名に付け替えます。
+    `name.keep` の後には `alias` を続けられないため、
+    列名が決まる場合は `alias` で付けます。
+    """
+    name = expr.meta.output_name(raise_if_undetermined=False)
+    return result.name.keep() if name is None else result.alias(name)
+
+
+def _check_wareki_range(s: pl.Series) -> pl.Series:
+    """和暦に変換できない日付 (null を除く) があれば ValueError を発生させます。"""
+    invalid = s.is_not_null() & ~s.cast(pl.Int32).is_between(_MIN_DAYS, _MAX_DAYS)
+    if invalid.any():
+        raise ValueError(
+            f"和暦に変換できない日付です: {s.filter(invalid).cast(pl.String)[0]}"
+        )
+    return s
+
+
+def _to_wareki_by_japanera(date: pl.Expr, format: str) -> pl.Expr:
+    """japanera で1行ずつ和暦文字列に変換します (範囲外の日付は null)。"""
+    days = date.cast(pl.Int32)
+    return (
+        pl.when(days.is_between(_MIN_DAYS, _MAX_DAYS))
+        .then(date)
+        .map_elements(
+            lambda x: EraDate.from_date(x).strftime(format), return_dtype=pl.String
+        )
+    )
+
+
+def _kanji_number(expr: pl.Expr) -> pl.Expr:
+    return pl.lit(_kanji_numbers()).gather(expr)
+
+
+def _compile_wareki_format(lookup: _EraLookup, format: str) -> list[pl.Expr]:
+    """
+    japanera の `strftime` のフォーマットを、部分ごとのエクスプレッションに変換します。
+
+    japanera の指定子は元号の表と漢数字の表から、それ以外の指定子は
+    `dt.strftime` で変換します。連続する strftime の指定子と文字列は
+    1つの `dt.strftime` にまとめます。
+    """
+    relative_year = lookup.relative_year()
+    directives = {
+        "%-K": lambda: lookup.column("kanji"),
+        "%-E": lambda: lookup.column("english"),
+        "%-e": lambda: lookup.column("english_vowel_shortened"),
+        "%-h": lambda: lookup.column("english_head"),
+        "%-n": lambda: (
+            pl.when(relative_year == 1)
+            .then(pl.lit("元"))
+            .otherwise(_kanji_number(relative_year % 100))
+        ),
+        "%-N": lambda: (
+            pl.when(relative_year == 1)
+            .then(pl.lit("元"))
+            .otherwise(_kanji_number(relative_year))
+        ),
+        "%-y": lambda: (relative_year % 100).cast(pl.String).str.zfill(2),
+        "%-Y": lambda: relative_year.cast(pl.String),
+        "%-m": lambda: _kanji_number(lookup.date.dt.month()),
+        "%-d": lambda: _kanji_number(lookup.date.dt.day()),
+        "%-a": lambda: pl.lit(pl.Series(list(_WEEKDAYS_KANJI))).gather(
+            lookup.date.dt.weekday() - 1
+        ),
+        # Python の strftime と同じく0埋めしない西暦の年
+        "%Y": lambda: lookup.date.dt.year().cast(pl.String),
+    }
+
+    parts: list[pl.Expr] = []
+    pending = ""
+
+    def flush() -> None:
+        nonlocal pending
+        if not pending:
+            return
+        if "%" in pending:
+            # japanera は日付として strftime を呼ぶため、時刻は 0時0分0秒になる
+            parts.append(lookup.date.cast(pl.Datetime("ms")).dt.strftime(pending))
+        else:
+            parts.append(pl.lit(pending))
+        pending = ""
+
+    for token in _FORMAT_TOKEN.findall(format):
+        if token in directives:
+            flush()
+            parts.append(directives[token]())
+        else:
+            pending += token
+    flush()
+    return parts
 
 
 class JapaneraExpr:
@@ -17,38 +278,84 @@ class JapaneraExpr:
         """
         Polars の Date 型を和暦文字列に変換します。
 
+        結果は japanera の `EraDate.from_date(x).strftime(format)` と一致します。
+        元号は元号の切り替わり日の表を二分探索して求め、フォーマットは
+        エクスプレッションの作成時に1度だけ解析するため、
+        行ごとに Python の関数を呼び出しません。
+        Datetime 型の場合は日付部分を変換します。
+        japanera の指定子と一部の strftime の指定子 (%Y, %m, %d, %y, %H, %M, %S,
+        %I, %p, %A, %a, %B, %b, %h, %j, %e, %u, %w, %%) 以外の指定子
+        (%-A, %c など) を含むフォーマットは、japanera で1行ずつ変換します。
+
         Args:
             format (str, optional): 出力する和暦のフォーマット文字列。
                 デフォルトは "%-K%-y年%m月%d日"。
+                japanera の指定子 (%-K, %-E, %-e, %-h, %-n, %-N, %-y, %-Y,
+                %-m, %-d, %-a) と strftime の指定子を利用できます。
             raise_error (bool, optional):
                 変換エラー時に例外を発生させるかどうか。デフォルトは True。
+                japanera で扱えない日付 (0001-01-01〜9999-12-30 の範囲外) は、
+                True の場合は ValueError になり、False の場合は null になります。
 
         Returns:
             pl.Expr: 和暦文字列に変換されたエクスプレッション。
         """
+        date = self._expr.dt.date()
+        if raise_error:
+            date = date.map_batches(
+                _check_wareki_range, return_dtype=pl.Date, is_elementwise=True
+            )
+        if any(
+            token.startswith("%")
+            and not _JAPANERA_DIRECTIVE.fullmatch(token)
+            and token not in _NATIVE_STRFTIME_DIRECTIVES
+            for token in _FORMAT_TOKEN.findall(format)
+        ):
+            return _keep_name(_to_wareki_by_japanera(date, format), self._expr)
 
-        def _to_wareki(
-            x: dt.date,
-            format: str = "%-K%-y年%m月%d日",
-            raise_error: bool = True,
-        ) -> Optional[str]:
-            if x is None:
-                return None
-            try:
-                # strftime の呼び出しをインスタンスメソッドに戻す
-                era_date_obj = EraDate.from_date(x)
-                return era_date_obj.strftime(format)
-            except ValueError:
-                if raise_error:
-                    raise
-                else:
-                    return None
+        lookup = _EraLookup(date)
+        parts = _compile_wareki_format(lookup, format) or [pl.lit("")]
+        return _keep_name(
+            pl.when(lookup.index.is_not_null()).then(pl.concat_str(parts)), self._expr
+        )
 
-        return self._expr.map_elements(
-            lambda x: _to_wareki(x, format, raise_error),
-            return_dtype=pl.Utf8,
-            skip_nulls=False,
+    def era(self) -> pl.Expr:
+        """
+        Polars の Date 型から元号名 (漢字) を求めます。
+
+        元号は `to_wareki` と同じく、元号の切り替わり日の表の二分探索で求めます。
+        japanera で扱えない日付 (0001-01-01〜9999-12-30 の範囲外) は null になります。
+
+        Returns:
+            pl.Expr: 元号名の Enum 型 (元号の開始日の順) のエクスプレッション。
+        """
+        return _keep_name(_EraLookup(self._expr).era(), self._expr)
+
+    def era_year(self) -> pl.Expr:
+        """
+        Polars の Date 型から元号の年 (令和2年なら 2) を求めます。
+
+        Returns:
+            pl.Expr: 元号の年の Int32 型のエクスプレッション。
+        """
+        return _keep_name(_EraLookup(self._expr).relative_year(), self._expr)
+
+    def to_wareki_struct(self) -> pl.Expr:
+        """
+        Polars の Date 型を元号・年・月・日の構造体に変換します。
+
+        Returns:
+            pl.Expr: `era` (Enum), `year` (Int32), `month` (Int8), `day` (Int8)
+                のフィールドを持つ Struct 型のエクスプレッション。
+        """
+        lookup = _EraLookup(self._expr)
+        struct = pl.struct(
+            era=lookup.era(),
+            year=lookup.relative_year(),
+            month=lookup.date.dt.month(),
+            day=lookup.date.dt.day(),
         )
+        return _keep_name(pl.when(lookup.index.is_not_null()).then(struct), self._expr)
 
     def to_datetime(
         self, format: str = "%-K%-y年%m月%d日", raise_error: bool = True
@@ -56,16 +363,66 @@ class JapaneraExpr:
         """
         和暦文字列を Polars の Date 型に変換します。
 
+        結果は japanera の `EraDate.strptime(x, format)[0].to_date()` と一致します。
+        フォーマットは1度だけ正規表現にコンパイルし、文字列の解析と
+        元号の判定は Rust のプラグインで列ごとにまとめて行います。
+        週番号・通日・タイムゾーンなどの指定子 (%G, %j, %U, %W, %V, %z, %Z,
+        %c, %x, %X) を含むフォーマットは、japanera で1行ずつ変換します。
+
         Args:
             format (str, optional): 和暦のフォーマット文字列。
                 デフォルトは "%-K%-y年%m月%d日"。
             raise_error (bool, optional):
                 変換エラー時に例外を発生させるかどうか。デフォルトは True。
+                False の場合、変換できない行は null になります。
 
         Returns:
             pl.Expr: Date 型に変換されたエクスプレッション。
         """
+        if _UNSUPPORTED_PARSE_DIRECTIVES.intersection(_FORMAT_TOKEN.findall(format)):
+            return self._to_datetime_by_japanera(format, raise_error)
+
+        eras, digest = _era_data()
+        return to_datetime(
+            self._expr,
+            kwargs={
+                "key": f"{format}:{digest}",
+                "format": format,
+                "raise_error": raise_error,
+                "eras": eras,
+            },
+        )
+
+    def parse_wareki(self, return_pattern: bool = False) -> pl.Expr:
+        """
+        フォーマットを指定せずに和暦文字列を Polars の Date 型に変換します。
+
+        "R5.1.1", "H31/4/30", "令和5年1月1日", "平成元年", "令和五年十二月一日" など、
+        元号 (漢字、または明治以降の元号の英字の頭文字) に続けて年・月・日を
+        「年」「月」「日」または区切り文字 (".", "/", "-") で区切った文字列を
+        1回の走査で解析します。月・日は省略でき (元号の最初の日・月の1日になります)、
+        全角の英数字・記号も解析できます。日付は `to_datetime` と同じく
+        japanera の規則で求め、元号の期間外の日付や解析できない文字列は
+        null になります。
+
+        Args:
+            return_pattern (bool, optional):
+                一致したパターンも返すかどうか。デフォルトは False。
+                True の場合は `date` (Date) と `pattern` (String) のフィールドを持つ
+                Struct 型を返します。`pattern` は "alphabet" (R5.1.1 など)、
+                "kanji" (令和5年1月1日 など)、"kanji_numeral" (令和五年十二月一日 など)
+                のいずれかです。
+
+        Returns:
+            pl.Expr: Date 型 (または Struct 型) のエクスプレッション。
+        """
+        eras, digest = _era_data()
+        return parse_wareki(
+            self._expr,
+            kwargs={"key": digest, "return_pattern": return_pattern, "eras": eras},
+        )
 
+    def _to_datetime_by_japanera(self, format: str, raise_error: bool) -> pl.Expr:
         def _to_datetime(
             x: str, format: str = "%-K%-y年%m月%d日", raise_error: bool = True
         ) -> Optional[dt.date]:
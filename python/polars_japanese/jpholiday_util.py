@@ -1,7 +1,226 @@
-from datetime import date
+import datetime as dt
+import functools
+from typing import Any, Callable, Union
 
 import jpholiday
 import polars as pl
+from polars._typing import IntoExpr
+
+from .calendar import (
+    _CALENDAR_END,
+    _CALENDAR_LENGTH,
+    _CALENDAR_START,
+    _CALENDAR_START_DAYS,
+    _Calendar,
+    _get_calendar,
+)
+from .japanera_util import _keep_name
+
+# roll_business_day の営業日でない日の調整方法
+_ROLL_CONVENTIONS = ("forward", "backward", "modified_following")
+
+
+def _into_expr(value: IntoExpr) -> pl.Expr:
+    """文字列は列名、エクスプレッション以外の値はリテラルとして扱います。"""
+    if isinstance(value, pl.Expr):
+        return value
+    if isinstance(value, str):
+        return pl.col(value)
+    return pl.lit(value)
+
+
+def _apply_outside_table(
+    s: pl.Series, function: Callable[[dt.date], Any], dtype: pl.DataType
+) -> pl.Series:
+    """
+    祝日の表の範囲外の日付だけに jpholiday の関数を適用します。
+
+    範囲内の日付と null は null を返します。
+    """
+    outside = s.is_not_null() & ~s.is_between(_CALENDAR_START, _CALENDAR_END)
+    result = pl.Series(s.name, [None] * len(s), dtype=dtype)
+    if not outside.any():
+        return result
+    indices = outside.arg_true()
+    values = pl.Series([function(date) for date in s.gather(indices)]).cast(dtype)
+    return result.scatter(indices, values)
+
+
+def _business_day_rank(s: pl.Series, prefix: pl.Series, inclusive: bool) -> pl.Series:
+    """
+    日付より前 (inclusive の場合はその日まで) の営業日の数を返します。
+
+    表の範囲外の日付は表の端の日付として数えます。
+    """
+    position = s.cast(pl.Date).cast(pl.Int32) - _CALENDAR_START_DAYS + int(inclusive)
+    return prefix.gather(position.clip(0, _CALENDAR_LENGTH))
+
+
+def _business_day_dates(ranks: pl.Series, offsets: pl.Series) -> pl.Series:
+    """表の先頭から数えた営業日の番号を日付に変換します。"""
+    return (offsets.gather(ranks) + _CALENDAR_START_DAYS).cast(pl.Date)
+
+
+def business_date_range(
+    start: IntoExpr,
+    end: IntoExpr,
+    *,
+    calendar: str = "jpholiday",
+    eager: bool = False,
+) -> Union[pl.Series, pl.Expr]:
+    """
+    start から end まで (両端を含む) の営業日の日付を生成します。
+
+    すべての日付を生成してから絞り込むのではなく、営業日の累積数の表から
+    範囲内の営業日の番号を求め、営業日の位置の表から直接日付を生成します。
+    `pl.date_range` と同じく、エクスプレッションとして `select` や
+    `group_by(...).agg(...)` で利用でき、グループごとに範囲を生成できます。
+
+    Args:
+        start (IntoExpr): 範囲の開始日。日付またはエクスプレッション
+            (文字列の場合は列名) を指定できます。
+        end (IntoExpr): 範囲の終了日。日付またはエクスプレッション
+            (文字列の場合は列名) を指定できます。
+        calendar (str, optional): カレンダー名。デフォルトは "jpholiday"。
+        eager (bool, optional): True の場合は Series を返します。
+            デフォルトは False (エクスプレッションを返す)。
+
+    Returns:
+        Union[pl.Series, pl.Expr]: 営業日の Date 型の Series またはエクスプレッション。
+            祝日の表の範囲 (1948年〜2099年) 外の日付は含みません。
+
+    Examples:
+        >>> import polars as pl
+        >>> from datetime import date
+        >>> import polars_japanese
+        >>> polars_japanese.business_date_range(
+        ...     date(2024, 4, 26), date(2024, 5, 7), eager=True
+        ... ).to_list()  # doctest: +SKIP
+        [datetime.date(2024, 4, 26), datetime.date(2024, 4, 30),
+         datetime.date(2024, 5, 1), datetime.date(2024, 5, 2),
+         datetime.date(2024, 5, 7)]
+        >>> # df.group_by("store").agg(
+        >>> #     polars_japanese.business_date_range(
+        >>> #         pl.col("date").min(), pl.col("date").max()
+        >>> #     )
+        >>> # )
+    """
+    calendar_table = _get_calendar(calendar)
+
+    def rank(value: IntoExpr, inclusive: bool) -> pl.Expr:
+        return _into_expr(value).map_batches(
+            functools.partial(
+                _business_day_rank,
+                prefix=calendar_table.business_day_prefix_counts,
+                inclusive=inclusive,
+            ),
+            return_dtype=pl.Int32,
+            is_elementwise=True,
+        )
+
+    # 範囲内の営業日は表の先頭から数えて first 番目から last - 1 番目まで
+    first = rank(start, inclusive=False)
+    last = rank(end, inclusive=True)
+    result = (
+        pl.int_range(first, pl.max_horizontal(first, last), dtype=pl.Int32)
+        .map_batches(
+            functools.partial(
+                _business_day_dates, offsets=calendar_table.business_day_offsets
+            ),
+            return_dtype=pl.Date,
+            is_elementwise=True,
+        )
+        .alias("date")
+    )
+    if eager:
+        return pl.select(result).to_series()
+    return result
+
+
+class _CalendarLookup:
+    """
+    日付のエクスプレッションからカレンダーの表を引くためのヘルパー
+
+    Date 型の物理表現 (1970-01-01 からの日数) から表の位置を求め、
+    表の範囲内の日付は表から、範囲外の日付は jpholiday で判定します。
+    ("jpholiday" 以外のカレンダーでは範囲外の日付は null)
+    """
+
+    def __init__(self, expr: pl.Expr, calendar: _Calendar):
+        self.calendar = calendar
+        self.date = expr.dt.date()
+        offset = self.date.cast(pl.Int32) - _CALENDAR_START_DAYS
+        self.in_range = offset.is_between(0, _CALENDAR_LENGTH - 1)
+        # 範囲外・null の日付は位置も null にする
+        self.index = pl.when(self.in_range).then(offset)
+
+    def gather(self, table: pl.Series) -> pl.Expr:
+        return pl.when(self.in_range).then(pl.lit(table).gather(self.index))
+
+    def lookup(self, table: pl.Series, outside: Callable[[], pl.Expr]) -> pl.Expr:
+        if not self.calendar.use_jpholiday_outside:
+            return self.gather(table)
+        return (
+            pl.when(self.in_range)
+            .then(pl.lit(table).gather(self.index))
+            .otherwise(outside())
+        )
+
+    def outside_table(
+        self, function: Callable[[dt.date], Any], dtype: pl.DataType
+    ) -> pl.Expr:
+        return self.date.map_batches(
+            functools.partial(_apply_outside_table, function=function, dtype=dtype),
+            return_dtype=dtype,
+            is_elementwise=True,
+        )
+
+    def is_holiday(self) -> pl.Expr:
+        return self.lookup(
+            self.calendar.holiday_flags,
+            lambda: self.outside_table(jpholiday.is_holiday, pl.Boolean()),
+        )
+
+    def is_business_day(self) -> pl.Expr:
+        return self.lookup(
+            self.calendar.business_day_flags,
+            lambda: (
+                ~(
+                    self.outside_table(jpholiday.is_holiday, pl.Boolean())
+                    | self.is_weekend()
+                )
+            ),
+        )
+
+    def holiday_name(self) -> pl.Expr:
+        dtype = self.calendar.holiday_name_enum
+        return self.lookup(
+            self.calendar.holiday_name_table,
+            lambda: self.outside_table(jpholiday.is_holiday_name, dtype),
+        )
+
+    def is_weekend(self) -> pl.Expr:
+        return self.date.dt.weekday() >= 6
+
+    def business_days_through(self) -> pl.Expr:
+        """表の先頭からその日までの営業日の数 (範囲外の日付は null)"""
+        return self.gather(self.calendar.business_day_counts)
+
+    def business_days_before(self) -> pl.Expr:
+        """表の先頭からその日の前日までの営業日の数 (範囲外の日付は null)"""
+        return self.business_days_through() - self.gather(
+            self.calendar.business_day_flags
+        ).cast(pl.Int32)
+
+    def business_day_at(self, rank: pl.Expr) -> pl.Expr:
+        """表の先頭から数えて `rank` 番目 (0始まり) の営業日 (範囲外は null)"""
+        offsets = self.calendar.business_day_offsets
+        index = pl.when(rank.is_between(0, len(offsets) - 1)).then(rank)
+        return (pl.lit(offsets).gather(index) + _CALENDAR_START_DAYS).cast(pl.Date)
+
+    def roll(self, table: pl.Series) -> pl.Expr:
+        """営業日の位置の表を引いて日付に戻す (範囲外は null)"""
+        return (self.gather(table) + _CALENDAR_START_DAYS).cast(pl.Date)
 
 
 class JpholidayExpr:
@@ -12,35 +231,229 @@ class JpholidayExpr:
     def __init__(self, expr: pl.Expr):
         self._expr = expr
 
-    def is_holiday(self) -> pl.Expr:
+    def _lookup(self, calendar: str) -> _CalendarLookup:
+        return _CalendarLookup(self._expr, _get_calendar(calendar))
+
+    def is_holiday(self, calendar: str = "jpholiday") -> pl.Expr:
         """
         指定された日付が祝日かどうかを判定します。
 
+        1948年〜2099年の日付は、初回の利用時に jpholiday から作る祝日の表を
+        日付の物理表現で参照して判定します。範囲外の日付は jpholiday で判定します。
+
+        Args:
+            calendar (str, optional): カレンダー名。
+                `polars_japanese.calendar.register` で登録したカレンダーを
+                指定できます。デフォルトは "jpholiday"。
+
         Returns:
             pl.Expr: 祝日の場合は True、そうでない場合は False を含む
                 Boolean エクスプレッション。
         """
-        return self._expr.map_elements(
-            lambda x: jpholiday.is_holiday(x) if isinstance(x, date) else None,
-            return_dtype=pl.Boolean,
-            skip_nulls=False,
-        )
+        return _keep_name(self._lookup(calendar).is_holiday(), self._expr)
 
-    def is_business_day(self) -> pl.Expr:
+    def is_business_day(self, calendar: str = "jpholiday") -> pl.Expr:
         """
         指定された日付が営業日かどうかを判定します。
-        (土日祝日でない場合に True)
+        (土日祝日でない場合、またはカレンダーで営業日とした日の場合に True)
+
+        Args:
+            calendar (str, optional): カレンダー名。デフォルトは "jpholiday"。
 
         Returns:
             pl.Expr: 営業日の場合は True、そうでない場合は False を含む
                 Boolean エクスプレッション。
         """
-        return self._expr.map_elements(
-            lambda x: isinstance(x, date)
-            and not jpholiday.is_holiday(x)
-            and x.weekday() < 5  # 土日(5,6)を除外
-            if isinstance(x, date)
-            else None,
-            return_dtype=pl.Boolean,
-            skip_nulls=False,
+        return _keep_name(self._lookup(calendar).is_business_day(), self._expr)
+
+    def holiday_name(self, calendar: str = "jpholiday") -> pl.Expr:
+        """
+        指定された日付の祝日名を返します。
+
+        祝日名は `jpholiday.is_holiday_name` と同じです。
+        `is_holiday` と同じく、祝日の表を日付の物理表現で参照して求めます。
+
+        Args:
+            calendar (str, optional): カレンダー名。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: 祝日名 ("元日", "振替休日" を含む名前など) の Enum 型の
+                エクスプレッション。祝日でない日は null になります。
+        """
+        return _keep_name(self._lookup(calendar).holiday_name(), self._expr)
+
+    def add_business_days(self, n: IntoExpr, calendar: str = "jpholiday") -> pl.Expr:
+        """
+        指定された日付から n 営業日後 (n が負の場合は前) の日付を求めます。
+
+        営業日は `is_business_day` と同じく土日祝日でない日です。
+        指定された日付自体は数えないため、n=1 は翌営業日、n=-1 は前営業日になります。
+        n=0 の場合は指定された日付をそのまま返します。
+        営業日の累積数の表と営業日の位置の表を参照するため、
+        n の大きさによらず1行あたり定数時間で求められます。
+
+        Args:
+            n (IntoExpr): 営業日数。整数またはエクスプレッション
+                (文字列の場合は列名) を指定できます。
+            calendar (str, optional): カレンダー名。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: Date 型のエクスプレッション。祝日の表の範囲
+                (1948年〜2099年) 外になる場合は null になります。
+        """
+        lookup = self._lookup(calendar)
+        n = _into_expr(n).cast(pl.Int64)
+        through = lookup.business_days_through().cast(pl.Int64)
+        before = lookup.business_days_before().cast(pl.Int64)
+        rank = pl.when(n > 0).then(through + n - 1).otherwise(before + n)
+        result = (
+            pl.when(n == 0).then(lookup.date).otherwise(lookup.business_day_at(rank))
+        )
+        return _keep_name(result, self._expr)
+
+    def business_days_between(
+        self, other: IntoExpr, calendar: str = "jpholiday"
+    ) -> pl.Expr:
+        """
+        指定された日付から other までの営業日の数を求めます。
+
+        numpy の `busday_count` と同じく、指定された日付を含み other を含まない
+        期間の営業日を数えます。other の方が前の場合は負の数になります。
+
+        Args:
+            other (IntoExpr): 期間の終わりの日付。エクスプレッション
+                (文字列の場合は列名) または日付を指定できます。
+            calendar (str, optional): カレンダー名。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: Int32 型のエクスプレッション。いずれかの日付が祝日の表の範囲
+                (1948年〜2099年) 外の場合は null になります。
+        """
+        start = self._lookup(calendar).business_days_before()
+        end = _CalendarLookup(
+            _into_expr(other), _get_calendar(calendar)
+        ).business_days_before()
+        return _keep_name(end - start, self._expr)
+
+    def roll_business_day(
+        self, convention: str = "forward", calendar: str = "jpholiday"
+    ) -> pl.Expr:
+        """
+        営業日でない日付を前後の営業日に調整します。
+
+        営業日の日付はそのまま返します。日付ごとの翌営業日・前営業日の位置の表を
+        事前に作成しておき、1行あたり1回の参照で求めます。
+
+        Args:
+            convention (str, optional): 調整方法。デフォルトは "forward"。
+                - "forward": 翌営業日
+                - "backward": 前営業日
+                - "modified_following": 翌営業日。ただし月をまたぐ場合は前営業日
+            calendar (str, optional): カレンダー名。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: Date 型のエクスプレッション。祝日の表の範囲
+                (1948年〜2099年) 外になる場合は null になります。
+
+        Raises:
+            ValueError: サポートされていない調整方法が指定された場合。
+        """
+        if convention not in _ROLL_CONVENTIONS:
+            raise ValueError(
+                f"未対応の調整方法です: {convention}"
+                f" (指定できる値: {', '.join(_ROLL_CONVENTIONS)})"
+            )
+        lookup = self._lookup(calendar)
+        forward = lookup.roll(lookup.calendar.next_business_day_offsets)
+        backward = lookup.roll(lookup.calendar.previous_business_day_offsets)
+        if convention == "forward":
+            result = forward
+        elif convention == "backward":
+            result = backward
+        else:
+            result = (
+                pl.when(forward.dt.month() == lookup.date.dt.month())
+                .then(forward)
+                .otherwise(backward)
+            )
+        return _keep_name(result, self._expr)
+
+    def month_end_business_day(self, calendar: str = "jpholiday") -> pl.Expr:
+        """
+        指定された日付の月の最終営業日 (月末最終営業日) を求めます。
+
+        月末日を `roll_business_day("backward")` と同じく前営業日に調整します。
+
+        Args:
+            calendar (str, optional): カレンダー名。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: Date 型のエクスプレッション。祝日の表の範囲
+                (1948年〜2099年) 外の場合は null になります。
+        """
+        lookup = _CalendarLookup(self._expr.dt.month_end(), _get_calendar(calendar))
+        result = lookup.roll(lookup.calendar.previous_business_day_offsets)
+        return _keep_name(result, self._expr)
+
+    def business_day_of_month(self, calendar: str = "jpholiday") -> pl.Expr:
+        """
+        指定された日付がその月の何営業日目かを求めます。
+
+        月初からその日までの営業日の数を、営業日の累積数の表の差で求めます。
+
+        Args:
+            calendar (str, optional): カレンダー名。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: 1始まりの Int32 型のエクスプレッション。営業日でない日と
+                祝日の表の範囲 (1948年〜2099年) 外の日付は null になります。
+        """
+        lookup = self._lookup(calendar)
+        month_start = _CalendarLookup(self._expr.dt.month_start(), lookup.calendar)
+        result = pl.when(lookup.gather(lookup.calendar.business_day_flags)).then(
+            lookup.business_days_through() - month_start.business_days_before()
         )
+        return _keep_name(result, self._expr)
+
+    def nth_business_day(self, n: IntoExpr, calendar: str = "jpholiday") -> pl.Expr:
+        """
+        指定された日付の月の第 n 営業日を求めます。
+
+        Args:
+            n (IntoExpr): 1始まりの営業日の番号。負の数の場合は月末から数えます
+                (-1 は月末最終営業日)。整数またはエクスプレッション
+                (文字列の場合は列名) を指定できます。
+            calendar (str, optional): カレンダー名。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: Date 型のエクスプレッション。月の営業日の数を超える場合や
+                祝日の表の範囲 (1948年〜2099年) 外の場合は null になります。
+        """
+        calendar_table = _get_calendar(calendar)
+        month_start = _CalendarLookup(self._expr.dt.month_start(), calendar_table)
+        month_end = _CalendarLookup(self._expr.dt.month_end(), calendar_table)
+        first = month_start.business_days_before().cast(pl.Int64)
+        last = month_end.business_days_through().cast(pl.Int64)
+        n = _into_expr(n).cast(pl.Int64)
+        rank = pl.when(n > 0).then(first + n - 1).when(n < 0).then(last + n)
+        result = pl.when(rank.is_between(first, last - 1)).then(
+            month_start.business_day_at(rank)
+        )
+        return _keep_name(result, self._expr)
+
+    def is_gotobi(self, calendar: str = "jpholiday") -> pl.Expr:
+        """
+        指定された日付が五十日 (ごとおび) かどうかを判定します。
+
+        五十日は毎月5, 10, 15, 20, 25日と月末日です。営業日でない場合は
+        前営業日を五十日とします。五十日の表を事前に作成して参照します。
+
+        Args:
+            calendar (str, optional): カレンダー名。デフォルトは "jpholiday"。
+
+        Returns:
+            pl.Expr: Boolean 型のエクスプレッション。祝日の表の範囲
+                (1948年〜2099年) 外の日付は null になります。
+        """
+        lookup = self._lookup(calendar)
+        return _keep_name(lookup.gather(lookup.calendar.gotobi_flags), self._expr)
@@ -3,6 +3,13 @@ from typing import Optional
 import kanjize
 import polars as pl
 
+from polars_japanese.plugin import (
+    extract_numbers,
+    replace_kanji_numerals,
+    to_kanji,
+    to_number,
+)
+
 
 class KanjizeExpr:
     def __init__(self, expr: pl.Expr):
@@ -14,30 +21,78 @@ class KanjizeExpr:
         """
         数値を漢数字に変換します。
 
+        `kanjize.number2kanji` と同じ結果をプラグインで求めます。
+        `KanjizeConfiguration` の `style`, `zero`, `kanji_thousand`, `use_daiji`
+        の設定に対応し、小数は 0 方向に切り捨てます。
+        UInt64 型と Decimal 型の列では Int64 の範囲を超える値 (京, 垓 など) も
+        変換できます。数値として扱えない値は null になります。
+
         Args:
             config (Optional[kanjize.KanjizeConfiguration], optional):
-                kanjize の設定。デフォルトは None。
+                kanjize の設定。デフォルトは None (kanjize の既定の設定)。
 
         Returns:
             pl.Expr: 漢数字文字列に変換されたエクスプレッション。
         """
-        return self._expr.map_elements(
-            lambda x: kanjize.number2kanji(x, config=config)
-            if x is not None
-            else None,
-            return_dtype=pl.Utf8,
-            skip_nulls=False,
+        config = config or kanjize.KanjizeConfiguration()
+        return to_kanji(
+            self._expr,
+            kwargs={
+                "style": config.style.value,
+                "zero": config.zero,
+                "kanji_thousand": config.kanji_thousand,
+                "use_daiji": config.use_daiji,
+            },
         )
 
-    def to_number(self) -> pl.Expr:
+    def to_number(self, return_error: bool = False) -> pl.Expr:
         """
         漢数字を数値に変換します。
 
+        "千二百三十四" のような漢数字のほか、"1万2千", "一二三四",
+        "壱萬弐阡", "１２，３４５" のようにアラビア数字・全角数字・大字・
+        位取りの記法が混在した文字列もプラグインで1回の走査で変換します。
+        解析できない値は例外を送出せずに null になります。
+
+        Args:
+            return_error (bool, optional): True の場合は、変換した値と
+                解析できなかった理由の `{value, error}` の構造体を返します。
+                デフォルトは False。
+
         Returns:
             pl.Expr: 数値に変換されたエクスプレッション (Int64)。
+                `return_error=True` の場合は Struct 型のエクスプレッション。
         """
-        return self._expr.map_elements(
-            lambda x: kanjize.kanji2number(x) if x is not None else None,
-            return_dtype=pl.Int64,
-            skip_nulls=False,
-        )
+        return to_number(self._expr, kwargs={"return_error": return_error})
+
+    def extract_numbers(self) -> pl.Expr:
+        """
+        文字列の中の数を取り出します。
+
+        "三丁目十二番地" -> [3, 12], "第二十一回" -> [21], "１２階" -> [12]
+        のように、数字・漢数字・単位の連続する部分を `to_number` と同じ文法で
+        1回の走査で解析します。"2024.1.5" のように小数点が2つ以上ある場合は
+        小数点で区切った別々の数とし、"-" などの符号は扱いません。
+        解析できない部分 ("万一" など) は取り出しません。
+        地名などの漢字の一部 ("千葉" の "千" など) も数として扱う点に
+        注意してください。
+
+        Returns:
+            pl.Expr: 取り出した数のリストのエクスプレッション (List(Int64))。
+        """
+        return extract_numbers(self._expr)
+
+    def replace_kanji_numerals(self) -> pl.Expr:
+        """
+        文字列の中の漢数字・全角数字を含む数を半角のアラビア数字に置き換えます。
+
+        "三丁目十二番地" -> "3丁目12番地", "１，２００円" -> "1200円" のように、
+        `extract_numbers` と同じ規則で見つけた数を置き換えます。
+        半角のアラビア数字だけの数と、整数でない数 ("１．５" など) は
+        そのままにします。
+
+        Returns:
+            pl.Expr: 数を置き換えた文字列のエクスプレッション。
+                入力が Categorical/Enum の場合は Categorical。
+        """
+        return replace_kanji_numerals(self._expr)
@@ -1,5 +1,155 @@
+import hashlib
+import json
+from collections.abc import Sequence
+from typing import Any, Optional, Union
+
 import polars as pl
 
+from polars_japanese.plugin import is_normalized, normalize, pipeline
+
+# 登録済みの正規化プロファイル (プロファイル名 -> プラグインに渡す引数)
+_PROFILES: dict[str, dict[str, Any]] = {}
+
+
+def register_normalize_profile(
+    name: str,
+    *,
+    base: str = "default",
+    mapping: Optional[dict[str, str]] = None,
+    keep: str = "",
+    collapse_prolonged_sound_mark: Optional[bool] = None,
+    remove_space_between_japanese: Optional[bool] = None,
+) -> None:
+    """
+    ユーザー定義の正規化プロファイルを登録します。
+
+    登録したプロファイルは `ja.normalize(profile=name)` で利用できます。
+    プロファイルの置換ルールはプラグイン側で1つの変換テーブルにコンパイルされ、
+    設定内容ごとにキャッシュされます。
+
+    組み込みのプロファイル:
+        - "default": NFKC正規化と日本語特有のルール
+        - "neologdn": "default" に加えて、連続する長音記号をまとめ、
+          日本語の文字の間の空白を削除
+
+    Args:
+        name (str): プロファイル名。
+        base (str, optional): 元にするプロファイル名。デフォルトは "default"。
+        mapping (Optional[dict[str, str]], optional):
+            1文字から文字列への置換 (異体字の統一など)。
+            置換はNFKC正規化の前に入力文字へ適用され、置換結果には
+            NFKC正規化と既定のルールを適用しません。
+        keep (str, optional): 正規化せずにそのまま残す文字 (例: "！")。
+        collapse_prolonged_sound_mark (Optional[bool], optional):
+            連続する長音記号'ー'を1つにまとめるかどうか。
+            Noneの場合は base の設定を引き継ぎます。
+        remove_space_between_japanese (Optional[bool], optional):
+            日本語の文字同士、日本語と半角英数字の間の空白を削除するかどうか。
+            Noneの場合は base の設定を引き継ぎます。
+
+    Raises:
+        ValueError: base が未登録の場合、または置換対象が1文字でない場合。
+
+    Examples:
+        >>> import polars_japanese
+        >>> polars_japanese.register_normalize_profile(
+        ...     "itaiji", mapping={"髙": "高", "﨑": "崎"}, keep="！"
+        ... )
+        >>> # pl.col("name").ja.normalize(profile="itaiji")
+    """
+    base_kwargs = _get_profile_kwargs(base)
+
+    new_mapping = dict(base_kwargs["mapping"])
+    new_mapping.update({c: c for c in keep})
+    for key, value in (mapping or {}).items():
+        if len(key) != 1:
+            raise ValueError(f"置換対象は1文字で指定してください: {key!r}")
+        new_mapping[key] = value
+
+    if collapse_prolonged_sound_mark is None:
+        collapse_prolonged_sound_mark = base_kwargs["collapse_prolonged_sound_mark"]
+    if remove_space_between_japanese is None:
+        remove_space_between_japanese = base_kwargs["remove_space_between_japanese"]
+
+    _register_profile(
+        name,
+        mapping=new_mapping,
+        collapse_prolonged_sound_mark=collapse_prolonged_sound_mark,
+        remove_space_between_japanese=remove_space_between_japanese,
+    )
+
+
+def _register_profile(
+    name: str,
+    mapping: dict[str, str],
+    collapse_prolonged_sound_mark: bool,
+    remove_space_between_japanese: bool,
+) -> None:
+    settings = {
+        "mapping": mapping,
+        "collapse_prolonged_sound_mark": collapse_prolonged_sound_mark,
+        "remove_space_between_japanese": remove_space_between_japanese,
+    }
+    # 設定内容が変わった場合に再コンパイルされるよう、キーにハッシュを含める
+    digest = hashlib.sha1(
+        json.dumps(settings, sort_keys=True, ensure_ascii=False).encode()
+    ).hexdigest()
+    _PROFILES[name] = {"key": f"{name}:{digest}", **settings}
+
+
+def _get_profile_kwargs(profile: str) -> dict[str, Any]:
+    try:
+        return _PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"未登録の正規化プロファイルです: {profile}")
+
+
+_register_profile(
+    "default",
+    mapping={},
+    collapse_prolonged_sound_mark=False,
+    remove_space_between_japanese=False,
+)
+_register_profile(
+    "neologdn",
+    mapping={},
+    collapse_prolonged_sound_mark=True,
+    remove_space_between_japanese=True,
+)
+
+
+# パイプラインのステップ名 -> オプションの既定値
+_PIPELINE_STEPS: dict[str, dict[str, Any]] = {
+    "normalize": {"profile": "default"},
+    "half_width": {"ascii": True, "digit": True, "kana": True, "ignore": ""},
+    "full_width": {"ascii": True, "digit": True, "kana": True, "ignore": ""},
+    "katakana": {"ignore": ""},
+    "hiragana": {"ignore": ""},
+    "upper": {},
+    "lower": {},
+    "strip": {},
+}
+
+PipelineStep = Union[str, tuple[str, dict[str, Any]]]
+
+
+def _build_pipeline_kwargs(steps: Sequence[PipelineStep]) -> dict[str, Any]:
+    compiled = []
+    for step in steps:
+        name, options = (step, {}) if isinstance(step, str) else step
+        if name not in _PIPELINE_STEPS:
+            raise ValueError(f"未対応のパイプラインのステップです: {name}")
+        unknown = set(options) - set(_PIPELINE_STEPS[name])
+        if unknown:
+            raise ValueError(
+                f"ステップ {name} に未対応のオプションです: {sorted(unknown)}"
+            )
+        options = {**_PIPELINE_STEPS[name], **options}
+        if name == "normalize":
+            options = _get_profile_kwargs(options["profile"])
+        compiled.append({"step": name, **options})
+    return {"steps": compiled}
+
 
 class NormalizeExpr:
     """
@@ -12,7 +162,7 @@ class NormalizeExpr:
     def __init__(self, expr: pl.Expr):
         self._expr = expr
 
-    def normalize(self) -> pl.Expr:
+    def normalize(self, profile: str = "default") -> pl.Expr:
         """
         式内の日本語テキストを正規化します。
 
@@ -24,33 +174,91 @@ class NormalizeExpr:
         - 疑問符を半角'?'に統一
         - スペースを半角スペース' 'に統一
 
+        NFKC正規化と各ルールはプラグインにより1回の走査で適用されます。
+
         正規化ルールは以下を参考にしています：
         https://github.com/ikegami-yukino/jaconv
 
+        Args:
+            profile (str, optional): 使用する正規化プロファイル名。
+                `register_normalize_profile` で登録したプロファイルを指定できます。
+                デフォルトは "default"。
+
         Returns:
             pl.Expr: 正規化された文字列を表す式
+
+        Raises:
+            ValueError: 未登録のプロファイルが指定された場合。
+        """
+        return normalize(self._expr, _get_profile_kwargs(profile))
+
+    def is_normalized(self, profile: str = "default") -> pl.Expr:
+        """
+        文字列が正規化済み (`normalize` で変化しない) かどうかを判定します。
+
+        ASCIIのみの文字列やNFKC正規化済みの文字列は、
+        正規化後の文字列を作らずに判定されます。
+
+        Args:
+            profile (str, optional): 使用する正規化プロファイル名。
+                デフォルトは "default"。
+
+        Returns:
+            pl.Expr: 正規化済みの場合は True を含む Boolean エクスプレッション。
+
+        Raises:
+            ValueError: 未登録のプロファイルが指定された場合。
+        """
+        return is_normalized(self._expr, _get_profile_kwargs(profile))
+
+    def pipeline(self, steps: Sequence[PipelineStep]) -> pl.Expr:
         """
-        # 1. NFKC正規化を適用
-        normalized_expr = self._expr.str.normalize("NFKC")
-
-        # 2. 日本語特有の正規化ルールをreplace_allを使用して適用
-        normalized_expr = (
-            normalized_expr
-            # 長音記号の統一（全角'ー'に）
-            .str.replace_all(r"[〜～﹣－—―━─]", "ー", literal=False)
-            # ハイフン類の統一（半角'-'に）
-            .str.replace_all(r"[―‐˗֊‐‑‒–⁃⁻₋−]", "-", literal=False)
-            # クォートの統一
-            .str.replace_all("'", "'", literal=True)
-            .str.replace_all('"', '"', literal=True)
-            .str.replace_all('"', "``", literal=True)
-            # 感嘆符を半角に
-            .str.replace_all("！", "!", literal=True)
-            # 疑問符を半角に
-            .str.replace_all("？", "?", literal=True)
-            # スペースの統一
-            .str.replace_all("　", " ", literal=True)
-            .str.replace_all(r"\s+", " ", literal=False)
-            .str.strip_chars()
-        )
-        return normalized_expr
+        複数の文字列変換をまとめて1回の走査で適用します。
+
+        各行に全てのステップを続けて適用するため、ステップごとの
+        中間結果の列を作りません。
+
+        Args:
+            steps (Sequence[PipelineStep]): 適用するステップ。
+                ステップ名、または (ステップ名, オプション) のタプルで指定します。
+
+        Returns:
+            pl.Expr: 変換された文字列を表す式
+
+        Raises:
+            ValueError: 未対応のステップまたはオプションが指定された場合。
+        """
+        return pipeline(self._expr, _build_pipeline_kwargs(steps))
+
+
+def _normalize_with_replace(expr: pl.Expr) -> pl.Expr:
+    """
+    `str.replace_all` を連結して正規化する従来の実装です。
+
+    プラグインによる正規化と結果が一致することの確認、
+    およびベンチマークの比較対象として残しています。
+    """
+    # 1. NFKC正規化を適用
+    normalized_expr = expr.str.normalize("NFKC")
+
+    # 2. 日本語特有の正規化ルールをreplace_allを使用して適用
+    normalized_expr = (
+        normalized_expr
+        # 長音記号の統一（全角'ー'に）
+        .str.replace_all(r"[〜～﹣－—―━─]", "ー", literal=False)
+        # ハイフン類の統一（半角'-'に）
+        .str.replace_all(r"[―‐˗֊‐‑‒–⁃⁻₋−]", "-", literal=False)
+        # クォートの統一
+        .str.replace_all("'", "'", literal=True)
+        .str.replace_all('"', '"', literal=True)
+        .str.replace_all('"', "``", literal=True)
+        # 感嘆符を半角に
+        .str.replace_all("！", "!", literal=True)
+        # 疑問符を半角に
+        .str.replace_all("？", "?", literal=True)
+        # スペースの統一
+        .str.replace_all("　", " ", literal=True)
+        .str.replace_all(r"\s+", " ", literal=False)
+        .str.strip_chars()
+    )
+    return normalized_expr
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Any
 
 import polars as pl
 from polars._typing import IntoExpr
@@ -7,19 +8,159 @@ from polars.plugins import register_plugin_function
 PLUGIN_PATH = Path(__file__).parent.parent
 
 
-def to_half_width(expr: IntoExpr) -> pl.Expr:
+def to_half_width(expr: IntoExpr, kwargs: dict[str, Any]) -> pl.Expr:
     return register_plugin_function(
         plugin_path=PLUGIN_PATH,
         function_name="to_half_width",
         args=expr,
+        kwargs=kwargs,
         is_elementwise=True,
     )
 
 
-def to_full_width(expr: IntoExpr) -> pl.Expr:
+def to_full_width(expr: IntoExpr, kwargs: dict[str, Any]) -> pl.Expr:
     return register_plugin_function(
         plugin_path=PLUGIN_PATH,
         function_name="to_full_width",
         args=expr,
+        kwargs=kwargs,
+        is_elementwise=True,
+    )
+
+
+def to_katakana(expr: IntoExpr, kwargs: dict[str, Any]) -> pl.Expr:
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="to_katakana",
+        args=expr,
+        kwargs=kwargs,
+        is_elementwise=True,
+    )
+
+
+def to_hiragana(expr: IntoExpr, kwargs: dict[str, Any]) -> pl.Expr:
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="to_hiragana",
+        args=expr,
+        kwargs=kwargs,
+        is_elementwise=True,
+    )
+
+
+def normalize(expr: IntoExpr, kwargs: dict[str, Any]) -> pl.Expr:
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="normalize",
+        args=expr,
+        kwargs=kwargs,
+        is_elementwise=True,
+    )
+
+
+def is_normalized(expr: IntoExpr, kwargs: dict[str, Any]) -> pl.Expr:
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="is_normalized",
+        args=expr,
+        kwargs=kwargs,
+        is_elementwise=True,
+    )
+
+
+def pipeline(expr: IntoExpr, kwargs: dict[str, Any]) -> pl.Expr:
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="pipeline",
+        args=expr,
+        kwargs=kwargs,
+        is_elementwise=True,
+    )
+
+
+def to_datetime(expr: IntoExpr, kwargs: dict[str, Any]) -> pl.Expr:
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="to_datetime",
+        args=expr,
+        kwargs=kwargs,
+        is_elementwise=True,
+    )
+
+
+def parse_wareki(expr: IntoExpr, kwargs: dict[str, Any]) -> pl.Expr:
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="parse_wareki",
+        args=expr,
+        kwargs=kwargs,
+        is_elementwise=True,
+    )
+
+
+def to_kanji(expr: IntoExpr, kwargs: dict[str, Any]) -> pl.Expr:
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="to_kanji",
+        args=expr,
+        kwargs=kwargs,
+        is_elementwise=True,
+    )
+
+
+def to_number(expr: IntoExpr, kwargs: dict[str, Any]) -> pl.Expr:
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="to_number",
+        args=expr,
+        kwargs=kwargs,
+        is_elementwise=True,
+    )
+
+
+def extract_numbers(expr: IntoExpr) -> pl.Expr:
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="extract_numbers",
+        args=expr,
+        is_elementwise=True,
+    )
+
+
+def replace_kanji_numerals(expr: IntoExpr) -> pl.Expr:
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="replace_kanji_numerals",
+        args=expr,
+        is_elementwise=True,
+    )
+
+
+def parse_amount(expr: IntoExpr, kwargs: dict[str, Any]) -> pl.Expr:
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="parse_amount",
+        args=expr,
+        kwargs=kwargs,
+        is_elementwise=True,
+    )
+
+
+def format_amount(expr: IntoExpr, kwargs: dict[str, Any]) -> pl.Expr:
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="format_amount",
+        args=expr,
+        kwargs=kwargs,
+        is_elementwise=True,
+    )
+
+
+def resolve_prefecture(expr: IntoExpr, kwargs: dict[str, Any]) -> pl.Expr:
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="resolve_prefecture",
+        args=expr,
+        kwargs=kwargs,
         is_elementwise=True,
     )
@@ -3,8 +3,13 @@ from typing import Union
 import polars as pl
 from polars.api import register_expr_namespace
 
+from polars_japanese.datetime_util import _enum_literal
+from polars_japanese.japanera_util import _keep_name
+from polars_japanese.plugin import resolve_prefecture
+
 # --- データ定義 ---
 # 都道府県コードから各種表記へのマッピング
+# (照合と変換はプラグイン側の同じ内容の表で行い、両者の一致はテストで確認する)
 # fmt: off
 _PREFECTURE_DATA: dict[int, dict[str, Union[str, int]]] = {
     1: {"code": 1, "kanji": "北海道", "hira": "ほっかいどう", "kana": "ホッカイドウ", "roman": "HOKKAIDO", "region": "北海道"},  # noqa: E501
@@ -57,93 +62,17 @@ _PREFECTURE_DATA: dict[int, dict[str, Union[str, int]]] = {
 }
 # fmt: on
 
-# 都道府県コードへ変換するためのマッピング
-_ANY_TO_CODE_MAP: dict[str, int] = {}
-for _code, _data in _PREFECTURE_DATA.items():
-    # コード
-    _ANY_TO_CODE_MAP[str(_code)] = _code
-
-    # 漢字
-    kanji_full = str(_data["kanji"])
-    _ANY_TO_CODE_MAP[kanji_full] = _code
-    if kanji_full == "北海道":
-        pass
-    if kanji_full.endswith("都") and kanji_full != "京都":
-        _ANY_TO_CODE_MAP[kanji_full[:-1]] = _code
-    elif kanji_full.endswith("府"):
-        _ANY_TO_CODE_MAP[kanji_full[:-1]] = _code
-    elif kanji_full.endswith("県"):
-        _ANY_TO_CODE_MAP[kanji_full[:-1]] = _code
-
-    # ひらがな
-    hira_full = str(_data["hira"])
-    _ANY_TO_CODE_MAP[hira_full] = _code
-    if hira_full == "ほっかいどう":
-        pass
-    if hira_full.endswith("と") and hira_full != "きょうと":
-        _ANY_TO_CODE_MAP[hira_full[:-1]] = _code
-    elif hira_full.endswith("ふ"):
-        _ANY_TO_CODE_MAP[hira_full[:-1]] = _code
-    elif hira_full.endswith("けん"):
-        _ANY_TO_CODE_MAP[hira_full[:-2]] = _code
-
-    # カタカナ (全角大文字)
-    kata_full = str(_data["kana"])
-    _ANY_TO_CODE_MAP[kata_full] = _code
-    if kata_full == "ホッカイドウ":
-        pass
-    if kata_full.endswith("ト") and kata_full != "キョウト":
-        _ANY_TO_CODE_MAP[kata_full[:-1]] = _code
-    elif kata_full.endswith("フ"):
-        _ANY_TO_CODE_MAP[kata_full[:-1]] = _code
-    elif kata_full.endswith("ケン"):
-        _ANY_TO_CODE_MAP[kata_full[:-2]] = _code
-    # ひらがなから変換したカタカナも登録 (小文字も含む)
-    hira_for_kata = str(_data["hira"])
-
-    # ローマ字 (大文字・小文字)
-    _roman_full = str(_data["roman"]).upper()
-    _ANY_TO_CODE_MAP[_roman_full] = _code
-    _ANY_TO_CODE_MAP[_roman_full.lower()] = _code
-    if _roman_full == "HOKKAIDO":
-        pass
-    elif _roman_full.endswith("TO") and _roman_full != "KYOTO":
-        _ANY_TO_CODE_MAP[_roman_full[:-2]] = _code
-        _ANY_TO_CODE_MAP[_roman_full[:-2].lower()] = _code
-    elif _roman_full.endswith("FU"):
-        _ANY_TO_CODE_MAP[_roman_full[:-2]] = _code
-        _ANY_TO_CODE_MAP[_roman_full[:-2].lower()] = _code
-    elif _roman_full.endswith("KEN"):
-        _ANY_TO_CODE_MAP[_roman_full[:-3]] = _code
-        _ANY_TO_CODE_MAP[_roman_full[:-3].lower()] = _code
-
-# 茨城の特殊ケース
-_ANY_TO_CODE_MAP["イバラギケン"] = 8
-_ANY_TO_CODE_MAP["イバラギ"] = 8
-_ANY_TO_CODE_MAP["いばらぎけん"] = 8
-_ANY_TO_CODE_MAP["いばらぎ"] = 8
-
-
-# 都道府県コードから漢字表記
-_CODE_TO_KANJI_MAP: dict[int, str] = {
-    code: str(data["kanji"]) for code, data in _PREFECTURE_DATA.items()
-}
-# 都道府県コードからひらがな表記
-_CODE_TO_HIRAGANA_MAP: dict[int, str] = {
-    code: str(data["hira"]) for code, data in _PREFECTURE_DATA.items()
-}
-# 都道府県コードからカタカナ表記
-_CODE_TO_KATAKANA_MAP: dict[int, str] = {
-    code: str(data["kana"]) for code, data in _PREFECTURE_DATA.items()
-}
-# 都道府県コードからローマ字表記
-_CODE_TO_ROMAJI_MAP: dict[int, str] = {
-    code: data["roman"] for code, data in _PREFECTURE_DATA.items()
-}
-# 都道府県コードから地方名
-_CODE_TO_REGION_MAP: dict[int, str] = {
-    code: str(data["region"]) for code, data in _PREFECTURE_DATA.items()
-}
+# 地方名 (北から順)
+_REGIONS = ["北海道", "東北", "関東", "中部", "近畿", "中国", "四国", "九州・沖縄"]
+
+# 都道府県名 (漢字表記) の Enum 型 (JIS コード順)
+PREFECTURE_ENUM = pl.Enum([str(data["kanji"]) for data in _PREFECTURE_DATA.values()])
+# 都道府県名 (ローマ字表記) の Enum 型 (JIS コード順)
+PREFECTURE_ROMAJI_ENUM = pl.Enum(
+    [str(data["roman"]) for data in _PREFECTURE_DATA.values()]
+)
+# 地方名の Enum 型
+REGION_ENUM = pl.Enum(_REGIONS)
 
 
 @register_expr_namespace("ja_pref")
@@ -151,29 +80,36 @@ class PrefectureExpr:
     def __init__(self, expr: pl.Expr):
         self._expr = expr
 
+    def _resolve(self, output: str) -> pl.Expr:
+        return resolve_prefecture(self._expr, kwargs={"output": output})
+
+    def _resolve_enum(self, output: str, dtype: pl.Enum) -> pl.Expr:
+        # プラグインが返す Enum のカテゴリの位置 (UInt32) で Enum のカテゴリを参照する
+        return _keep_name(
+            _enum_literal(dtype).gather(self._resolve(output)), self._expr
+        )
+
     def to_code(self) -> pl.Expr:
         """
         都道府県名（漢字、ひらがな、カタカナ、ローマ字、コード）を都道府県コードに変換します。
 
-        表記揺れ（「県」の有無など）も吸収します。
+        表記揺れ（「県」の有無、"TOKYO-TO" のようなローマ字の接尾辞、全角・半角、
+        英字の大文字・小文字、前後の空白など）も吸収します。
+        照合はプラグインで正規化と表の参照を1回の走査で行います。
         該当しない場合はnullになります。
+        整数の列はそのまま都道府県コードとして扱い、
+        Categorical/Enum の場合、照合はカテゴリの辞書に対してのみ行われます。
         """
-        normalized_expr = self._expr.cast(pl.Utf8).ja.normalize().str.to_uppercase()
-        return normalized_expr.replace_strict(
-            _ANY_TO_CODE_MAP, default=None, return_dtype=pl.Int64
-        )
+        return self._resolve("code")
 
     def to_kanji(self) -> pl.Expr:
         """
         都道府県名またはコードを正式な漢字表記（例:「東京都」「神奈川県」）に変換します。
 
-        入力が都道府県名の場合、まずコードに変換してから漢字表記にします。
+        結果は JIS コード順の Enum 型 (`PREFECTURE_ENUM`) です。
         該当しない場合はnullになります。
         """
-        code_expr = self.to_code()
-        return code_expr.replace_strict(
-            _CODE_TO_KANJI_MAP, default=None, return_dtype=pl.Utf8
-        )
+        return self._resolve_enum("index", PREFECTURE_ENUM)
 
     def to_hiragana(self) -> pl.Expr:
         """
@@ -181,10 +117,7 @@ class PrefectureExpr:
 
         該当しない場合はnullになります。
         """
-        code_expr = self.to_code()
-        return code_expr.replace_strict(
-            _CODE_TO_HIRAGANA_MAP, default=None, return_dtype=pl.Utf8
-        )
+        return self._resolve("hiragana")
 
     def to_katakana(self) -> pl.Expr:
         """
@@ -192,26 +125,22 @@ class PrefectureExpr:
 
         該当しない場合はnullになります。
         """
-        code_expr = self.to_code()
-        return code_expr.replace_strict(
-            _CODE_TO_KATAKANA_MAP, default=None, return_dtype=pl.Utf8
-        )
+        return self._resolve("katakana")
 
     def to_romaji(self) -> pl.Expr:
         """
         都道府県名またはコードを一般的なローマ字表記に変換します。
 
+        結果は JIS コード順の Enum 型 (`PREFECTURE_ROMAJI_ENUM`) です。
         該当しない場合はnullになります。
         """
-        code_expr = self.to_code()
-        return code_expr.replace_strict(
-            _CODE_TO_ROMAJI_MAP, default=None, return_dtype=pl.Utf8
-        )
+        return self._resolve_enum("index", PREFECTURE_ROMAJI_ENUM)
 
     def to_region(self) -> pl.Expr:
         """
         都道府県名またはコードを地方名に変換します。
 
+        結果は下記の順の Enum 型 (`REGION_ENUM`) です。
         該当しない場合はnullになります。
         地方：
             - 北海道
@@ -223,7 +152,4 @@ class PrefectureExpr:
             - 四国
             - 九州・沖縄
         """
-        code_expr = self.to_code()
-        return code_expr.replace_strict(
-            _CODE_TO_REGION_MAP, default=None, return_dtype=pl.Utf8
-        )
+        return self._resolve_enum("region", REGION_ENUM)
@@ -0,0 +1,171 @@
+use serde::Deserialize;
+
+use std::fmt::Write;
+
+use crate::kanji::{
+    groups, parse_scaled, NumeralError, DAIJI_DIGITS, DAIJI_LITTLE_UNITS, LARGE_UNITS,
+    MAX_FRACTION_DIGITS, SCALE,
+};
+use crate::width::ascii_to_half_width_char;
+
+/// Decimal の小数点以下の桁数の上限 (漢数字の解析の固定小数点の桁数)
+pub const MAX_AMOUNT_SCALE: usize = MAX_FRACTION_DIGITS as usize;
+
+/// 負の数を表す記号 (全角→半角変換後。会計で使う △, ▲ を含む)
+const NEGATIVE_SIGNS: [char; 4] = ['-', '−', '△', '▲'];
+/// 金額の前に付く円記号 (Shift_JIS の環境ではバックスラッシュで表示される)
+const YEN_SIGNS: [char; 2] = ['¥', '\\'];
+
+/// `parse_amount` プラグインの引数
+#[derive(Deserialize)]
+pub struct ParseAmountKwargs {
+    /// Decimal の小数点以下の桁数 (None の場合は Int64)
+    pub scale: Option<usize>,
+}
+
+/// 金額の文字列を解析して、SCALE 倍した値を返す
+///
+/// 全角の数字・記号を半角にしてから、先頭の符号 (-, +, △, ▲) と円記号、
+/// 末尾の "円" を取り除き、残りを `to_number` と同じ文法で解析します。
+/// "1,234円", "１２万円", "1.2億", "△1,234", "▲500", "¥-1,234" などを解析できます。
+/// `buf` は全角→半角変換した文字列を書き込む作業領域です。
+pub fn parse_amount_scaled(val: &str, buf: &mut String) -> Result<i128, NumeralError> {
+    buf.clear();
+    buf.extend(val.chars().map(ascii_to_half_width_char));
+
+    let mut rest = buf.trim();
+    let mut negative = None;
+    let mut has_yen = false;
+    // 符号と円記号はどちらが先でもよい ("-¥1,234", "¥-1,234")
+    while let Some(c) = rest.chars().next() {
+        if negative.is_none() && (c == '+' || NEGATIVE_SIGNS.contains(&c)) {
+            negative = Some(c != '+');
+        } else if !has_yen && YEN_SIGNS.contains(&c) {
+            has_yen = true;
+        } else {
+            break;
+        }
+        rest = rest[c.len_utf8()..].trim_start();
+    }
+    if let Some(stripped) = rest.strip_suffix('円') {
+        rest = stripped.trim_end();
+    }
+
+    let value = parse_scaled(rest)?;
+    Ok(if negative == Some(true) {
+        -value
+    } else {
+        value
+    })
+}
+
+impl ParseAmountKwargs {
+    /// SCALE 倍した値を出力の物理表現に変換する
+    ///
+    /// Int64 の場合は整数、Decimal の場合は `scale` 桁の固定小数点の整数に
+    /// 0 方向に切り捨てます。
+    pub fn unscale(&self, scaled: i128) -> i128 {
+        match self.scale {
+            Some(scale) => scaled / 10i128.pow((MAX_AMOUNT_SCALE - scale) as u32),
+            None => scaled / SCALE,
+        }
+    }
+}
+
+/// `format_amount` の表記
+#[derive(Deserialize, Clone, Copy, PartialEq, Eq)]
+#[serde(rename_all = "lowercase")]
+pub enum AmountStyle {
+    /// 万・億・兆 の単位とカンマ ("1億2,345万6,789円")
+    Mixed,
+    /// 大字 ("壱億弐阡参佰肆拾伍萬陸阡漆佰捌拾玖円")
+    Daiji,
+    /// カンマ区切り ("123,456,789円")
+    Comma,
+}
+
+/// `format_amount` プラグインの引数
+#[derive(Deserialize)]
+pub struct FormatAmountKwargs {
+    style: AmountStyle,
+    /// 金額の後に付ける文字列 ("円" など)
+    suffix: String,
+}
+
+impl FormatAmountKwargs {
+    /// `value` / 10^`scale` の金額を `buf` に書き込む
+    ///
+    /// `scale` は Decimal の小数点以下の桁数で、`Mixed`, `Comma` では
+    /// 小数点以下の桁をそのまま書き込み、`Daiji` では切り捨てます。
+    pub fn format_into(&self, value: i128, scale: usize, buf: &mut String) {
+        let divisor = 10u128.pow(scale as u32);
+        let abs = value.unsigned_abs();
+        let (int_part, frac_part) = (abs / divisor, abs % divisor);
+        if value < 0 && (int_part > 0 || (frac_part > 0 && self.style != AmountStyle::Daiji)) {
+            buf.push('-');
+        }
+        match self.style {
+            AmountStyle::Mixed => {
+                if int_part == 0 {
+                    buf.push('0');
+                }
+                for (i, group) in groups(int_part) {
+                    push_with_commas(buf, group as u128);
+                    buf.push_str(LARGE_UNITS[i]);
+                }
+            }
+            AmountStyle::Comma => push_with_commas(buf, int_part),
+            AmountStyle::Daiji => push_daiji(buf, int_part),
+        }
+        if scale > 0 && self.style != AmountStyle::Daiji {
+            let _ = write!(buf, ".{:0width$}", frac_part, width = scale);
+        }
+        buf.push_str(&self.suffix);
+    }
+}
+
+/// 3桁ごとにカンマで区切ったアラビア数字を書き込む
+fn push_with_commas(buf: &mut String, number: u128) {
+    let mut digits = [0u8; 39];
+    let mut len = 0;
+    let mut rest = number;
+    loop {
+        digits[len] = b'0' + (rest % 10) as u8;
+        rest /= 10;
+        len += 1;
+        if rest == 0 {
+            break;
+        }
+    }
+    for i in (0..len).rev() {
+        buf.push(digits[i] as char);
+        if i > 0 && i % 3 == 0 {
+            buf.push(',');
+        }
+    }
+}
+
+/// 大字を書き込む
+///
+/// 証書などの金額の書き方に合わせて、十, 百, 千 の位が 1 の場合も
+/// "壱拾", "壱佰", "壱阡" のように数字を省略しません。
+fn push_daiji(buf: &mut String, number: u128) {
+    if number == 0 {
+        buf.push('零');
+        return;
+    }
+    for (i, group) in groups(number) {
+        for (unit, place) in [(2, 1000), (1, 100), (0, 10)] {
+            let d = (group / place % 10) as usize;
+            if d > 0 {
+                buf.push(DAIJI_DIGITS[d]);
+                buf.push(DAIJI_LITTLE_UNITS[unit]);
+            }
+        }
+        let ones = (group % 10) as usize;
+        if ones > 0 {
+            buf.push(DAIJI_DIGITS[ones]);
+        }
+        buf.push_str(if i == 1 { "萬" } else { LARGE_UNITS[i] });
+    }
+}
@@ -1,27 +1,625 @@
 use polars::prelude::*;
+use polars_arrow::array::Utf8ViewArray;
 use pyo3_polars::derive::polars_expr;
-use mojimoji_rs::{zen_to_han, han_to_zen};
+
+use crate::amount::{parse_amount_scaled, FormatAmountKwargs, ParseAmountKwargs, MAX_AMOUNT_SCALE};
+use crate::kana::KanaKwargs;
+use crate::kanji::{
+    extract_numerals, parse_integer_part, parse_numeral, replace_numerals_into, ToKanjiKwargs,
+    ToNumberKwargs,
+};
+use crate::normalize::NormalizeKwargs;
+use crate::pipeline::{PipelineBuffers, PipelineKwargs};
+use crate::prefecture::{code_from_number, lookup_code, PrefectureKwargs, PrefectureOutput};
+use crate::wareki::{ParseWarekiAutoKwargs, ParseWarekiKwargs, WarekiPattern};
+use crate::width::WidthKwargs;
+
+/// 変換で変化しない行はそのまま、変化する行だけを `convert` で変換する
+///
+/// 全ての行が変化しない場合は、入力をコピーせずにそのまま返します。
+fn apply_if_changed<'a, F, G>(
+    ca: &'a StringChunked,
+    is_unchanged: F,
+    mut convert: G,
+) -> StringChunked
+where
+    F: Fn(&str) -> bool,
+    G: FnMut(&'a str, &mut String),
+{
+    if ca
+        .into_iter()
+        .all(|opt_val| opt_val.map_or(true, &is_unchanged))
+    {
+        return ca.clone();
+    }
+    ca.apply_into_string_amortized(|val, buf| {
+        if is_unchanged(val) {
+            buf.push_str(val)
+        } else {
+            convert(val, buf)
+        }
+    })
+}
+
+/// 文字列の変換を適用する
+///
+/// Categorical/Enum の場合は、カテゴリの辞書に対してのみ変換を行い、
+/// 物理表現のコードを変換後のカテゴリに付け替えた Categorical を返します。
+/// 変換後に同じ値になったカテゴリは1つにまとめます。
+/// その他の型は文字列に変換してから適用します。
+fn apply_on_dictionary<F>(s: &Series, f: F) -> PolarsResult<Series>
+where
+    F: Fn(&StringChunked) -> StringChunked,
+{
+    match s.dtype() {
+        DataType::String => return Ok(f(s.str()?).into_series()),
+        DataType::Categorical(_, _) | DataType::Enum(_, _) => {}
+        _ => return Ok(f(s.cast(&DataType::String)?.str()?).into_series()),
+    }
+
+    // グローバルなカテゴリの場合もコードがカテゴリの位置を指すようにする
+    let cat = s.categorical()?.to_local();
+    let categories = StringChunked::with_chunk(
+        cat.physical().name().clone(),
+        cat.get_rev_map().get_categories().clone(),
+    );
+    let converted = f(&categories);
+
+    // 変換前のカテゴリの位置 -> 変換後のカテゴリの位置
+    let mut positions: PlHashMap<&str, u32> = PlHashMap::new();
+    let mut new_categories: Vec<&str> = Vec::new();
+    let remap: Vec<u32> = converted
+        .into_iter()
+        .map(|opt_val| {
+            let val = opt_val.unwrap_or_default();
+            *positions.entry(val).or_insert_with(|| {
+                new_categories.push(val);
+                (new_categories.len() - 1) as u32
+            })
+        })
+        .collect();
+
+    let physical = cat
+        .physical()
+        .apply_values(|code| remap.get(code as usize).copied().unwrap_or(0));
+    let rev_map = Arc::new(RevMapping::build_local(Utf8ViewArray::from_slice_values(
+        new_categories,
+    )));
+    // SAFETY: コードは全て new_categories の範囲内
+    let out = unsafe {
+        CategoricalChunked::from_cats_and_rev_map_unchecked(
+            physical,
+            rev_map,
+            false,
+            CategoricalOrdering::default(),
+        )
+    };
+    Ok(out.into_series())
+}
+
+/// 入力が Categorical/Enum の場合は Categorical、それ以外は String を出力する
+fn string_or_categorical(input_fields: &[Field]) -> PolarsResult<Field> {
+    let field = &input_fields[0];
+    let dtype = match field.dtype() {
+        DataType::Categorical(_, _) | DataType::Enum(_, _) => {
+            DataType::Categorical(None, CategoricalOrdering::default())
+        }
+        _ => DataType::String,
+    };
+    Ok(Field::new(field.name().clone(), dtype))
+}
 
 /// 全角→半角変換
-#[polars_expr(output_type=String)]
-pub fn to_half_width(inputs: &[Series]) -> PolarsResult<Series> {
+#[polars_expr(output_type_func=string_or_categorical)]
+pub fn to_half_width(inputs: &[Series], kwargs: WidthKwargs) -> PolarsResult<Series> {
+    apply_on_dictionary(&inputs[0], |ca| {
+        apply_if_changed(
+            ca,
+            |val| kwargs.is_half_width_stable(val),
+            |val, buf| kwargs.zen_to_han_into(val, buf),
+        )
+    })
+}
+
+/// 半角→全角変換
+#[polars_expr(output_type_func=string_or_categorical)]
+fn to_full_width(inputs: &[Series], kwargs: WidthKwargs) -> PolarsResult<Series> {
+    apply_on_dictionary(&inputs[0], |ca| {
+        apply_if_changed(
+            ca,
+            |val| kwargs.is_full_width_stable(val),
+            |val, buf| kwargs.han_to_zen_into(val, buf),
+        )
+    })
+}
+
+/// ひらがな→カタカナ変換
+#[polars_expr(output_type_func=string_or_categorical)]
+fn to_katakana(inputs: &[Series], kwargs: KanaKwargs) -> PolarsResult<Series> {
+    apply_on_dictionary(&inputs[0], |ca| {
+        apply_if_changed(
+            ca,
+            |val| kwargs.is_katakana_stable(val),
+            |val, buf| kwargs.hira_to_kata_into(val, buf),
+        )
+    })
+}
+
+/// カタカナ→ひらがな変換
+#[polars_expr(output_type_func=string_or_categorical)]
+fn to_hiragana(inputs: &[Series], kwargs: KanaKwargs) -> PolarsResult<Series> {
+    apply_on_dictionary(&inputs[0], |ca| {
+        apply_if_changed(
+            ca,
+            |val| kwargs.is_hiragana_stable(val),
+            |val, buf| kwargs.kata_to_hira_into(val, buf),
+        )
+    })
+}
+
+/// 日本語テキストの正規化 (NFKC + 日本語特有の置換ルール)
+#[polars_expr(output_type_func=string_or_categorical)]
+fn normalize(inputs: &[Series], kwargs: NormalizeKwargs) -> PolarsResult<Series> {
+    let profile = kwargs.profile();
+    apply_on_dictionary(&inputs[0], |ca| {
+        apply_if_changed(
+            ca,
+            |val| profile.quick_check(val) == Some(true),
+            |val, buf| profile.normalize_into(val, buf),
+        )
+    })
+}
+
+/// 複数の文字列変換を1回の走査で適用する
+#[polars_expr(output_type_func=string_or_categorical)]
+fn pipeline(inputs: &[Series], kwargs: PipelineKwargs) -> PolarsResult<Series> {
+    let pipeline = kwargs.compile();
+    apply_on_dictionary(&inputs[0], |ca| {
+        let mut buffers = PipelineBuffers::default();
+        apply_if_changed(
+            ca,
+            |val| pipeline.is_unchanged(val),
+            |val, buf| pipeline.apply_into(val, buf, &mut buffers),
+        )
+    })
+}
+
+/// 正規化済みの文字列かどうか
+#[polars_expr(output_type=Boolean)]
+fn is_normalized(inputs: &[Series], kwargs: NormalizeKwargs) -> PolarsResult<Series> {
     let ca = inputs[0].str()?;
-    let out: StringChunked =
-        ca.apply_into_string_amortized(|val, buf| {
-            let half_width = zen_to_han(val.to_string(), true, true, true);
-            buf.push_str(&half_width)
-        });
+    let profile = kwargs.profile();
+    let mut scratch = String::new();
+    let out: BooleanChunked = ca
+        .into_iter()
+        .map(|opt_val| opt_val.map(|val| profile.is_normalized(val, &mut scratch)))
+        .collect();
+    Ok(out.with_name(ca.name().clone()).into_series())
+}
+
+/// 和暦文字列を日付に変換する
+///
+/// 解析できない行は null にします。`raise_error` が真の場合はエラーにします。
+#[polars_expr(output_type=Date)]
+fn to_datetime(inputs: &[Series], kwargs: ParseWarekiKwargs) -> PolarsResult<Series> {
+    let s = inputs[0].cast(&DataType::String)?;
+    let ca = s.str()?;
+    let parser = match kwargs.parser() {
+        Ok(parser) => parser,
+        Err(err) if kwargs.raise_error => polars_bail!(ComputeError: "{}", err),
+        // japanera と同じく、フォーマットのエラーも解析できない行として扱う
+        Err(_) => {
+            return Ok(Series::full_null(
+                ca.name().clone(),
+                ca.len(),
+                &DataType::Date,
+            ));
+        }
+    };
+    let out: Int32Chunked = if kwargs.raise_error {
+        ca.into_iter()
+            .map(|opt_val| {
+                opt_val
+                    .map(|val| {
+                        parser.parse(val).ok_or_else(
+                            || polars_err!(ComputeError: "could not parse '{}' as wareki", val),
+                        )
+                    })
+                    .transpose()
+            })
+            .collect::<PolarsResult<_>>()?
+    } else {
+        ca.into_iter()
+            .map(|opt_val| opt_val.and_then(|val| parser.parse(val)))
+            .collect()
+    };
+    Ok(out.with_name(ca.name().clone()).into_date().into_series())
+}
+
+/// `parse_wareki` の出力は Date、一致したパターンも返す場合は `{date, pattern}` の Struct
+fn parse_wareki_output(
+    input_fields: &[Field],
+    kwargs: ParseWarekiAutoKwargs,
+) -> PolarsResult<Field> {
+    let dtype = if kwargs.return_pattern {
+        DataType::Struct(vec![
+            Field::new("date".into(), DataType::Date),
+            Field::new("pattern".into(), DataType::String),
+        ])
+    } else {
+        DataType::Date
+    };
+    Ok(Field::new(input_fields[0].name().clone(), dtype))
+}
+
+/// フォーマットを指定せずに和暦文字列を日付に変換する
+#[polars_expr(output_type_func_with_kwargs=parse_wareki_output)]
+fn parse_wareki(inputs: &[Series], kwargs: ParseWarekiAutoKwargs) -> PolarsResult<Series> {
+    let s = inputs[0].cast(&DataType::String)?;
+    let ca = s.str()?;
+    let table = kwargs
+        .era_table()
+        .map_err(|err| polars_err!(ComputeError: "{}", err))?;
+    let mut buf = String::new();
+    let parsed: Vec<Option<(i32, WarekiPattern)>> = ca
+        .into_iter()
+        .map(|opt_val| opt_val.and_then(|val| table.parse_auto(val, &mut buf)))
+        .collect();
+
+    let dates: Int32Chunked = parsed.iter().map(|p| p.map(|(days, _)| days)).collect();
+    let dates = dates.into_date().into_series();
+    if !kwargs.return_pattern {
+        return Ok(dates.with_name(ca.name().clone()));
+    }
+    let patterns: StringChunked = parsed
+        .iter()
+        .map(|p| p.map(|(_, pattern)| pattern.as_str()))
+        .collect();
+    let fields = [
+        dates.with_name("date".into()),
+        patterns.into_series().with_name("pattern".into()),
+    ];
+    let out = StructChunked::from_series(ca.name().clone(), ca.len(), fields.iter())?;
     Ok(out.into_series())
 }
 
-/// 半角→全角変換
+/// (整数部分, 0 かどうか) の値を漢数字に変換した String の列を作る
+fn format_kanji<I>(name: PlSmallStr, len: usize, values: I, kwargs: &ToKanjiKwargs) -> Series
+where
+    I: Iterator<Item = Option<(i128, bool)>>,
+{
+    let mut builder = StringChunkedBuilder::new(name, len);
+    let mut buf = String::new();
+    for value in values {
+        match value {
+            Some((number, is_zero)) => {
+                buf.clear();
+                kwargs.format_into(number, is_zero, &mut buf);
+                builder.append_value(&buf);
+            }
+            None => builder.append_null(),
+        }
+    }
+    builder.finish().into_series()
+}
+
+/// 数値を漢数字に変換する
+///
+/// kanjize と同じく小数は 0 方向に切り捨てます。UInt64 と Decimal 型は
+/// Int64 の範囲を超える値 (京, 垓 など) も変換できます。
+/// 数値として扱えない値と、非数・無限大は null にします。
 #[polars_expr(output_type=String)]
-fn to_full_width(inputs: &[Series]) -> PolarsResult<Series> {
-    let ca = inputs[0].str()?;
-    let out: StringChunked =
-        ca.apply_into_string_amortized(|val, buf| {
-            let full_width = han_to_zen(val.to_string(), true, true, true);
-            buf.push_str(&full_width)
-        });
+fn to_kanji(inputs: &[Series], kwargs: ToKanjiKwargs) -> PolarsResult<Series> {
+    let s = &inputs[0];
+    let name = s.name().clone();
+    let len = s.len();
+    let out = match s.dtype() {
+        DataType::UInt64 => {
+            let values = s.u64()?.into_iter().map(|v| v.map(|v| (v as i128, v == 0)));
+            format_kanji(name, len, values, &kwargs)
+        }
+        DataType::Float32 | DataType::Float64 => {
+            let s = s.cast(&DataType::Float64)?;
+            let values = s.f64()?.into_iter().map(|v| {
+                v.filter(|v| v.is_finite() && v.abs() < 1e38)
+                    .map(|v| (v.trunc() as i128, v == 0.0))
+            });
+            format_kanji(name, len, values, &kwargs)
+        }
+        dtype if dtype.is_integer() || dtype.is_bool() => {
+            let s = s.cast(&DataType::Int64)?;
+            let values = s.i64()?.into_iter().map(|v| v.map(|v| (v as i128, v == 0)));
+            format_kanji(name, len, values, &kwargs)
+        }
+        // Decimal 型や文字列は文字列の整数部分を解析する
+        _ => {
+            let s = s.cast(&DataType::String)?;
+            let values = s.str()?.into_iter().map(|v| v.and_then(parse_integer_part));
+            format_kanji(name, len, values, &kwargs)
+        }
+    };
+    Ok(out)
+}
+
+/// `to_number` の出力は Int64、エラーも返す場合は `{value, error}` の Struct
+fn to_number_output(input_fields: &[Field], kwargs: ToNumberKwargs) -> PolarsResult<Field> {
+    let dtype = if kwargs.return_error {
+        DataType::Struct(vec![
+            Field::new("value".into(), DataType::Int64),
+            Field::new("error".into(), DataType::String),
+        ])
+    } else {
+        DataType::Int64
+    };
+    Ok(Field::new(input_fields[0].name().clone(), dtype))
+}
+
+/// 漢数字・アラビア数字・全角数字が混在した文字列を数値に変換する
+///
+/// 解析できない行は null にします。`return_error` が真の場合は、
+/// 解析できない行のエラーの内容も返します。
+#[polars_expr(output_type_func_with_kwargs=to_number_output)]
+fn to_number(inputs: &[Series], kwargs: ToNumberKwargs) -> PolarsResult<Series> {
+    let s = inputs[0].cast(&DataType::String)?;
+    let ca = s.str()?;
+    if !kwargs.return_error {
+        let out: Int64Chunked = ca
+            .into_iter()
+            .map(|opt_val| opt_val.and_then(|val| parse_numeral(val).ok()))
+            .collect();
+        return Ok(out.with_name(ca.name().clone()).into_series());
+    }
+
+    let parsed: Vec<Option<Result<i64, String>>> = ca
+        .into_iter()
+        .map(|opt_val| opt_val.map(|val| parse_numeral(val).map_err(|err| err.to_string())))
+        .collect();
+    let values: Int64Chunked = parsed
+        .iter()
+        .map(|p| p.as_ref().and_then(|r| r.as_ref().ok().copied()))
+        .collect();
+    let errors: StringChunked = parsed
+        .iter()
+        .map(|p| {
+            p.as_ref()
+                .and_then(|r| r.as_ref().err().map(String::as_str))
+        })
+        .collect();
+    let fields = [
+        values.into_series().with_name("value".into()),
+        errors.into_series().with_name("error".into()),
+    ];
+    let out = StructChunked::from_series(ca.name().clone(), ca.len(), fields.iter())?;
     Ok(out.into_series())
 }
+
+fn list_int64_output(input_fields: &[Field]) -> PolarsResult<Field> {
+    Ok(Field::new(
+        input_fields[0].name().clone(),
+        DataType::List(Box::new(DataType::Int64)),
+    ))
+}
+
+/// 文字列の中の数 (漢数字・アラビア数字・全角数字) を Int64 のリストで取り出す
+#[polars_expr(output_type_func=list_int64_output)]
+fn extract_numbers(inputs: &[Series]) -> PolarsResult<Series> {
+    let s = inputs[0].cast(&DataType::String)?;
+    let ca = s.str()?;
+    let mut builder = ListPrimitiveChunkedBuilder::<Int64Type>::new(
+        ca.name().clone(),
+        ca.len(),
+        ca.len(),
+        DataType::Int64,
+    );
+    let mut numbers = Vec::new();
+    for opt_val in ca.into_iter() {
+        match opt_val {
+            Some(val) => {
+                numbers.clear();
+                extract_numerals(val, &mut numbers);
+                builder.append_slice(&numbers);
+            }
+            None => builder.append_null(),
+        }
+    }
+    Ok(builder.finish().into_series())
+}
+
+/// 文字列の中の漢数字・全角数字を含む数を半角のアラビア数字に置き換える
+#[polars_expr(output_type_func=string_or_categorical)]
+fn replace_kanji_numerals(inputs: &[Series]) -> PolarsResult<Series> {
+    apply_on_dictionary(&inputs[0], |ca| {
+        // ASCII だけの文字列には置き換える数がない
+        apply_if_changed(ca, |val| val.is_ascii(), replace_numerals_into)
+    })
+}
+
+fn parse_amount_output(input_fields: &[Field], kwargs: ParseAmountKwargs) -> PolarsResult<Field> {
+    let dtype = match kwargs.scale {
+        Some(scale) => DataType::Decimal(Some(38), Some(scale)),
+        None => DataType::Int64,
+    };
+    Ok(Field::new(input_fields[0].name().clone(), dtype))
+}
+
+/// "1,234円", "１２万円", "1.2億", "△1,234" などの金額の文字列を数値に変換する
+///
+/// 解析できない行と、出力の型の範囲を超える行は null にします。
+#[polars_expr(output_type_func_with_kwargs=parse_amount_output)]
+fn parse_amount(inputs: &[Series], kwargs: ParseAmountKwargs) -> PolarsResult<Series> {
+    let s = inputs[0].cast(&DataType::String)?;
+    let ca = s.str()?;
+    // 全角→半角変換の作業領域は行をまたいで使い回す
+    let mut buf = String::new();
+    let mut parse = |val: &str| {
+        parse_amount_scaled(val, &mut buf)
+            .ok()
+            .map(|scaled| kwargs.unscale(scaled))
+    };
+    let Some(scale) = kwargs.scale else {
+        let out: Int64Chunked = ca
+            .into_iter()
+            .map(|opt_val| {
+                opt_val
+                    .and_then(&mut parse)
+                    .and_then(|v| i64::try_from(v).ok())
+            })
+            .collect();
+        return Ok(out.with_name(ca.name().clone()).into_series());
+    };
+    polars_ensure!(
+        scale <= MAX_AMOUNT_SCALE,
+        InvalidOperation: "Decimal の小数点以下の桁数は {} 以下にしてください", MAX_AMOUNT_SCALE
+    );
+    // Decimal の精度 (38桁) に収まらない値は null
+    let limit = 10i128.pow(38);
+    let out: Int128Chunked = ca
+        .into_iter()
+        .map(|opt_val| opt_val.and_then(&mut parse).filter(|v| v.abs() < limit))
+        .collect();
+    Ok(out
+        .with_name(ca.name().clone())
+        .into_decimal_unchecked(Some(38), scale)
+        .into_series())
+}
+
+/// 金額の値 (10^scale 倍した整数) を金額の表記に変換した String の列を作る
+fn format_amounts<I>(
+    name: PlSmallStr,
+    len: usize,
+    values: I,
+    scale: usize,
+    kwargs: &FormatAmountKwargs,
+) -> Series
+where
+    I: Iterator<Item = Option<i128>>,
+{
+    let mut builder = StringChunkedBuilder::new(name, len);
+    let mut buf = String::new();
+    for value in values {
+        match value {
+            Some(value) => {
+                buf.clear();
+                kwargs.format_into(value, scale, &mut buf);
+                builder.append_value(&buf);
+            }
+            None => builder.append_null(),
+        }
+    }
+    builder.finish().into_series()
+}
+
+/// 数値を "1億2,345万6,789円" などの金額の表記に変換する
+///
+/// 整数型と Decimal 型に対応し、浮動小数点数は 0 方向に切り捨てた整数として
+/// 扱います。非数・無限大は null にします。
+#[polars_expr(output_type=String)]
+fn format_amount(inputs: &[Series], kwargs: FormatAmountKwargs) -> PolarsResult<Series> {
+    let s = &inputs[0];
+    let name = s.name().clone();
+    let len = s.len();
+    let out = match s.dtype() {
+        DataType::Decimal(_, _) => {
+            let ca = s.decimal()?;
+            let physical: &Int128Chunked = ca;
+            format_amounts(name, len, physical.into_iter(), ca.scale(), &kwargs)
+        }
+        DataType::UInt64 => {
+            let values = s.u64()?.into_iter().map(|v| v.map(|v| v as i128));
+            format_amounts(name, len, values, 0, &kwargs)
+        }
+        DataType::Float32 | DataType::Float64 => {
+            let s = s.cast(&DataType::Float64)?;
+            let values = s.f64()?.into_iter().map(|v| {
+                v.filter(|v| v.is_finite() && v.abs() < 1e38)
+                    .map(|v| v.trunc() as i128)
+            });
+            format_amounts(name, len, values, 0, &kwargs)
+        }
+        dtype if dtype.is_integer() => {
+            let s = s.cast(&DataType::Int64)?;
+            let values = s.i64()?.into_iter().map(|v| v.map(|v| v as i128));
+            format_amounts(name, len, values, 0, &kwargs)
+        }
+        dtype => polars_bail!(
+            InvalidOperation: "format_amount は数値の列に対応しています (入力の型: {})", dtype
+        ),
+    };
+    Ok(out)
+}
+
+/// 都道府県コード (1〜47) を求める
+///
+/// 整数型はそのままコードとして扱い、Categorical/Enum の場合はカテゴリの辞書に
+/// 対してのみ照合します。その他の型は文字列に変換してから照合します。
+fn prefecture_codes(s: &Series) -> PolarsResult<UInt8Chunked> {
+    let mut buf = String::new();
+    let codes = match s.dtype() {
+        dtype if dtype.is_integer() => {
+            let s = s.cast(&DataType::Int64)?;
+            s.i64()?
+                .into_iter()
+                .map(|v| v.and_then(code_from_number))
+                .collect()
+        }
+        DataType::Categorical(_, _) | DataType::Enum(_, _) => {
+            // グローバルなカテゴリの場合もコードがカテゴリの位置を指すようにする
+            let cat = s.categorical()?.to_local();
+            let lookup: Vec<Option<u8>> = cat
+                .get_rev_map()
+                .get_categories()
+                .values_iter()
+                .map(|val| lookup_code(val, &mut buf))
+                .collect();
+            cat.physical()
+                .into_iter()
+                .map(|v| v.and_then(|code| lookup.get(code as usize).copied().flatten()))
+                .collect()
+        }
+        _ => {
+            let s = s.cast(&DataType::String)?;
+            s.str()?
+                .into_iter()
+                .map(|v| v.and_then(|val| lookup_code(val, &mut buf)))
+                .collect()
+        }
+    };
+    Ok(codes)
+}
+
+fn prefecture_output(input_fields: &[Field], kwargs: PrefectureKwargs) -> PolarsResult<Field> {
+    let dtype = match kwargs.output {
+        PrefectureOutput::Code => DataType::Int64,
+        PrefectureOutput::Index | PrefectureOutput::Region => DataType::UInt32,
+        PrefectureOutput::Hiragana | PrefectureOutput::Katakana => DataType::String,
+    };
+    Ok(Field::new(input_fields[0].name().clone(), dtype))
+}
+
+/// 都道府県名 (漢字・ひらがな・カタカナ・ローマ字・コード) を都道府県コードや各表記に変換する
+///
+/// 漢字表記・ローマ字表記・地方名は、Python 側で Enum に変換するための
+/// 物理表現 (Enum のカテゴリの位置) を返します。
+#[polars_expr(output_type_func_with_kwargs=prefecture_output)]
+fn resolve_prefecture(inputs: &[Series], kwargs: PrefectureKwargs) -> PolarsResult<Series> {
+    let s = &inputs[0];
+    let codes = prefecture_codes(s)?;
+    let out = match kwargs.output {
+        PrefectureOutput::Code => codes.cast(&DataType::Int64)?,
+        output @ (PrefectureOutput::Index | PrefectureOutput::Region) => {
+            let positions: UInt32Chunked = codes
+                .into_iter()
+                .map(|v| v.map(|code| output.position(code)))
+                .collect();
+            positions.into_series()
+        }
+        output => {
+            let names: StringChunked = codes
+                .into_iter()
+                .map(|v| v.map(|code| output.name(code)))
+                .collect();
+            names.into_series()
+        }
+    };
+    Ok(out.with_name(s.name().clone()))
+}
@@ -0,0 +1,130 @@
+use serde::Deserialize;
+
+/// ひらがなとカタカナのコードポイントの差
+const KANA_OFFSET: u32 = 0x60;
+/// 結合文字の濁点
+const COMBINING_TEN: char = '\u{3099}';
+/// ひらがなに対応する文字がないカタカナ (ヷヸヹヺ) と、濁点を除いたひらがな
+const KATA_WITH_TEN: [(char, char); 4] = [('ヷ', 'わ'), ('ヸ', 'ゐ'), ('ヹ', 'ゑ'), ('ヺ', 'を')];
+
+/// すべての文字を変換する設定 (都道府県名の照合などで使う)
+const ALL_KANA: KanaKwargs = KanaKwargs {
+    ignore: String::new(),
+};
+
+/// ひらがなをカタカナにした文字 (その他の文字はそのまま)
+#[inline]
+pub fn hiragana_to_katakana_char(c: char) -> char {
+    ALL_KANA.hira_to_kata_char(c).unwrap_or(c)
+}
+
+/// `to_katakana` / `to_hiragana` プラグインの引数
+#[derive(Deserialize)]
+pub struct KanaKwargs {
+    /// 変換しない文字
+    ignore: String,
+}
+
+impl KanaKwargs {
+    #[inline]
+    fn is_ignored(&self, c: char) -> bool {
+        !self.ignore.is_empty() && self.ignore.contains(c)
+    }
+
+    /// ひらがな→カタカナの1文字の変換結果
+    #[inline]
+    fn hira_to_kata_char(&self, c: char) -> Option<char> {
+        let converted = match c {
+            // ぁ〜ゖ (ゔ, ゕ, ゖ を含む) と 踊り字 ゝ, ゞ
+            '\u{3041}'..='\u{3096}' | 'ゝ' | 'ゞ' => char::from_u32(c as u32 + KANA_OFFSET),
+            _ => None,
+        };
+        converted.filter(|_| !self.is_ignored(c))
+    }
+
+    /// カタカナ→ひらがなの1文字の変換結果
+    #[inline]
+    fn kata_to_hira_char(&self, c: char) -> Option<char> {
+        let converted = match c {
+            // ァ〜ヶ (ヴ, ヵ, ヶ を含む) と 踊り字 ヽ, ヾ
+            '\u{30A1}'..='\u{30F6}' | 'ヽ' | 'ヾ' => char::from_u32(c as u32 - KANA_OFFSET),
+            _ => None,
+        };
+        converted.filter(|_| !self.is_ignored(c))
+    }
+
+    /// ひらがな→カタカナ変換の結果を `buf` に書き込む
+    ///
+    /// わ, ゐ, ゑ, を に続く結合文字の濁点は ヷ, ヸ, ヹ, ヺ の1文字に結合します。
+    pub fn hira_to_kata_into(&self, val: &str, buf: &mut String) {
+        // 直前の文字 (結合の対象となる変換前のひらがな)
+        let mut prev: Option<char> = None;
+        for c in val.chars() {
+            if c == COMBINING_TEN {
+                if let Some(combined) = prev.and_then(|p| {
+                    KATA_WITH_TEN
+                        .iter()
+                        .find(|(_, hira)| *hira == p)
+                        .map(|(kata, _)| *kata)
+                }) {
+                    buf.pop();
+                    buf.push(combined);
+                    prev = None;
+                    continue;
+                }
+            }
+            match self.hira_to_kata_char(c) {
+                Some(k) => {
+                    buf.push(k);
+                    prev = Some(c);
+                }
+                None => {
+                    buf.push(c);
+                    prev = None;
+                }
+            }
+        }
+    }
+
+    /// カタカナ→ひらがな変換の結果を `buf` に書き込む
+    ///
+    /// ヷ, ヸ, ヹ, ヺ はひらがなと結合文字の濁点の2文字に変換します。
+    pub fn kata_to_hira_into(&self, val: &str, buf: &mut String) {
+        for c in val.chars() {
+            match self.kata_to_hira_char(c) {
+                Some(h) => buf.push(h),
+                None => match self.decompose_kata_with_ten(c) {
+                    Some(h) => {
+                        buf.push(h);
+                        buf.push(COMBINING_TEN);
+                    }
+                    None => buf.push(c),
+                },
+            }
+        }
+    }
+
+    #[inline]
+    fn decompose_kata_with_ten(&self, c: char) -> Option<char> {
+        if !('ヷ'..='ヺ').contains(&c) || self.is_ignored(c) {
+            return None;
+        }
+        KATA_WITH_TEN
+            .iter()
+            .find(|(kata, _)| *kata == c)
+            .map(|(_, hira)| *hira)
+    }
+
+    /// ひらがな→カタカナ変換で変化しない文字列かどうか
+    pub fn is_katakana_stable(&self, val: &str) -> bool {
+        val.is_ascii() || !val.chars().any(|c| self.hira_to_kata_char(c).is_some())
+    }
+
+    /// カタカナ→ひらがな変換で変化しない文字列かどうか
+    pub fn is_hiragana_stable(&self, val: &str) -> bool {
+        val.is_ascii()
+            || !val.chars().any(|c| {
+                self.kata_to_hira_char(c).is_some() || self.decompose_kata_with_ten(c).is_some()
+            })
+    }
+}
@@ -0,0 +1,590 @@
+use std::fmt::Write;
+
+use serde::Deserialize;
+
+/// 漢数字 (小字) の数字 (0 は `zero` の文字を使うため、先頭は使わない)
+const SHOJI_DIGITS: [char; 10] = ['〇', '一', '二', '三', '四', '五', '六', '七', '八', '九'];
+/// 漢数字 (大字) の数字
+pub const DAIJI_DIGITS: [char; 10] = ['〇', '壱', '弐', '参', '肆', '伍', '陸', '漆', '捌', '玖'];
+/// 十, 百, 千 (小字)
+const SHOJI_LITTLE_UNITS: [char; 3] = ['十', '百', '千'];
+/// 拾, 佰, 阡 (大字)
+pub const DAIJI_LITTLE_UNITS: [char; 3] = ['拾', '佰', '阡'];
+/// 1万 (10^4) ごとの位の名前 (i128 の範囲で使う 澗 (10^36) まで)
+///
+/// 万の位は大字の場合に 萬 になります。
+pub const LARGE_UNITS: [&str; 10] = ["", "万", "億", "兆", "京", "垓", "𥝱", "穣", "溝", "澗"];
+
+/// kanjize の `KanjizeStyle`
+#[derive(Deserialize, Clone, Copy, PartialEq, Eq)]
+#[serde(rename_all = "lowercase")]
+pub enum KanjiStyle {
+    /// すべて漢数字 ("四億五千二百三十万三千")
+    All,
+    /// アラビア数字と漢数字の混在 ("4億5230万3千")
+    Mixed,
+    /// 1桁ずつ漢数字 ("六〇一")
+    Flat,
+}
+
+/// `to_kanji` プラグインの引数 (kanjize の `KanjizeConfiguration` と同じ設定)
+#[derive(Deserialize)]
+pub struct ToKanjiKwargs {
+    style: KanjiStyle,
+    /// 0 を表す文字 ("零" または "〇")
+    zero: String,
+    /// `Mixed` の場合に、千の倍数の位を "3千" のように表すかどうか
+    kanji_thousand: bool,
+    /// 大字 (壱, 弐, 参, ..., 拾, 佰, 阡, 萬) を使うかどうか
+    use_daiji: bool,
+}
+
+impl ToKanjiKwargs {
+    fn digits(&self) -> &[char; 10] {
+        if self.use_daiji {
+            &DAIJI_DIGITS
+        } else {
+            &SHOJI_DIGITS
+        }
+    }
+
+    fn little_units(&self) -> &[char; 3] {
+        if self.use_daiji {
+            &DAIJI_LITTLE_UNITS
+        } else {
+            &SHOJI_LITTLE_UNITS
+        }
+    }
+
+    fn large_unit(&self, i: usize) -> &'static str {
+        if i == 1 && self.use_daiji {
+            "萬"
+        } else {
+            LARGE_UNITS[i]
+        }
+    }
+
+    /// 数値を漢数字に変換した結果を `buf` に書き込む
+    ///
+    /// `number` は整数部分 (0 方向に切り捨てた値) で、`is_zero` は切り捨てる前の値が
+    /// 0 かどうかです。kanjize と同じく、0 の場合だけ `zero` を返し、
+    /// 切り捨てて 0 になった値 (0.5 など) は `All`, `Mixed` では空文字列になります。
+    pub fn format_into(&self, number: i128, is_zero: bool, buf: &mut String) {
+        if is_zero {
+            buf.push_str(&self.zero);
+            return;
+        }
+        if number < 0 {
+            buf.push('-');
+        }
+        let number = number.unsigned_abs();
+
+        match self.style {
+            KanjiStyle::All => {
+                let digits = self.digits();
+                let little_units = self.little_units();
+                for (i, group) in groups(number) {
+                    let start = buf.len();
+                    // 千, 百, 十 の位 (1 の場合は "一" を付けない)
+                    for (unit, place) in [(2, 1000), (1, 100), (0, 10)] {
+                        let d = (group / place % 10) as usize;
+                        if d > 1 {
+                            buf.push(digits[d]);
+                        }
+                        if d > 0 {
+                            buf.push(little_units[unit]);
+                        }
+                    }
+                    let ones = (group % 10) as usize;
+                    if ones > 0 {
+                        buf.push(digits[ones]);
+                    }
+                    if buf.len() > start {
+                        buf.push_str(self.large_unit(i));
+                    }
+                }
+            }
+            KanjiStyle::Mixed => {
+                for (i, group) in groups(number) {
+                    if self.kanji_thousand && group >= 1000 && group % 1000 == 0 {
+                        push_number(buf, group / 1000);
+                        buf.push(self.little_units()[2]);
+                    } else {
+                        push_number(buf, group);
+                    }
+                    buf.push_str(self.large_unit(i));
+                }
+            }
+            KanjiStyle::Flat => {
+                let digits = self.digits();
+                let mut places = [0u8; 39];
+                let mut len = 0;
+                let mut rest = number;
+                loop {
+                    places[len] = (rest % 10) as u8;
+                    rest /= 10;
+                    len += 1;
+                    if rest == 0 {
+                        break;
+                    }
+                }
+                for &d in places[..len].iter().rev() {
+                    if d == 0 {
+                        buf.push_str(&self.zero);
+                    } else {
+                        buf.push(digits[d as usize]);
+                    }
+                }
+            }
+        }
+    }
+}
+
+/// 上の位から順に、0 でない1万ごとの位 (位の番号, 値) を返す
+pub fn groups(number: u128) -> impl Iterator<Item = (usize, u32)> {
+    let mut values = [0u32; LARGE_UNITS.len()];
+    let mut rest = number;
+    let mut len = 0;
+    while rest > 0 {
+        values[len] = (rest % 10000) as u32;
+        rest /= 10000;
+        len += 1;
+    }
+    (0..len)
+        .rev()
+        .map(move |i| (i, values[i]))
+        .filter(|(_, group)| *group > 0)
+}
+
+/// アラビア数字で書き込む
+fn push_number(buf: &mut String, number: impl Into<u128>) {
+    use std::fmt::Write;
+    let _ = write!(buf, "{}", number.into());
+}
+
+/// 整数部分の文字列 ("-123.45" など) を (0 方向に切り捨てた値, 0 かどうか) に変換する
+///
+/// Decimal 型や文字列の入力に使います。i128 の範囲外や数値でない場合は None です。
+pub fn parse_integer_part(val: &str) -> Option<(i128, bool)> {
+    let val = val.trim();
+    let (int_part, frac_part) = val.split_once('.').unwrap_or((val, ""));
+    let digits = int_part.trim_start_matches(['-', '+']);
+    if int_part.len() - digits.len() > 1
+        || !frac_part.bytes().all(|b| b.is_ascii_digit())
+        || !digits.bytes().all(|b| b.is_ascii_digit())
+        || (digits.is_empty() && frac_part.is_empty())
+    {
+        return None;
+    }
+    let number = if digits.is_empty() {
+        0
+    } else {
+        int_part.parse::<i128>().ok()?
+    };
+    let is_zero = number == 0 && frac_part.bytes().all(|b| b == b'0');
+    Some((number, is_zero))
+}
+
+/// `to_number` プラグインの引数
+#[derive(Deserialize)]
+pub struct ToNumberKwargs {
+    /// 行ごとのエラーも返すかどうか
+    pub return_error: bool,
+}
+
+/// 漢数字の文字の種類
+#[derive(Clone, Copy, PartialEq, Eq)]
+pub enum NumeralChar {
+    /// 数字 (アラビア数字・全角数字・漢数字・大字)
+    Digit(u8),
+    /// 十, 百, 千 (の大字) の倍数
+    SmallUnit(i128),
+    /// 万, 億, 兆, ... の 10 の指数
+    LargeUnit(u32),
+    /// 小数点
+    Point,
+    /// 桁区切りのカンマ
+    Comma,
+}
+
+impl NumeralChar {
+    pub fn classify(c: char) -> Option<Self> {
+        use NumeralChar::*;
+        let kind = match c {
+            '0'..='9' => Digit(c as u8 - b'0'),
+            '０'..='９' => Digit((c as u32 - '０' as u32) as u8),
+            '〇' | '零' => Digit(0),
+            '一' | '壱' | '壹' | '弌' => Digit(1),
+            '二' | '弐' | '貳' | '弍' => Digit(2),
+            '三' | '参' | '參' | '弎' => Digit(3),
+            '四' | '肆' => Digit(4),
+            '五' | '伍' => Digit(5),
+            '六' | '陸' => Digit(6),
+            '七' | '漆' | '柒' => Digit(7),
+            '八' | '捌' => Digit(8),
+            '九' | '玖' => Digit(9),
+            '十' | '拾' | '什' => SmallUnit(10),
+            '百' | '陌' | '佰' => SmallUnit(100),
+            '千' | '阡' | '仟' => SmallUnit(1000),
+            '万' | '萬' => LargeUnit(4),
+            '億' => LargeUnit(8),
+            '兆' => LargeUnit(12),
+            '京' => LargeUnit(16),
+            '垓' => LargeUnit(20),
+            '.' | '．' => Point,
+            ',' | '，' => Comma,
+            _ => return None,
+        };
+        Some(kind)
+    }
+
+    /// アラビア数字 (半角・全角) かどうか
+    fn is_arabic_digit(c: char) -> bool {
+        c.is_ascii_digit() || ('０'..='９').contains(&c)
+    }
+}
+
+/// 漢数字の解析のエラー
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub enum NumeralError {
+    /// 空文字列
+    Empty,
+    /// 数値として解釈できない文字
+    InvalidChar(char),
+    /// 数のない単位 ("億" など)
+    MissingNumber(char),
+    /// 大きい単位・数が小さい単位の後に続いている ("千二千", "万三億" など)
+    InvalidOrder(char),
+    /// Int64 の範囲外
+    OutOfRange,
+}
+
+impl std::fmt::Display for NumeralError {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        match self {
+            NumeralError::Empty => write!(f, "空文字列です"),
+            NumeralError::InvalidChar(c) => write!(f, "数値として解釈できない文字です: '{}'", c),
+            NumeralError::MissingNumber(c) => write!(f, "単位の前に数がありません: '{}'", c),
+            NumeralError::InvalidOrder(c) => {
+                write!(f, "単位または数の順序が正しくありません: '{}'", c)
+            }
+            NumeralError::OutOfRange => write!(f, "Int64 の範囲を超えています"),
+        }
+    }
+}
+
+/// 小数を扱うための固定小数点の倍率 (小数第18位まで)
+pub const SCALE: i128 = 1_000_000_000_000_000_000;
+/// 小数点以下の桁数の上限
+pub const MAX_FRACTION_DIGITS: u32 = 18;
+
+/// 単位の前の数 (固定小数点)
+#[derive(Default)]
+struct Coefficient {
+    /// SCALE 倍した値
+    value: i128,
+    /// 小数点以下の桁数 (小数点がない場合は None)
+    fraction_digits: Option<u32>,
+}
+
+impl Coefficient {
+    fn push_digit(&mut self, d: u8) -> Result<(), NumeralError> {
+        match self.fraction_digits.as_mut() {
+            None => {
+                self.value = self
+                    .value
+                    .checked_mul(10)
+                    .and_then(|v| v.checked_add(d as i128 * SCALE))
+                    .ok_or(NumeralError::OutOfRange)?;
+            }
+            Some(n) if *n < MAX_FRACTION_DIGITS => {
+                *n += 1;
+                self.value += d as i128 * SCALE / 10i128.pow(*n);
+            }
+            // 小数第18位より下は切り捨てる
+            Some(_) => {}
+        }
+        Ok(())
+    }
+}
+
+/// 漢数字の解析の途中の状態
+///
+/// 数は 1万ごとの区切り (section) ごとに、千・百・十の項の和として求め、
+/// 区切りの値に万・億などの単位を掛けて合計します。
+#[derive(Default)]
+struct NumeralParser {
+    /// 確定した区切りの合計 (SCALE 倍)
+    total: i128,
+    /// 現在の区切りの、確定した項の和 (SCALE 倍)
+    section: i128,
+    /// 現在の区切りに数や単位があるかどうか
+    section_has_value: bool,
+    /// 数字または十, 百, 千 があったかどうか ("." だけの文字列は不正)
+    has_number: bool,
+    /// 現在の区切りの直前の小さい単位
+    last_small: Option<i128>,
+    /// 直前の大きい単位の指数
+    last_large: Option<u32>,
+    /// 単位の前の数
+    coefficient: Option<Coefficient>,
+}
+
+impl NumeralParser {
+    fn push_digit(&mut self, d: u8) -> Result<(), NumeralError> {
+        self.section_has_value = true;
+        self.has_number = true;
+        self.coefficient
+            .get_or_insert_with(Default::default)
+            .push_digit(d)
+    }
+
+    fn push_point(&mut self, c: char) -> Result<(), NumeralError> {
+        // ".5" のように整数部分を省略した小数も受け付ける
+        let coefficient = self.coefficient.get_or_insert_with(Default::default);
+        if coefficient.fraction_digits.is_some() {
+            return Err(NumeralError::InvalidChar(c));
+        }
+        coefficient.fraction_digits = Some(0);
+        self.section_has_value = true;
+        Ok(())
+    }
+
+    /// 項 (数 × 小さい単位) を現在の区切りに加える
+    fn push_term(&mut self, term: i128, c: char) -> Result<(), NumeralError> {
+        // 項は直前の小さい単位より小さくなければならない ("千二千" などは不正)
+        if self.last_small.is_some_and(|last| term >= last * SCALE) {
+            return Err(NumeralError::InvalidOrder(c));
+        }
+        self.section += term;
+        Ok(())
+    }
+
+    fn push_small_unit(&mut self, unit: i128, c: char) -> Result<(), NumeralError> {
+        // 数のない十, 百, 千 は 1 を省略したもの
+        let value = self.coefficient.take().map_or(SCALE, |coef| coef.value);
+        let term = value.checked_mul(unit).ok_or(NumeralError::OutOfRange)?;
+        self.push_term(term, c)?;
+        self.last_small = Some(unit);
+        self.section_has_value = true;
+        self.has_number = true;
+        Ok(())
+    }
+
+    /// 現在の区切りを確定して、区切りの値を返す
+    fn take_section(&mut self, c: char) -> Result<i128, NumeralError> {
+        if let Some(coef) = self.coefficient.take() {
+            self.push_term(coef.value, c)?;
+        }
+        self.last_small = None;
+        self.section_has_value = false;
+        Ok(std::mem::take(&mut self.section))
+    }
+
+    fn push_large_unit(&mut self, power: u32, c: char) -> Result<(), NumeralError> {
+        if !self.section_has_value {
+            return Err(NumeralError::MissingNumber(c));
+        }
+        if self.last_large.is_some_and(|last| last <= power) {
+            return Err(NumeralError::InvalidOrder(c));
+        }
+        let section = self.take_section(c)?;
+        self.push_section(section, power, c)?;
+        self.last_large = Some(power);
+        Ok(())
+    }
+
+    /// 区切りの値に単位を掛けて合計に加える
+    fn push_section(&mut self, section: i128, power: u32, c: char) -> Result<(), NumeralError> {
+        let value = 10i128
+            .checked_pow(power)
+            .and_then(|unit| section.checked_mul(unit))
+            .ok_or(NumeralError::OutOfRange)?;
+        // 区切りの値は直前の大きい単位より小さくなければならない ("1万12345" などは不正)
+        if let Some(last) = self.last_large {
+            if value >= 10i128.pow(last) * SCALE {
+                return Err(NumeralError::InvalidOrder(c));
+            }
+        }
+        self.total = self
+            .total
+            .checked_add(value)
+            .ok_or(NumeralError::OutOfRange)?;
+        Ok(())
+    }
+
+    /// 解析を終えて、SCALE 倍した値を返す
+    fn finish(mut self, last_char: char) -> Result<i128, NumeralError> {
+        if !self.has_number {
+            return Err(NumeralError::InvalidChar(last_char));
+        }
+        let section = self.take_section(last_char)?;
+        self.push_section(section, 0, last_char)?;
+        Ok(self.total)
+    }
+}
+
+/// 漢数字・アラビア数字・全角数字が混在した数を解析する
+///
+/// "1万2千", "一二三" (1桁ずつの漢数字), "壱萬弐阡", "１２万", "1,200万",
+/// "1.5万" などを解析します。先頭の符号 (-, ＋ など) と前後の空白は無視します。
+/// 小数は 0 方向に切り捨てます。
+pub fn parse_numeral(val: &str) -> Result<i64, NumeralError> {
+    let val = val.trim();
+    let (negative, body) = match val.chars().next() {
+        Some(c @ ('-' | '－' | '−' | '⁻' | '+' | '＋' | '⁺')) => {
+            (matches!(c, '-' | '－' | '−' | '⁻'), &val[c.len_utf8()..])
+        }
+        _ => (false, val),
+    };
+    let value = parse_unsigned(body)?;
+    let value = if negative { -value } else { value };
+    i64::try_from(value).map_err(|_| NumeralError::OutOfRange)
+}
+
+/// 符号のない数を解析する (小数は 0 方向に切り捨て)
+pub fn parse_unsigned(val: &str) -> Result<i128, NumeralError> {
+    parse_scaled(val).map(|value| value / SCALE)
+}
+
+/// 符号のない数を解析して、SCALE 倍した値を返す
+pub fn parse_scaled(val: &str) -> Result<i128, NumeralError> {
+    let mut parser = NumeralParser::default();
+    let mut prev: Option<char> = None;
+    let mut chars = val.chars().peekable();
+    while let Some(c) = chars.next() {
+        match NumeralChar::classify(c) {
+            Some(NumeralChar::Digit(d)) => parser.push_digit(d)?,
+            Some(NumeralChar::SmallUnit(unit)) => parser.push_small_unit(unit, c)?,
+            Some(NumeralChar::LargeUnit(power)) => parser.push_large_unit(power, c)?,
+            Some(NumeralChar::Point) => parser.push_point(c)?,
+            // 桁区切りはアラビア数字の間だけ
+            Some(NumeralChar::Comma) => {
+                let between_digits = prev.is_some_and(NumeralChar::is_arabic_digit)
+                    && chars
+                        .peek()
+                        .is_some_and(|&next| NumeralChar::is_arabic_digit(next));
+                if !between_digits {
+                    return Err(NumeralError::InvalidChar(c));
+                }
+            }
+            None => return Err(NumeralError::InvalidChar(c)),
+        }
+        prev = Some(c);
+    }
+    match prev {
+        Some(last) => parser.finish(last),
+        None => Err(NumeralError::Empty),
+    }
+}
+
+/// 文字列の中で見つかった数
+pub struct NumeralSpan {
+    /// 開始位置 (バイト)
+    pub start: usize,
+    /// 終了位置 (バイト)
+    pub end: usize,
+    /// SCALE 倍した値
+    scaled: i128,
+}
+
+impl NumeralSpan {
+    /// 値 (小数は 0 方向に切り捨て)
+    pub fn value(&self) -> i128 {
+        self.scaled / SCALE
+    }
+
+    /// 値が整数かどうか
+    pub fn is_integer(&self) -> bool {
+        self.scaled % SCALE == 0
+    }
+}
+
+/// 文字列の中の数を先頭から順に探し、見つかった数ごとに `f` を呼ぶ
+///
+/// 数字・漢数字・単位が連続する部分を1つの数とし、`to_number` と同じ文法で
+/// 解析します。小数点は数字の間、桁区切りのカンマはアラビア数字の間にある
+/// 場合だけ数の一部とし、小数点が2つ以上ある場合 ("2024.1.5" など) は
+/// 小数点で区切った別々の数とします。符号は扱わず ("1-2-3" は 1, 2, 3)、
+/// 解析できない部分 ("万一" など) は数として扱いません。
+pub fn scan_numerals<F: FnMut(NumeralSpan)>(val: &str, mut f: F) {
+    let is_digit = |c: char| matches!(NumeralChar::classify(c), Some(NumeralChar::Digit(_)));
+    // 数の開始位置と小数点の数
+    let mut run: Option<(usize, usize)> = None;
+    let mut prev: Option<char> = None;
+    let mut chars = val.char_indices().peekable();
+    while let Some((i, c)) = chars.next() {
+        let next = chars.peek().map(|&(_, next)| next);
+        let kind = NumeralChar::classify(c);
+        let in_run = match kind {
+            Some(NumeralChar::Point) => prev.is_some_and(is_digit) && next.is_some_and(is_digit),
+            Some(NumeralChar::Comma) => {
+                prev.is_some_and(NumeralChar::is_arabic_digit)
+                    && next.is_some_and(NumeralChar::is_arabic_digit)
+            }
+            Some(_) => true,
+            None => false,
+        };
+        if in_run {
+            let (_, points) = run.get_or_insert((i, 0));
+            if kind == Some(NumeralChar::Point) {
+                *points += 1;
+            }
+            prev = Some(c);
+        } else {
+            if let Some((start, points)) = run.take() {
+                scan_run(val, start, i, points, &mut f);
+            }
+            prev = None;
+        }
+    }
+    if let Some((start, points)) = run {
+        scan_run(val, start, val.len(), points, &mut f);
+    }
+}
+
+/// 数の候補の部分 `val[start..end]` を解析する
+fn scan_run<F: FnMut(NumeralSpan)>(val: &str, start: usize, end: usize, points: usize, f: &mut F) {
+    let mut emit = |start: usize, end: usize| {
+        if let Ok(scaled) = parse_scaled(&val[start..end]) {
+            f(NumeralSpan { start, end, scaled });
+        }
+    };
+    if points < 2 {
+        emit(start, end);
+        return;
+    }
+    let mut part_start = start;
+    for (i, c) in val[start..end].char_indices() {
+        if NumeralChar::classify(c) == Some(NumeralChar::Point) {
+            emit(part_start, start + i);
+            part_start = start + i + c.len_utf8();
+        }
+    }
+    emit(part_start, end);
+}
+
+/// 文字列の中の数を Int64 の範囲で取り出す
+pub fn extract_numerals(val: &str, out: &mut Vec<i64>) {
+    scan_numerals(val, |span| {
+        if let Ok(value) = i64::try_from(span.value()) {
+            out.push(value);
+        }
+    });
+}
+
+/// 文字列の中の漢数字・全角数字を含む数を半角のアラビア数字に置き換える
+///
+/// 半角のアラビア数字だけの数と、整数でない数 ("１．５" など) はそのままにします。
+pub fn replace_numerals_into(val: &str, buf: &mut String) {
+    let mut last = 0;
+    scan_numerals(val, |span| {
+        if !span.is_integer() || val[span.start..span.end].is_ascii() {
+            return;
+        }
+        buf.push_str(&val[last..span.start]);
+        write!(buf, "{}", span.value()).unwrap();
+        last = span.end;
+    });
+    buf.push_str(&val[last..]);
+}
@@ -1,6 +1,14 @@
 use pyo3::prelude::*;
 
+mod amount;
 mod expressions;
+mod kana;
+mod kanji;
+mod normalize;
+mod pipeline;
+mod prefecture;
+mod wareki;
+mod width;
 
 #[pymodule]
 #[pyo3(name="polars_japanese")]
@@ -0,0 +1,347 @@
+use std::collections::HashMap;
+use std::sync::{Arc, LazyLock, RwLock};
+
+use serde::Deserialize;
+use unicode_normalization::{is_nfkc_quick, IsNormalized, UnicodeNormalization};
+
+/// NFKC後の文字に適用する既定の置換ルール
+///
+/// `str.normalize("NFKC")` に続けて `str.replace_all` を繰り返していた
+/// 従来の実装と同じ結果になるように定義しています。
+const DEFAULT_RULES: &[(char, &str)] = &[
+    // 長音記号の統一（全角'ー'に）
+    ('〜', "ー"),
+    ('～', "ー"),
+    ('﹣', "ー"),
+    ('－', "ー"),
+    ('—', "ー"),
+    ('―', "ー"),
+    ('━', "ー"),
+    ('─', "ー"),
+    // ハイフン類の統一（半角'-'に）
+    ('‐', "-"),
+    ('˗', "-"),
+    ('֊', "-"),
+    ('‑', "-"),
+    ('‒', "-"),
+    ('–', "-"),
+    ('⁃', "-"),
+    ('⁻', "-"),
+    ('₋', "-"),
+    ('−', "-"),
+    // クォートの統一
+    ('"', "``"),
+    // 感嘆符・疑問符を半角に
+    ('！', "!"),
+    ('？', "?"),
+];
+
+static DEFAULT_TABLE: LazyLock<CharTable> = LazyLock::new(|| {
+    let mut table = CharTable::default();
+    for (c, to) in DEFAULT_RULES {
+        table.insert(*c, to);
+    }
+    table
+});
+
+/// コンパイル済みプロファイルのキャッシュ (キーはPython側で設定内容から生成)
+static PROFILES: LazyLock<RwLock<HashMap<String, Arc<NormalizeProfile>>>> =
+    LazyLock::new(|| RwLock::new(HashMap::new()));
+
+/// 1文字を文字列に置換するための変換テーブル
+///
+/// BMPの文字は配列で、それ以外の文字はハッシュマップで引きます。
+#[derive(Default)]
+struct CharTable {
+    bmp: Vec<u32>,
+    astral: HashMap<char, u32>,
+    replacements: Vec<Box<str>>,
+}
+
+impl CharTable {
+    fn insert(&mut self, c: char, to: &str) {
+        if self.bmp.is_empty() {
+            self.bmp = vec![0; 0x10000];
+        }
+        self.replacements.push(to.into());
+        let idx = self.replacements.len() as u32;
+        let cp = c as u32;
+        if cp < 0x10000 {
+            self.bmp[cp as usize] = idx;
+        } else {
+            self.astral.insert(c, idx);
+        }
+    }
+
+    #[inline]
+    fn get(&self, c: char) -> Option<&str> {
+        if self.replacements.is_empty() {
+            return None;
+        }
+        let cp = c as u32;
+        let idx = if cp < 0x10000 {
+            self.bmp[cp as usize]
+        } else {
+            self.astral.get(&c).copied().unwrap_or(0)
+        };
+        match idx {
+            0 => None,
+            idx => Some(&self.replacements[idx as usize - 1]),
+        }
+    }
+
+    fn is_empty(&self) -> bool {
+        self.replacements.is_empty()
+    }
+}
+
+/// `normalize` プラグインの引数
+#[derive(Deserialize)]
+pub struct NormalizeKwargs {
+    /// プロファイル名と設定内容のハッシュから作られるキャッシュキー
+    key: String,
+    /// NFKC前に入力文字へ適用するユーザー定義の置換
+    mapping: HashMap<String, String>,
+    collapse_prolonged_sound_mark: bool,
+    remove_space_between_japanese: bool,
+}
+
+impl NormalizeKwargs {
+    /// キーに対応するコンパイル済みのプロファイルを返す
+    ///
+    /// 未コンパイルの場合はコンパイルしてキャッシュします。
+    pub fn profile(&self) -> Arc<NormalizeProfile> {
+        {
+            let profiles = PROFILES.read().unwrap();
+            if let Some(profile) = profiles.get(&self.key) {
+                return profile.clone();
+            }
+        }
+        let profile = Arc::new(NormalizeProfile::compile(self));
+        PROFILES
+            .write()
+            .unwrap()
+            .entry(self.key.clone())
+            .or_insert(profile)
+            .clone()
+    }
+}
+
+/// 正規化プロファイル
+///
+/// 既定ルールにユーザー定義の置換とオプションを加えたもので、
+/// 1回の走査で全てのルールを適用します。
+pub struct NormalizeProfile {
+    /// NFKC前に入力文字へ適用する置換 (置換結果にはNFKC・既定ルールを適用しない)
+    mapping: CharTable,
+    /// 連続する長音記号'ー'を1つにまとめる
+    collapse_prolonged_sound_mark: bool,
+    /// 日本語の文字同士、日本語と半角英数字の間の空白を削除する
+    remove_space_between_japanese: bool,
+}
+
+impl NormalizeProfile {
+    fn compile(kwargs: &NormalizeKwargs) -> Self {
+        let mut mapping = CharTable::default();
+        for (from, to) in &kwargs.mapping {
+            if let Some(c) = from.chars().next() {
+                mapping.insert(c, to);
+            }
+        }
+        Self {
+            mapping,
+            collapse_prolonged_sound_mark: kwargs.collapse_prolonged_sound_mark,
+            remove_space_between_japanese: kwargs.remove_space_between_japanese,
+        }
+    }
+
+    /// 正規化した結果を `buf` に書き込む
+    ///
+    /// - ユーザー定義の置換対象の文字はそのまま置換結果を出力
+    /// - それ以外はNFKC正規化の後、既定ルールを適用
+    /// - 連続する空白を半角スペース1つにまとめ、前後の空白を削除
+    ///   (空白は次の文字を書き込む時点で出力するため、末尾の空白は出力されない)
+    pub fn normalize_into(&self, val: &str, buf: &mut String) {
+        let mut writer = Writer {
+            profile: self,
+            rules: &DEFAULT_TABLE,
+            buf,
+            last: None,
+            pending_space: false,
+        };
+
+        if self.mapping.is_empty() {
+            for c in val.nfkc() {
+                writer.push_normalized(c);
+            }
+            return;
+        }
+
+        // 置換対象の文字で区切った区間ごとにNFKC正規化を適用
+        let mut seg_start = 0;
+        for (i, c) in val.char_indices() {
+            if let Some(to) = self.mapping.get(c) {
+                for c in val[seg_start..i].nfkc() {
+                    writer.push_normalized(c);
+                }
+                for c in to.chars() {
+                    writer.push(c);
+                }
+                seg_start = i + c.len_utf8();
+            }
+        }
+        for c in val[seg_start..].nfkc() {
+            writer.push_normalized(c);
+        }
+    }
+
+    /// 正規化で変化しない文字列かどうかを、出力を作らずに判定する
+    ///
+    /// 判定できない場合は `None` を返します。
+    /// - ASCIIのみの文字列は、既定ルールの対象となる '"' と空白だけを確認
+    /// - それ以外は NFKC の quick check の後、既定ルールと空白の条件を確認
+    pub fn quick_check(&self, val: &str) -> Option<bool> {
+        if !self.mapping.is_empty() {
+            return None;
+        }
+        if val.is_ascii() {
+            return Some(is_normalized_ascii(val.as_bytes()));
+        }
+        match is_nfkc_quick(val.chars()) {
+            IsNormalized::Yes => {}
+            IsNormalized::No => return Some(false),
+            IsNormalized::Maybe => return None,
+        }
+
+        let mut prev: Option<char> = None;
+        // 直前の空白の前にある文字
+        let mut before_space: Option<char> = None;
+        for c in val.chars() {
+            if c.is_whitespace() {
+                // 半角スペース以外の空白、先頭・連続する空白は正規化で変化する
+                if c != ' ' || prev.is_none() || prev == Some(' ') {
+                    return Some(false);
+                }
+                before_space = prev;
+            } else {
+                if DEFAULT_TABLE.get(c).is_some() {
+                    return Some(false);
+                }
+                if self.remove_space_between_japanese && prev == Some(' ') {
+                    if let Some(before) = before_space {
+                        if is_removable_space(before, c) {
+                            return Some(false);
+                        }
+                    }
+                }
+                if self.collapse_prolonged_sound_mark && c == 'ー' && prev == Some('ー') {
+                    return Some(false);
+                }
+            }
+            prev = Some(c);
+        }
+        // 末尾の空白は正規化で削除される
+        Some(prev != Some(' '))
+    }
+
+    /// 正規化で変化しない文字列かどうか
+    ///
+    /// quick check で判定できない場合は `scratch` に正規化した結果と比較します。
+    pub fn is_normalized(&self, val: &str, scratch: &mut String) -> bool {
+        match self.quick_check(val) {
+            Some(result) => result,
+            None => {
+                scratch.clear();
+                self.normalize_into(val, scratch);
+                scratch == val
+            }
+        }
+    }
+}
+
+/// ASCIIのみの文字列が正規化で変化しないかどうか
+///
+/// NFKC正規化はASCIIを変化させないため、'"' と空白の条件だけを確認します。
+#[inline]
+fn is_normalized_ascii(bytes: &[u8]) -> bool {
+    // 先頭の空白を検出するため、直前の文字を空白として始める
+    let mut prev = b' ';
+    for &b in bytes {
+        match b {
+            b'"' | b'\t' | b'\n' | 0x0B | 0x0C | b'\r' => return false,
+            b' ' if prev == b' ' => return false,
+            _ => {}
+        }
+        prev = b;
+    }
+    bytes.is_empty() || prev != b' '
+}
+
+/// 正規化した文字を出力バッファに書き込む
+struct Writer<'a> {
+    profile: &'a NormalizeProfile,
+    rules: &'a CharTable,
+    buf: &'a mut String,
+    /// この行で最後に出力した文字
+    last: Option<char>,
+    /// 直前に空白が現れたかどうか
+    pending_space: bool,
+}
+
+impl Writer<'_> {
+    /// NFKC後の文字に既定ルールを適用して書き込む
+    #[inline]
+    fn push_normalized(&mut self, c: char) {
+        match self.rules.get(c) {
+            Some(to) => {
+                for c in to.chars() {
+                    self.push(c);
+                }
+            }
+            None => self.push(c),
+        }
+    }
+
+    #[inline]
+    fn push(&mut self, c: char) {
+        if c.is_whitespace() {
+            self.pending_space = true;
+            return;
+        }
+        if self.pending_space {
+            self.pending_space = false;
+            // 先頭の空白は出力しない
+            if let Some(last) = self.last {
+                if !(self.profile.remove_space_between_japanese && is_removable_space(last, c)) {
+                    self.buf.push(' ');
+                    self.last = Some(' ');
+                }
+            }
+        }
+        if c == 'ー' && self.profile.collapse_prolonged_sound_mark && self.last == Some('ー') {
+            return;
+        }
+        self.buf.push(c);
+        self.last = Some(c);
+    }
+}
+
+/// 日本語の文字 (漢字、ひらがな、カタカナ、全角記号) かどうか
+#[inline]
+fn is_japanese(c: char) -> bool {
+    matches!(
+        c,
+        '\u{4E00}'..='\u{9FFF}'
+            | '\u{3040}'..='\u{309F}'
+            | '\u{30A0}'..='\u{30FF}'
+            | '\u{3000}'..='\u{303F}'
+            | '\u{FF00}'..='\u{FFEF}'
+    )
+}
+
+/// 2文字の間の空白を削除できるかどうか (neologdn と同じ条件)
+#[inline]
+fn is_removable_space(prev: char, next: char) -> bool {
+    (is_japanese(prev) && (is_japanese(next) || next.is_ascii()))
+        || (prev.is_ascii() && is_japanese(next))
+}
@@ -0,0 +1,141 @@
+use std::sync::Arc;
+
+use serde::Deserialize;
+
+use crate::kana::KanaKwargs;
+use crate::normalize::{NormalizeKwargs, NormalizeProfile};
+use crate::width::WidthKwargs;
+
+/// パイプラインの各ステップの引数
+#[derive(Deserialize)]
+#[serde(tag = "step", rename_all = "snake_case")]
+enum StepKwargs {
+    Normalize(NormalizeKwargs),
+    HalfWidth(WidthKwargs),
+    FullWidth(WidthKwargs),
+    Katakana(KanaKwargs),
+    Hiragana(KanaKwargs),
+    Upper,
+    Lower,
+    Strip,
+}
+
+/// `pipeline` プラグインの引数
+#[derive(Deserialize)]
+pub struct PipelineKwargs {
+    steps: Vec<StepKwargs>,
+}
+
+impl PipelineKwargs {
+    /// 各ステップを実行可能な形にまとめたパイプラインを返す
+    pub fn compile(self) -> Pipeline {
+        let steps = self
+            .steps
+            .into_iter()
+            .map(|step| match step {
+                StepKwargs::Normalize(kwargs) => Step::Normalize(kwargs.profile()),
+                StepKwargs::HalfWidth(kwargs) => Step::HalfWidth(kwargs),
+                StepKwargs::FullWidth(kwargs) => Step::FullWidth(kwargs),
+                StepKwargs::Katakana(kwargs) => Step::Katakana(kwargs),
+                StepKwargs::Hiragana(kwargs) => Step::Hiragana(kwargs),
+                StepKwargs::Upper => Step::Upper,
+                StepKwargs::Lower => Step::Lower,
+                StepKwargs::Strip => Step::Strip,
+            })
+            .collect();
+        Pipeline { steps }
+    }
+}
+
+enum Step {
+    Normalize(Arc<NormalizeProfile>),
+    HalfWidth(WidthKwargs),
+    FullWidth(WidthKwargs),
+    Katakana(KanaKwargs),
+    Hiragana(KanaKwargs),
+    Upper,
+    Lower,
+    Strip,
+}
+
+impl Step {
+    /// このステップで変化しない文字列かどうか
+    #[inline]
+    fn is_unchanged(&self, val: &str) -> bool {
+        match self {
+            Step::Normalize(profile) => profile.quick_check(val) == Some(true),
+            Step::HalfWidth(kwargs) => kwargs.is_half_width_stable(val),
+            Step::FullWidth(kwargs) => kwargs.is_full_width_stable(val),
+            Step::Katakana(kwargs) => kwargs.is_katakana_stable(val),
+            Step::Hiragana(kwargs) => kwargs.is_hiragana_stable(val),
+            Step::Upper if val.is_ascii() => !val.bytes().any(|b| b.is_ascii_lowercase()),
+            Step::Lower if val.is_ascii() => !val.bytes().any(|b| b.is_ascii_uppercase()),
+            Step::Upper => val.chars().all(|c| is_case_stable(c, c.to_uppercase())),
+            Step::Lower => val.chars().all(|c| is_case_stable(c, c.to_lowercase())),
+            Step::Strip => val.trim().len() == val.len(),
+        }
+    }
+
+    /// このステップの変換結果を `buf` に書き込む
+    #[inline]
+    fn apply(&self, val: &str, buf: &mut String) {
+        match self {
+            Step::Normalize(profile) => profile.normalize_into(val, buf),
+            Step::HalfWidth(kwargs) => kwargs.zen_to_han_into(val, buf),
+            Step::FullWidth(kwargs) => kwargs.han_to_zen_into(val, buf),
+            Step::Katakana(kwargs) => kwargs.hira_to_kata_into(val, buf),
+            Step::Hiragana(kwargs) => kwargs.kata_to_hira_into(val, buf),
+            Step::Upper => buf.extend(val.chars().flat_map(char::to_uppercase)),
+            Step::Lower => buf.extend(val.chars().flat_map(char::to_lowercase)),
+            Step::Strip => buf.push_str(val.trim()),
+        }
+    }
+}
+
+/// 複数の文字列変換を1つにまとめたパイプライン
+///
+/// 行ごとに全てのステップを続けて適用します。途中の結果は行をまたいで
+/// 使い回す作業用バッファに置くため、ステップごとに列全体の中間結果を作りません。
+pub struct Pipeline {
+    steps: Vec<Step>,
+}
+
+/// パイプラインの途中の結果を置く作業用バッファ
+#[derive(Default)]
+pub struct PipelineBuffers {
+    /// 直前のステップの結果
+    cur: String,
+    /// 次のステップの結果
+    next: String,
+}
+
+impl Pipeline {
+    /// 全てのステップで変化しない文字列かどうか
+    pub fn is_unchanged(&self, val: &str) -> bool {
+        self.steps.iter().all(|step| step.is_unchanged(val))
+    }
+
+    /// 全てのステップを適用した結果を `buf` に書き込む
+    ///
+    /// 変化しないステップは作業用バッファへのコピーも省略します。
+    pub fn apply_into(&self, val: &str, buf: &mut String, buffers: &mut PipelineBuffers) {
+        let mut in_input = true;
+        for step in &self.steps {
+            let src = if in_input { val } else { buffers.cur.as_str() };
+            if step.is_unchanged(src) {
+                continue;
+            }
+            buffers.next.clear();
+            step.apply(src, &mut buffers.next);
+            std::mem::swap(&mut buffers.cur, &mut buffers.next);
+            in_input = false;
+        }
+        buf.push_str(if in_input { val } else { &buffers.cur });
+    }
+}
+
+/// 大文字・小文字の変換で変化しない文字かどうか
+#[inline]
+fn is_case_stable(c: char, mut converted: impl Iterator<Item = char>) -> bool {
+    converted.next() == Some(c) && converted.next().is_none()
+}
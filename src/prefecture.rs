@@ -0,0 +1,204 @@
+use std::sync::LazyLock;
+
+use polars::prelude::PlHashMap;
+use serde::Deserialize;
+
+use crate::kana::hiragana_to_katakana_char;
+use crate::width::{ascii_to_half_width_char, combine_mark, kana_to_full_width_char};
+
+/// 都道府県 (JIS コード順): (漢字, ひらがな, カタカナ, ローマ字, 地方)
+///
+/// Python 側の `_PREFECTURE_DATA` と同じ内容です (tests/test_prefecture.py で
+/// 全ての都道府県の変換結果が一致することを確認しています)。
+#[rustfmt::skip]
+const PREFECTURES: [(&str, &str, &str, &str, &str); 47] = [
+    ("北海道", "ほっかいどう", "ホッカイドウ", "HOKKAIDO", "北海道"),
+    ("青森県", "あおもりけん", "アオモリケン", "AOMORI", "東北"),
+    ("岩手県", "いわてけん", "イワテケン", "IWATE", "東北"),
+    ("宮城県", "みやぎけん", "ミヤギケン", "MIYAGI", "東北"),
+    ("秋田県", "あきたけん", "アキタケン", "AKITA", "東北"),
+    ("山形県", "やまがたけん", "ヤマガタケン", "YAMAGATA", "東北"),
+    ("福島県", "ふくしまけん", "フクシマケン", "FUKUSHIMA", "東北"),
+    ("茨城県", "いばらきけん", "イバラキケン", "IBARAKI", "関東"),
+    ("栃木県", "とちぎけん", "トチギケン", "TOCHIGI", "関東"),
+    ("群馬県", "ぐんまけん", "グンマケン", "GUNMA", "関東"),
+    ("埼玉県", "さいたまけん", "サイタマケン", "SAITAMA", "関東"),
+    ("千葉県", "ちばけん", "チバケン", "CHIBA", "関東"),
+    ("東京都", "とうきょうと", "トウキョウト", "TOKYO", "関東"),
+    ("神奈川県", "かながわけん", "カナガワケン", "KANAGAWA", "関東"),
+    ("新潟県", "にいがたけん", "ニイガタケン", "NIIGATA", "中部"),
+    ("富山県", "とやまけん", "トヤマケン", "TOYAMA", "中部"),
+    ("石川県", "いしかわけん", "イシカワケン", "ISHIKAWA", "中部"),
+    ("福井県", "ふくいけん", "フクイケン", "FUKUI", "中部"),
+    ("山梨県", "やまなしけん", "ヤマナシケン", "YAMANASHI", "中部"),
+    ("長野県", "ながのけん", "ナガノケン", "NAGANO", "中部"),
+    ("岐阜県", "ぎふけん", "ギフケン", "GIFU", "中部"),
+    ("静岡県", "しずおかけん", "シズオカケン", "SHIZUOKA", "中部"),
+    ("愛知県", "あいちけん", "アイチケン", "AICHI", "中部"),
+    ("三重県", "みえけん", "ミエケン", "MIE", "近畿"),
+    ("滋賀県", "しがけん", "シガケン", "SHIGA", "近畿"),
+    ("京都府", "きょうとふ", "キョウトフ", "KYOTO", "近畿"),
+    ("大阪府", "おおさかふ", "オオサカフ", "OSAKA", "近畿"),
+    ("兵庫県", "ひょうごけん", "ヒョウゴケン", "HYOGO", "近畿"),
+    ("奈良県", "ならけん", "ナラケン", "NARA", "近畿"),
+    ("和歌山県", "わかやまけん", "ワカヤマケン", "WAKAYAMA", "近畿"),
+    ("鳥取県", "とっとりけん", "トットリケン", "TOTTORI", "中国"),
+    ("島根県", "しまねけん", "シマネケン", "SHIMANE", "中国"),
+    ("岡山県", "おかやまけん", "オカヤマケン", "OKAYAMA", "中国"),
+    ("広島県", "ひろしまけん", "ヒロシマケン", "HIROSHIMA", "中国"),
+    ("山口県", "やまぐちけん", "ヤマグチケン", "YAMAGUCHI", "中国"),
+    ("徳島県", "とくしまけん", "トクシマケン", "TOKUSHIMA", "四国"),
+    ("香川県", "かがわけん", "カガワケン", "KAGAWA", "四国"),
+    ("愛媛県", "えひめけん", "エヒメケン", "EHIME", "四国"),
+    ("高知県", "こうちけん", "コウチケン", "KOCHI", "四国"),
+    ("福岡県", "ふくおかけん", "フクオカケン", "FUKUOKA", "九州・沖縄"),
+    ("佐賀県", "さがけん", "サガケン", "SAGA", "九州・沖縄"),
+    ("長崎県", "ながさきけん", "ナガサキケン", "NAGASAKI", "九州・沖縄"),
+    ("熊本県", "くまもとけん", "クマモトケン", "KUMAMOTO", "九州・沖縄"),
+    ("大分県", "おおいたけん", "オオイタケン", "OITA", "九州・沖縄"),
+    ("宮崎県", "みやざきけん", "ミヤザキケン", "MIYAZAKI", "九州・沖縄"),
+    ("鹿児島県", "かごしまけん", "カゴシマケン", "KAGOSHIMA", "九州・沖縄"),
+    ("沖縄県", "おきなわけん", "オキナワケン", "OKINAWA", "九州・沖縄"),
+];
+
+/// 都道府県名の表記 (照合用に正規化した文字列) から都道府県コードへの表
+///
+/// 漢字・カタカナ・ローマ字 (大文字) の表記と、それぞれの「都」「府」「県」の
+/// 有無による表記揺れを登録します。ひらがなは照合前にカタカナに変換します。
+static PREFECTURE_KEYS: LazyLock<PlHashMap<String, u8>> = LazyLock::new(|| {
+    let mut keys = PlHashMap::new();
+    for (i, (kanji, _, katakana, romaji, _)) in PREFECTURES.iter().enumerate() {
+        let code = i as u8 + 1;
+        keys.insert(kanji.to_string(), code);
+        keys.insert(katakana.to_string(), code);
+        keys.insert(romaji.to_string(), code);
+        // 北海道 は「道」を省略しない
+        let suffix = match kanji.chars().last() {
+            Some('都') => Some(("都", "ト", "TO")),
+            Some('府') => Some(("府", "フ", "FU")),
+            Some('県') => Some(("県", "ケン", "KEN")),
+            _ => None,
+        };
+        if let Some((kanji_suffix, kana_suffix, romaji_suffix)) = suffix {
+            keys.insert(kanji.trim_end_matches(kanji_suffix).to_string(), code);
+            keys.insert(katakana.trim_end_matches(kana_suffix).to_string(), code);
+            keys.insert(format!("{}-{}", romaji, romaji_suffix), code);
+            keys.insert(format!("{}{}", romaji, romaji_suffix), code);
+        }
+    }
+    // 茨城 (いばらき) の読み誤り
+    keys.insert("イバラギ".to_string(), 8);
+    keys.insert("イバラギケン".to_string(), 8);
+    keys
+});
+
+/// 地方 (Python 側の地方名の Enum と同じ順)
+const REGIONS: [&str; 8] = [
+    "北海道",
+    "東北",
+    "関東",
+    "中部",
+    "近畿",
+    "中国",
+    "四国",
+    "九州・沖縄",
+];
+
+/// 都道府県ごとの地方の位置
+static REGION_INDICES: LazyLock<[u32; 47]> = LazyLock::new(|| {
+    PREFECTURES.map(|(_, _, _, _, region)| {
+        REGIONS
+            .iter()
+            .position(|r| *r == region)
+            .expect("unknown region") as u32
+    })
+});
+
+/// `resolve_prefecture` の出力
+#[derive(Deserialize, Clone, Copy, PartialEq, Eq)]
+#[serde(rename_all = "lowercase")]
+pub enum PrefectureOutput {
+    /// 都道府県コード (Int64)
+    Code,
+    /// JIS コード順の位置 (UInt32)
+    ///
+    /// 漢字表記・ローマ字表記の Enum の物理表現として使います。
+    Index,
+    /// 地方の位置 (UInt32)
+    ///
+    /// 地方名の Enum の物理表現として使います。
+    Region,
+    /// ひらがな表記 ("とうきょうと")
+    Hiragana,
+    /// カタカナ表記 ("トウキョウト")
+    Katakana,
+}
+
+/// `resolve_prefecture` プラグインの引数
+#[derive(Deserialize)]
+pub struct PrefectureKwargs {
+    pub output: PrefectureOutput,
+}
+
+impl PrefectureOutput {
+    /// 都道府県コード (1〜47) の Enum の物理表現 (`Index`, `Region` の場合)
+    pub fn position(self, code: u8) -> u32 {
+        match self {
+            PrefectureOutput::Region => REGION_INDICES[code as usize - 1],
+            _ => code as u32 - 1,
+        }
+    }
+
+    /// 都道府県コード (1〜47) の表記 (`Hiragana`, `Katakana` の場合)
+    pub fn name(self, code: u8) -> &'static str {
+        let (_, hiragana, katakana, _, _) = PREFECTURES[code as usize - 1];
+        match self {
+            PrefectureOutput::Hiragana => hiragana,
+            _ => katakana,
+        }
+    }
+}
+
+/// 都道府県コードの数値が 1〜47 の範囲であれば返す
+pub fn code_from_number(number: i64) -> Option<u8> {
+    (1..=PREFECTURES.len() as i64)
+        .contains(&number)
+        .then_some(number as u8)
+}
+
+/// 都道府県名 (漢字・ひらがな・カタカナ・ローマ字・コード) から都道府県コードを求める
+///
+/// 前後の空白を除き、全角英数字を半角に、英字を大文字に、半角カタカナと
+/// ひらがなを全角カタカナにしながら1回の走査で `buf` に書き込み、表を引きます。
+pub fn lookup_code(val: &str, buf: &mut String) -> Option<u8> {
+    buf.clear();
+    // 直前の半角カタカナ (濁点・半濁点の結合の対象)
+    let mut prev_half_kana: Option<char> = None;
+    for c in val.trim().chars() {
+        let prev = prev_half_kana.take();
+        if let Some(combined) = prev
+            .filter(|_| matches!(c, 'ﾞ' | 'ﾟ'))
+            .and_then(|p| combine_mark(p, c))
+        {
+            buf.pop();
+            buf.push(combined);
+            continue;
+        }
+        let c = ascii_to_half_width_char(c);
+        let c = match c {
+            'a'..='z' => c.to_ascii_uppercase(),
+            '\u{FF61}'..='\u{FF9F}' => {
+                prev_half_kana = Some(c);
+                kana_to_full_width_char(c)
+            }
+            _ => hiragana_to_katakana_char(c),
+        };
+        buf.push(c);
+    }
+
+    // "13", "01" などのコード
+    if !buf.is_empty() && buf.len() <= 2 && buf.bytes().all(|b| b.is_ascii_digit()) {
+        return buf.parse().ok().and_then(code_from_number);
+    }
+    PREFECTURE_KEYS.get(buf.as_str()).copied()
+}
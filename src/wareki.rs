@@ -0,0 +1,693 @@
+use std::collections::HashMap;
+use std::sync::{Arc, LazyLock, RwLock};
+
+use chrono::{Datelike, NaiveDate};
+use regex::{Captures, Regex};
+use serde::Deserialize;
+
+/// 漢数字の1〜9
+const KANJI_DIGITS: &str = "一二三四五六七八九";
+
+// 英語ロケールの曜日・月・午前午後 (Python の strptime と同じく小文字で照合)
+const FULL_WEEKDAYS: [&str; 7] = [
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+];
+const ABBR_WEEKDAYS: [&str; 7] = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"];
+const FULL_MONTHS: [&str; 12] = [
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+];
+const ABBR_MONTHS: [&str; 12] = [
+    "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec",
+];
+const AM_PM: [&str; 2] = ["am", "pm"];
+
+/// コンパイル済みパーサーのキャッシュ (キーはPython側でフォーマットと元号データから生成)
+static PARSERS: LazyLock<RwLock<HashMap<String, Arc<WarekiParser>>>> =
+    LazyLock::new(|| RwLock::new(HashMap::new()));
+
+/// 元号の表のキャッシュ (キーはPython側で元号データから生成)
+static ERA_TABLES: LazyLock<RwLock<HashMap<String, Arc<EraTable>>>> =
+    LazyLock::new(|| RwLock::new(HashMap::new()));
+
+/// 明治以降の元号の英字の頭文字
+const MODERN_ERA_HEADS: [(char, &str); 5] = [
+    ('M', "明治"),
+    ('T', "大正"),
+    ('S', "昭和"),
+    ('H', "平成"),
+    ('R', "令和"),
+];
+
+/// 元号データ (japanera の元号を開始日・種類の順に並べたもの)
+#[derive(Deserialize)]
+pub struct EraKwargs {
+    kanji: String,
+    english: String,
+    english_vowel_shortened: String,
+    english_head: String,
+    /// 開始日 (1970-01-01 からの日数)
+    since: i32,
+    /// 終了日 (1970-01-01 からの日数、終了日自体は含まない)
+    until: Option<i32>,
+}
+
+/// `to_datetime` (和暦文字列の解析) プラグインの引数
+#[derive(Deserialize)]
+pub struct ParseWarekiKwargs {
+    /// フォーマットと元号データから作られるキャッシュキー
+    key: String,
+    format: String,
+    pub raise_error: bool,
+    eras: Vec<EraKwargs>,
+}
+
+impl ParseWarekiKwargs {
+    /// キーに対応するコンパイル済みのパーサーを返す
+    ///
+    /// 未コンパイルの場合はコンパイルしてキャッシュします。
+    pub fn parser(&self) -> Result<Arc<WarekiParser>, String> {
+        {
+            let parsers = PARSERS.read().unwrap();
+            if let Some(parser) = parsers.get(&self.key) {
+                return Ok(parser.clone());
+            }
+        }
+        let parser = Arc::new(WarekiParser::compile(self)?);
+        Ok(PARSERS
+            .write()
+            .unwrap()
+            .entry(self.key.clone())
+            .or_insert(parser)
+            .clone())
+    }
+}
+
+/// `parse_wareki` (フォーマットを指定しない和暦文字列の解析) プラグインの引数
+#[derive(Deserialize)]
+pub struct ParseWarekiAutoKwargs {
+    /// 元号データから作られるキャッシュキー
+    key: String,
+    /// 一致したパターンも返すかどうか
+    pub return_pattern: bool,
+    eras: Vec<EraKwargs>,
+}
+
+impl ParseWarekiAutoKwargs {
+    /// キーに対応する元号の表を返す
+    pub fn era_table(&self) -> Result<Arc<EraTable>, String> {
+        {
+            let tables = ERA_TABLES.read().unwrap();
+            if let Some(table) = tables.get(&self.key) {
+                return Ok(table.clone());
+            }
+        }
+        let table = Arc::new(EraTable::new(&self.eras)?);
+        Ok(ERA_TABLES
+            .write()
+            .unwrap()
+            .entry(self.key.clone())
+            .or_insert(table)
+            .clone())
+    }
+}
+
+/// Python の `datetime.date.max`
+const PY_DATE_MAX: NaiveDate = match NaiveDate::from_ymd_opt(9999, 12, 31) {
+    Some(date) => date,
+    None => panic!(),
+};
+
+struct Era {
+    since: NaiveDate,
+    until: Option<NaiveDate>,
+}
+
+impl Era {
+    /// 終了日のない元号も、japanera と同じく `date.max` (9999-12-31) を含まない
+    fn contains(&self, date: NaiveDate) -> bool {
+        self.since <= date && date < self.until.unwrap_or(PY_DATE_MAX)
+    }
+
+    fn contains_year(&self, year: i32) -> bool {
+        self.since.year() <= year && self.until.is_none_or(|until| year <= until.year())
+    }
+}
+
+/// 元号の表
+pub struct EraTable {
+    eras: Vec<Era>,
+    /// 元号名 (漢字、英字、短縮した英字、英字の頭文字) -> 元号の位置
+    names: [HashMap<String, Vec<usize>>; 4],
+}
+
+/// 和暦文字列のパーサー
+///
+/// japanera の `EraDate.strptime` と同じ正規表現でフォーマットを解析し、
+/// 同じ手順で元号と日付を求めます。
+pub struct WarekiParser {
+    regex: Regex,
+    table: EraTable,
+}
+
+/// 文字列から読み取った和暦の各要素
+#[derive(Default)]
+struct Fields<'a> {
+    names: [Option<&'a str>; 4],
+    year: Option<i64>,
+    relative_year: Option<i64>,
+    month: Option<u32>,
+    day: Option<u32>,
+}
+
+impl EraTable {
+    fn new(data: &[EraKwargs]) -> Result<Self, String> {
+        let mut names: [HashMap<String, Vec<usize>>; 4] = Default::default();
+        let mut eras = Vec::with_capacity(data.len());
+        for (i, era) in data.iter().enumerate() {
+            let era_names = [
+                &era.kanji,
+                &era.english,
+                &era.english_vowel_shortened,
+                &era.english_head,
+            ];
+            for (map, name) in names.iter_mut().zip(era_names) {
+                map.entry(name.clone()).or_default().push(i);
+            }
+            eras.push(Era {
+                since: from_days(era.since).ok_or("invalid era data")?,
+                until: era.until.and_then(from_days),
+            });
+        }
+        Ok(Self { eras, names })
+    }
+
+    /// japanera の `find_era_and_date` と同じ手順で、最初に該当する元号の日付を求める
+    fn find_date(&self, fields: &Fields) -> Option<NaiveDate> {
+        let mut era_set: Option<Vec<usize>> = None;
+        let mut given = false;
+        for (map, name) in self.names.iter().zip(fields.names) {
+            if let Some(name) = name {
+                given = true;
+                let found = map.get(name).cloned().unwrap_or_default();
+                era_set = Some(intersect_or_replace(era_set, found));
+            }
+        }
+        if let Some(year) = fields.year {
+            given = true;
+            let found = match i32::try_from(year) {
+                Ok(year) => (0..self.eras.len())
+                    .filter(|&i| self.eras[i].contains_year(year))
+                    .collect(),
+                Err(_) => Vec::new(),
+            };
+            era_set = Some(intersect_or_replace(era_set, found));
+        }
+        let candidates = match era_set {
+            Some(set) if !set.is_empty() => set,
+            _ if given => return None,
+            _ => (0..self.eras.len()).collect(),
+        };
+
+        for i in candidates {
+            let era = &self.eras[i];
+            match candidate_date(era.since, fields) {
+                Candidate::Date(date) if era.contains(date) => return Some(date),
+                Candidate::Date(_) | Candidate::Skip => continue,
+                Candidate::Error => return None,
+            }
+        }
+        None
+    }
+}
+
+impl WarekiParser {
+    fn compile(kwargs: &ParseWarekiKwargs) -> Result<Self, String> {
+        let table = EraTable::new(&kwargs.eras)?;
+        let pattern = format_to_pattern(&kwargs.format, &table.names)?;
+        let regex = Regex::new(&pattern).map_err(|err| err.to_string())?;
+        Ok(Self { regex, table })
+    }
+
+    /// 和暦文字列を日付 (1970-01-01 からの日数) に変換する
+    ///
+    /// 解析できない場合や該当する元号がない場合は `None` を返します。
+    pub fn parse(&self, val: &str) -> Option<i32> {
+        // japanera と同じく、先頭からの最初の一致が文字列の末尾まで届かない場合は失敗
+        let caps = self.regex.captures(val)?;
+        if caps.get(0)?.end() != val.len() {
+            return None;
+        }
+        let fields = self.read_fields(&caps)?;
+        let date = self.table.find_date(&fields)?;
+        Some(to_days(date))
+    }
+
+    fn read_fields<'a>(&self, caps: &Captures<'a>) -> Option<Fields<'a>> {
+        let mut fields = Fields::default();
+        for name in self.regex.capture_names().flatten() {
+            let Some(m) = caps.name(name) else {
+                continue;
+            };
+            let text = m.as_str();
+            match name {
+                "_K" => fields.names[0] = Some(text),
+                "_E" => fields.names[1] = Some(text),
+                "_e" => fields.names[2] = Some(text),
+                "_h" => fields.names[3] = Some(text),
+                "_n" | "_y" => fields.relative_year = Some(parse_gannen_or_number(text)?),
+                "_N" | "_Y" => fields.year = Some(parse_gannen_or_number(text)?),
+                "_m" => fields.month = Some(parse_number(text)? as u32),
+                "_d" => fields.day = Some(parse_number(text)? as u32),
+                "y" => {
+                    // 00〜68 は 2000年代、69〜99 は 1900年代
+                    let year = parse_digits(text)?;
+                    fields.year = Some(if year <= 68 { year + 2000 } else { year + 1900 });
+                }
+                "Y" => fields.year = Some(parse_digits(text)?),
+                "m" => fields.month = Some(parse_digits(text)? as u32),
+                "d" => fields.day = Some(parse_digits(text.trim_start())? as u32),
+                "B" => fields.month = Some(month_index(&FULL_MONTHS, text)),
+                "b" => fields.month = Some(month_index(&ABBR_MONTHS, text)),
+                // 曜日・時刻は日付の決定に使わない
+                _ => {}
+            }
+        }
+        Some(fields)
+    }
+}
+
+/// `parse_wareki` で一致したパターン
+#[derive(Clone, Copy)]
+pub enum WarekiPattern {
+    /// 英字の元号 (R5.1.1, H31/4/30 など)
+    Alphabet,
+    /// 漢字の元号と数字 (令和5年1月1日 など)
+    Kanji,
+    /// 漢字の元号と漢数字 (令和五年十二月一日 など)
+    KanjiNumeral,
+}
+
+impl WarekiPattern {
+    pub fn as_str(self) -> &'static str {
+        match self {
+            WarekiPattern::Alphabet => "alphabet",
+            WarekiPattern::Kanji => "kanji",
+            WarekiPattern::KanjiNumeral => "kanji_numeral",
+        }
+    }
+}
+
+impl EraTable {
+    /// フォーマットを指定せずに和暦文字列を日付 (1970-01-01 からの日数) に変換する
+    ///
+    /// 元号 (漢字、または明治以降の元号の英字の頭文字) に続けて、年 (数字・漢数字・元)、
+    /// 月、日を「年」「月」「日」または区切り文字 (`.`, `/`, `-`) で区切った文字列を
+    /// 解析します。月・日は省略できます。全角の英数字・記号は半角として扱います。
+    /// 日付は `to_datetime` と同じ手順で求め、解析できない場合は `None` を返します。
+    pub fn parse_auto(&self, val: &str, buf: &mut String) -> Option<(i32, WarekiPattern)> {
+        buf.clear();
+        buf.extend(val.trim().chars().map(fold_full_width));
+        let (era, alphabet, mut rest) = self.take_era(buf)?;
+
+        let mut values: [Option<i64>; 3] = [None; 3];
+        let mut kanji_numeral = false;
+        for (i, unit) in ['年', '月', '日'].into_iter().enumerate() {
+            let (value, is_kanji, after) = take_number(rest.trim_start(), i == 0)?;
+            values[i] = Some(value);
+            kanji_numeral |= is_kanji;
+            let after = after.trim_start();
+            rest = if let Some(after) = after.strip_prefix(unit) {
+                after
+            } else if let Some(after) = after.strip_prefix(['.', '/', '-']).filter(|_| i < 2) {
+                // 区切り文字の後には次の要素が必要
+                if after.trim_start().is_empty() {
+                    return None;
+                }
+                after
+            } else {
+                after
+            };
+            if rest.trim_start().is_empty() {
+                break;
+            }
+            if i == 2 || rest.len() == after.len() {
+                return None;
+            }
+        }
+
+        let fields = Fields {
+            names: [Some(era), None, None, None],
+            relative_year: values[0],
+            month: values[1].map(u32::try_from).transpose().ok()?,
+            day: values[2].map(u32::try_from).transpose().ok()?,
+            ..Default::default()
+        };
+        let date = self.find_date(&fields)?;
+        let pattern = if alphabet {
+            WarekiPattern::Alphabet
+        } else if kanji_numeral {
+            WarekiPattern::KanjiNumeral
+        } else {
+            WarekiPattern::Kanji
+        };
+        Some((to_days(date), pattern))
+    }
+
+    /// 先頭の元号名を読み取り、元号名 (漢字)、英字かどうか、残りの文字列を返す
+    fn take_era<'a, 'b>(&'a self, s: &'b str) -> Option<(&'a str, bool, &'b str)> {
+        let first = s.chars().next()?;
+        if first.is_ascii_alphabetic() {
+            let head = first.to_ascii_uppercase();
+            let (_, kanji) = MODERN_ERA_HEADS.iter().find(|(h, _)| *h == head)?;
+            let (name, _) = self.names[0].get_key_value(*kanji)?;
+            return Some((name, true, &s[1..]));
+        }
+        // 長い元号名を優先する (元号名は2〜4文字)
+        (2..=4).rev().find_map(|len| {
+            let end = s.char_indices().nth(len).map_or(s.len(), |(i, _)| i);
+            let (name, _) = self.names[0].get_key_value(&s[..end])?;
+            Some((name.as_str(), false, &s[end..]))
+        })
+    }
+}
+
+enum Candidate {
+    Date(NaiveDate),
+    /// この元号では日付が存在しない
+    Skip,
+    /// 日付を作れない (japanera では例外になる)
+    Error,
+}
+
+/// 元号の開始日と読み取った要素から、元号に対応する日付を求める
+fn candidate_date(since: NaiveDate, fields: &Fields) -> Candidate {
+    let no_year = fields.year.is_none() && fields.relative_year.is_none();
+    let mut date = since;
+    let new_year = match (fields.year, fields.relative_year) {
+        (Some(year), _) if year != since.year() as i64 => Some(year),
+        (_, Some(relative_year)) if relative_year > 1 => {
+            Some(since.year() as i64 + relative_year - 1)
+        }
+        _ => None,
+    };
+    if let Some(year) = new_year {
+        date = match py_date(year, 1, 1) {
+            Some(d) => d,
+            None => return Candidate::Error,
+        };
+    }
+
+    if let Some(month) = fields.month {
+        if date.year() != since.year() || month != date.month() {
+            date = match py_date(date.year() as i64, month, 1) {
+                Some(d) => d,
+                None => return Candidate::Error,
+            };
+            if no_year && date < since {
+                date = match py_date(date.year() as i64 + 1, date.month(), date.day()) {
+                    Some(d) => d,
+                    None => return Candidate::Error,
+                };
+            }
+        }
+        if let Some(day) = fields.day {
+            if month == 2 && day == 29 && no_year {
+                let year = closest_leap_year(date.year());
+                date = match py_date(year as i64, date.month(), date.day()) {
+                    Some(d) => d,
+                    None => return Candidate::Error,
+                };
+            }
+            date = match py_date(date.year() as i64, date.month(), day) {
+                Some(d) => d,
+                None => return Candidate::Skip,
+            };
+        }
+    } else if let Some(day) = fields.day {
+        // 指定した日が存在する月まで進める
+        loop {
+            if let Some(d) = py_date(date.year() as i64, date.month(), day) {
+                date = d;
+                break;
+            }
+            match date.checked_add_days(chrono::Days::new(days_in_month(date) as u64)) {
+                Some(d) if d.year() <= 9999 => date = d,
+                _ => return Candidate::Error,
+            }
+        }
+    }
+    Candidate::Date(date)
+}
+
+/// japanera の `_strptime` と同じ正規表現のパターンを作る
+fn format_to_pattern(
+    format: &str,
+    names: &[HashMap<String, Vec<usize>>; 4],
+) -> Result<String, String> {
+    // 正規表現の特殊文字をエスケープし、空白の並びを \s+ にする
+    let mut escaped = String::with_capacity(format.len());
+    let mut in_space = false;
+    for c in format.chars() {
+        if c.is_whitespace() {
+            if !in_space {
+                escaped.push_str(r"\s+");
+            }
+            in_space = true;
+            continue;
+        }
+        in_space = false;
+        if r"\.^$*+?(){}[]|".contains(c) {
+            escaped.push('\\');
+        }
+        escaped.push(c);
+    }
+
+    let mut pattern = String::from("(?i)^(?:");
+    let mut chars = escaped.chars();
+    while let Some(c) = chars.next() {
+        if c != '%' {
+            pattern.push(c);
+            continue;
+        }
+        let directive = match chars.next() {
+            Some('-') => match chars.next() {
+                Some(c) => format!("-{c}"),
+                None => return Err(format!("stray % in format '{format}'")),
+            },
+            Some(c) => c.to_string(),
+            None => return Err(format!("stray % in format '{format}'")),
+        };
+        pattern.push_str(
+            &directive_pattern(&directive, names)
+                .ok_or_else(|| format!("'{directive}' is a bad directive in format '{format}'"))?,
+        );
+    }
+    pattern.push(')');
+    Ok(pattern)
+}
+
+/// フォーマットの指定子に対応する正規表現
+fn directive_pattern(directive: &str, names: &[HashMap<String, Vec<usize>>; 4]) -> Option<String> {
+    let pattern = match directive {
+        "-K" => names_pattern("_K", &names[0]),
+        "-E" => names_pattern("_E", &names[1]),
+        "-e" => names_pattern("_e", &names[2]),
+        "-h" => names_pattern("_h", &names[3]),
+        "-n" => format!("(?P<_n>[{d}]?十[{d}]?|[{d}]|元)", d = KANJI_DIGITS),
+        "-N" => format!(
+            "(?P<_N>[{d}]?千([{d}]?百)?([{d}]?十)?[{d}]?|[{d}]?百([{d}]?十)?[{d}]?|[{d}]?十[{d}]?|[{d}]|元)",
+            d = KANJI_DIGITS
+        ),
+        "-y" => r"(?P<_y>\d\d|\d|元)".to_string(),
+        "-Y" => r"(?P<_Y>\d{1,4}|元)".to_string(),
+        "-m" => format!("(?P<_m>1[0-2]|0[1-9]|[1-9]|十[一二]?|[{d}])", d = KANJI_DIGITS),
+        "-d" => format!(
+            r"(?P<_d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9]|三十一?|二?十[{d}]?|[{d}])",
+            d = KANJI_DIGITS
+        ),
+        "-a" => "(?P<_a>[月火水木金土日])".to_string(),
+        "d" => r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])".to_string(),
+        "f" => "(?P<f>[0-9]{1,6})".to_string(),
+        "H" => r"(?P<H>2[0-3]|[0-1]\d|\d)".to_string(),
+        "I" => "(?P<I>1[0-2]|0[1-9]|[1-9])".to_string(),
+        "m" => "(?P<m>1[0-2]|0[1-9]|[1-9])".to_string(),
+        "M" => r"(?P<M>[0-5]\d|\d)".to_string(),
+        "S" => r"(?P<S>6[0-1]|[0-5]\d|\d)".to_string(),
+        "w" => "(?P<w>[0-6])".to_string(),
+        "u" => "(?P<u>[1-7])".to_string(),
+        "y" => r"(?P<y>\d\d|\d)".to_string(),
+        "Y" => r"(?P<Y>\d\d\d\d)".to_string(),
+        "A" => words_pattern("A", &FULL_WEEKDAYS),
+        "a" => words_pattern("a", &ABBR_WEEKDAYS),
+        "B" => words_pattern("B", &FULL_MONTHS),
+        "b" => words_pattern("b", &ABBR_MONTHS),
+        "p" => words_pattern("p", &AM_PM),
+        "%" => "%".to_string(),
+        _ => return None,
+    };
+    Some(pattern)
+}
+
+/// 元号名のいずれかに一致する正規表現 (長い名前を優先)
+fn names_pattern(group: &str, names: &HashMap<String, Vec<usize>>) -> String {
+    let mut names: Vec<&str> = names.keys().map(String::as_str).collect();
+    names.sort_by(|a, b| b.chars().count().cmp(&a.chars().count()).then(a.cmp(b)));
+    words_pattern(group, &names)
+}
+
+fn words_pattern(group: &str, words: &[&str]) -> String {
+    let alternatives: Vec<String> = words.iter().map(|w| regex::escape(w)).collect();
+    format!("(?P<{group}>{})", alternatives.join("|"))
+}
+
+fn month_index(months: &[&str; 12], text: &str) -> u32 {
+    let text = text.to_lowercase();
+    months.iter().position(|m| *m == text).unwrap_or(0) as u32 + 1
+}
+
+fn intersect_or_replace(era_set: Option<Vec<usize>>, found: Vec<usize>) -> Vec<usize> {
+    match era_set {
+        // japanera と同じく、それまでの結果が空の場合は置き換える
+        Some(set) if !set.is_empty() => set.into_iter().filter(|i| found.contains(i)).collect(),
+        _ => found,
+    }
+}
+
+/// "元" (1年) または数字・漢数字の年
+fn parse_gannen_or_number(text: &str) -> Option<i64> {
+    if text == "元" {
+        Some(1)
+    } else {
+        parse_number(text)
+    }
+}
+
+/// 数字 (全角を含む) を数値に変換する
+fn parse_digits(text: &str) -> Option<i64> {
+    if text.is_empty() {
+        return None;
+    }
+    text.chars().try_fold(0i64, |acc, c| {
+        let digit = match c {
+            '0'..='9' => c as u32 - '0' as u32,
+            '０'..='９' => c as u32 - '０' as u32,
+            _ => return None,
+        };
+        acc.checked_mul(10)?.checked_add(digit as i64)
+    })
+}
+
+/// 数字または漢数字 (十・百・千を含む) を数値に変換する
+fn parse_number(text: &str) -> Option<i64> {
+    if let Some(number) = parse_digits(text) {
+        return Some(number);
+    }
+    let mut total = 0;
+    let mut digit: Option<i64> = None;
+    for c in text.chars() {
+        if let Some(pos) = KANJI_DIGITS.chars().position(|d| d == c) {
+            digit = Some(pos as i64 + 1);
+            continue;
+        }
+        let unit = match c {
+            '十' => 10,
+            '百' => 100,
+            '千' => 1000,
+            _ => return None,
+        };
+        total += digit.take().unwrap_or(1) * unit;
+    }
+    Some(total + digit.unwrap_or(0))
+}
+
+/// 先頭の数字・漢数字 (`gannen` の場合は「元」も) を読み取り、
+/// 値、漢数字かどうか、残りの文字列を返す
+fn take_number(s: &str, gannen: bool) -> Option<(i64, bool, &str)> {
+    if gannen {
+        if let Some(rest) = s.strip_prefix('元') {
+            return Some((1, false, rest));
+        }
+    }
+    let digits = s.bytes().take_while(u8::is_ascii_digit).count();
+    if digits > 0 {
+        return Some((parse_digits(&s[..digits])?, false, &s[digits..]));
+    }
+    let end = s
+        .char_indices()
+        .find(|(_, c)| !KANJI_DIGITS.contains(*c) && !"十百千".contains(*c))
+        .map_or(s.len(), |(i, _)| i);
+    if end == 0 {
+        return None;
+    }
+    Some((parse_number(&s[..end])?, true, &s[end..]))
+}
+
+/// 全角の英数字・記号・空白を半角にする
+fn fold_full_width(c: char) -> char {
+    match c {
+        '！'..='～' => char::from_u32(c as u32 - 0xFEE0).unwrap_or(c),
+        '\u{3000}' => ' ',
+        _ => c,
+    }
+}
+
+/// Python の `datetime.date` で扱える範囲 (1〜9999年) の日付
+fn py_date(year: i64, month: u32, day: u32) -> Option<NaiveDate> {
+    if !(1..=9999).contains(&year) {
+        return None;
+    }
+    NaiveDate::from_ymd_opt(year as i32, month, day)
+}
+
+fn closest_leap_year(year: i32) -> i32 {
+    if year % 100 == 0 && year % 400 != 0 {
+        return year + 4;
+    }
+    if year % 4 == 0 {
+        return year;
+    }
+    if year % 100 > 96 && year % 400 <= 396 {
+        return year + (8 - year % 4);
+    }
+    year + (4 - year % 4)
+}
+
+fn days_in_month(date: NaiveDate) -> u32 {
+    let (year, month) = match date.month() {
+        12 => (date.year() + 1, 1),
+        m => (date.year(), m + 1),
+    };
+    NaiveDate::from_ymd_opt(year, month, 1)
+        .map(|next| {
+            next.signed_duration_since(date.with_day(1).unwrap())
+                .num_days() as u32
+        })
+        .unwrap_or(31)
+}
+
+const UNIX_EPOCH_DAYS_FROM_CE: i32 = 719_163;
+
+fn from_days(days: i32) -> Option<NaiveDate> {
+    NaiveDate::from_num_days_from_ce_opt(days.checked_add(UNIX_EPOCH_DAYS_FROM_CE)?)
+}
+
+fn to_days(date: NaiveDate) -> i32 {
+    date.num_days_from_ce() - UNIX_EPOCH_DAYS_FROM_CE
+}
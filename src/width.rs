@@ -0,0 +1,235 @@
+use std::sync::LazyLock;
+
+use serde::Deserialize;
+
+// カタカナ・記号の全角と半角の対応 (mojimoji と同じ対応表)
+const KANA_ZENKAKU: &str = "アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモヤユヨラリルレロワヲンァィゥェォッャュョ。、・゛゜「」ー";
+const KANA_HANKAKU: &str = "ｱｲｳｴｵｶｷｸｹｺｻｼｽｾｿﾀﾁﾂﾃﾄﾅﾆﾇﾈﾉﾊﾋﾌﾍﾎﾏﾐﾑﾒﾓﾔﾕﾖﾗﾘﾙﾚﾛﾜｦﾝｧｨｩｪｫｯｬｭｮ｡､･ﾞﾟ｢｣ｰ";
+// 濁点付きのカタカナと、対応する半角カタカナ
+const KANA_TEN_ZENKAKU: &str = "ガギグゲゴザジズゼゾダヂヅデドバビブベボヴ";
+const KANA_TEN_HANKAKU: &str = "ｶｷｸｹｺｻｼｽｾｿﾀﾁﾂﾃﾄﾊﾋﾌﾍﾎｳ";
+// 半濁点付きのカタカナと、対応する半角カタカナ
+const KANA_MARU_ZENKAKU: &str = "パピプペポ";
+const KANA_MARU_HANKAKU: &str = "ﾊﾋﾌﾍﾎ";
+
+const HANKAKU_TEN: char = 'ﾞ';
+const HANKAKU_MARU: char = 'ﾟ';
+
+/// 全角カタカナ・記号 (U+3000〜U+30FF) の変換表の開始位置
+const ZENKAKU_KANA_START: u32 = 0x3000;
+/// 半角カタカナ・記号 (U+FF61〜U+FF9F) の変換表の開始位置
+const HANKAKU_KANA_START: u32 = 0xFF61;
+
+/// 全角→半角のカタカナ変換表 (半角文字, 濁点・半濁点)
+static ZEN_TO_HAN_KANA: LazyLock<[(char, Option<char>); 0x100]> = LazyLock::new(|| {
+    let mut table = [('\0', None); 0x100];
+    for (z, h) in KANA_ZENKAKU.chars().zip(KANA_HANKAKU.chars()) {
+        table[(z as u32 - ZENKAKU_KANA_START) as usize] = (h, None);
+    }
+    for (z, h) in KANA_TEN_ZENKAKU.chars().zip(KANA_TEN_HANKAKU.chars()) {
+        table[(z as u32 - ZENKAKU_KANA_START) as usize] = (h, Some(HANKAKU_TEN));
+    }
+    for (z, h) in KANA_MARU_ZENKAKU.chars().zip(KANA_MARU_HANKAKU.chars()) {
+        table[(z as u32 - ZENKAKU_KANA_START) as usize] = (h, Some(HANKAKU_MARU));
+    }
+    table
+});
+
+/// 半角→全角のカタカナ変換表 (全角文字, 濁点付き, 半濁点付き)
+static HAN_TO_ZEN_KANA: LazyLock<[(char, Option<char>, Option<char>); 0x3F]> =
+    LazyLock::new(|| {
+        let mut table = [('\0', None, None); 0x3F];
+        for (z, h) in KANA_ZENKAKU.chars().zip(KANA_HANKAKU.chars()) {
+            table[(h as u32 - HANKAKU_KANA_START) as usize].0 = z;
+        }
+        for (z, h) in KANA_TEN_ZENKAKU.chars().zip(KANA_TEN_HANKAKU.chars()) {
+            table[(h as u32 - HANKAKU_KANA_START) as usize].1 = Some(z);
+        }
+        for (z, h) in KANA_MARU_ZENKAKU.chars().zip(KANA_MARU_HANKAKU.chars()) {
+            table[(h as u32 - HANKAKU_KANA_START) as usize].2 = Some(z);
+        }
+        table
+    });
+
+/// 英数字・記号・スペースだけを全角→半角変換する設定 (金額の解析などで使う)
+const ASCII_TO_HALF_WIDTH: WidthKwargs = WidthKwargs {
+    ascii: true,
+    digit: true,
+    kana: false,
+    ignore: String::new(),
+};
+
+/// 半角カタカナだけを半角→全角変換する設定
+const KANA_TO_FULL_WIDTH: WidthKwargs = WidthKwargs {
+    ascii: false,
+    digit: false,
+    kana: true,
+    ignore: String::new(),
+};
+
+/// 全角の英数字・記号・スペースを半角にした文字 (その他の文字はそのまま)
+#[inline]
+pub fn ascii_to_half_width_char(c: char) -> char {
+    ASCII_TO_HALF_WIDTH.zen_to_han_char(c).map_or(c, |(h, _)| h)
+}
+
+/// 半角カタカナを全角にした文字 (その他の文字はそのまま)
+///
+/// 濁点・半濁点の結合は `combine_mark` で行います。
+#[inline]
+pub fn kana_to_full_width_char(c: char) -> char {
+    KANA_TO_FULL_WIDTH.han_to_zen_char(c).unwrap_or(c)
+}
+
+/// `to_half_width` / `to_full_width` プラグインの引数
+#[derive(Deserialize)]
+pub struct WidthKwargs {
+    /// 英字・記号・スペースを変換する
+    ascii: bool,
+    /// 数字を変換する
+    digit: bool,
+    /// カタカナ・句読点などの記号を変換する
+    kana: bool,
+    /// 変換しない文字
+    ignore: String,
+}
+
+impl WidthKwargs {
+    #[inline]
+    fn is_ignored(&self, c: char) -> bool {
+        !self.ignore.is_empty() && self.ignore.contains(c)
+    }
+
+    /// 全角→半角の1文字の変換結果 (濁点・半濁点付きのカタカナは2文字になる)
+    #[inline]
+    fn zen_to_han_char(&self, c: char) -> Option<(char, Option<char>)> {
+        let cp = c as u32;
+        let converted = match c {
+            '０'..='９' if self.digit => Some((char_from(cp - 0xFEE0), None)),
+            '０'..='９' => None,
+            // ＂＇｀ は対象外 (”’‘ を '"', '\'', '`' に変換する)
+            '＂' | '＇' | '｀' => None,
+            '！'..='～' if self.ascii => Some((char_from(cp - 0xFEE0), None)),
+            '”' if self.ascii => Some(('"', None)),
+            '’' if self.ascii => Some(('\'', None)),
+            '‘' if self.ascii => Some(('`', None)),
+            '￥' if self.ascii => Some(('¥', None)),
+            '　' if self.ascii => Some((' ', None)),
+            '\u{3000}'..='\u{30FF}' if self.kana => {
+                match ZEN_TO_HAN_KANA[(cp - ZENKAKU_KANA_START) as usize] {
+                    ('\0', _) => None,
+                    converted => Some(converted),
+                }
+            }
+            _ => None,
+        };
+        match converted {
+            Some(_) if self.is_ignored(c) => None,
+            converted => converted,
+        }
+    }
+
+    /// 半角→全角の1文字の変換結果
+    #[inline]
+    fn han_to_zen_char(&self, c: char) -> Option<char> {
+        let cp = c as u32;
+        let converted = match c {
+            '0'..='9' if self.digit => Some(char_from(cp + 0xFEE0)),
+            '0'..='9' => None,
+            '"' if self.ascii => Some('”'),
+            '\'' if self.ascii => Some('’'),
+            '`' if self.ascii => Some('‘'),
+            ' ' if self.ascii => Some('　'),
+            '!'..='~' if self.ascii => Some(char_from(cp + 0xFEE0)),
+            '¥' if self.ascii => Some('￥'),
+            '\u{FF61}'..='\u{FF9F}' if self.kana => {
+                Some(HAN_TO_ZEN_KANA[(cp - HANKAKU_KANA_START) as usize].0)
+            }
+            _ => None,
+        };
+        match converted {
+            Some(_) if self.is_ignored(c) => None,
+            converted => converted,
+        }
+    }
+
+    /// 全角→半角変換の結果を `buf` に書き込む
+    pub fn zen_to_han_into(&self, val: &str, buf: &mut String) {
+        for c in val.chars() {
+            match self.zen_to_han_char(c) {
+                Some((h, mark)) => {
+                    buf.push(h);
+                    if let Some(mark) = mark {
+                        buf.push(mark);
+                    }
+                }
+                None => buf.push(c),
+            }
+        }
+    }
+
+    /// 半角→全角変換の結果を `buf` に書き込む
+    ///
+    /// 半角カタカナに続く濁点・半濁点は、濁点・半濁点付きの1文字に結合します。
+    pub fn han_to_zen_into(&self, val: &str, buf: &mut String) {
+        // 直前の文字 (結合の対象となる変換前の半角カタカナ)
+        let mut prev: Option<char> = None;
+        for c in val.chars() {
+            if self.kana && (c == HANKAKU_TEN || c == HANKAKU_MARU) && !self.is_ignored(c) {
+                if let Some(combined) = prev.and_then(|p| combine_mark(p, c)) {
+                    buf.pop();
+                    buf.push(combined);
+                    prev = Some(c);
+                    continue;
+                }
+            }
+            match self.han_to_zen_char(c) {
+                Some(z) => {
+                    buf.push(z);
+                    prev = Some(c);
+                }
+                None => {
+                    buf.push(c);
+                    prev = None;
+                }
+            }
+        }
+    }
+
+    /// 全角→半角変換で変化しない文字列かどうか
+    ///
+    /// ASCIIのみの文字列は変換対象を含まないため、文字単位の判定を省略します。
+    pub fn is_half_width_stable(&self, val: &str) -> bool {
+        val.is_ascii() || !val.chars().any(|c| self.zen_to_han_char(c).is_some())
+    }
+
+    /// 半角→全角変換で変化しない文字列かどうか
+    pub fn is_full_width_stable(&self, val: &str) -> bool {
+        if val.is_ascii() {
+            return !val
+                .bytes()
+                .any(|b| self.han_to_zen_char(b as char).is_some());
+        }
+        !val.chars().any(|c| self.han_to_zen_char(c).is_some())
+    }
+}
+
+#[inline]
+fn char_from(cp: u32) -> char {
+    char::from_u32(cp).unwrap_or(char::REPLACEMENT_CHARACTER)
+}
+
+/// 半角カタカナと濁点・半濁点を結合した全角カタカナ
+#[inline]
+pub fn combine_mark(base: char, mark: char) -> Option<char> {
+    let cp = base as u32;
+    if !(HANKAKU_KANA_START..HANKAKU_KANA_START + 0x3F).contains(&cp) {
+        return None;
+    }
+    let (_, ten, maru) = HAN_TO_ZEN_KANA[(cp - HANKAKU_KANA_START) as usize];
+    if mark == HANKAKU_TEN {
+        ten
+    } else {
+        maru
+    }
+}
@@ -0,0 +1,118 @@
+from decimal import Decimal
+
+import polars as pl
+import polars_japanese  # noqa: F401
+import pytest
+
+
+def test_parse_amount():
+    """金額の文字列を Int64 に変換できることを確認"""
+    data = [
+        "1,234円",
+        "１２万円",
+        "1.2億",
+        "1億2,345万6,789円",
+        "△1,234",
+        "▲500",
+        "¥-1,234",
+        "￥１，２３４",
+        "三千円",
+        "円",
+        "abc",
+        None,
+    ]
+    expected = [
+        1234,
+        120000,
+        120000000,
+        123456789,
+        -1234,
+        -500,
+        -1234,
+        1234,
+        3000,
+        None,
+        None,
+        None,
+    ]
+    df = pl.DataFrame({"test": data})
+    result = df.select(pl.col("test").ja.parse_amount()).to_series()
+
+    assert result.dtype == pl.Int64
+    assert result.to_list() == expected
+
+
+def test_parse_amount_decimal():
+    """Decimal を指定すると小数点以下の金額を残せることを確認"""
+    df = pl.DataFrame({"test": ["1,234.56円", "△0.5", "1.2345万"]})
+    result = df.select(
+        pl.col("test").ja.parse_amount(dtype=pl.Decimal(scale=2))
+    ).to_series()
+
+    assert result.dtype == pl.Decimal(38, 2)
+    assert result.to_list() == [
+        Decimal("1234.56"),
+        Decimal("-0.50"),
+        Decimal("12345.00"),
+    ]
+
+
+@pytest.mark.parametrize("dtype", [pl.Float64, pl.Decimal(scale=19)])
+def test_parse_amount_invalid_dtype(dtype):
+    """Int64, Decimal 以外の型を指定するとエラーになることを確認"""
+    with pytest.raises(ValueError):
+        pl.col("test").ja.parse_amount(dtype=dtype)
+
+
+@pytest.mark.parametrize(
+    ("style", "expected"),
+    [
+        ("mixed", ["1億2,345万6,789円", "1万円", "0円", "-1,234円", None]),
+        (
+            "daiji",
+            [
+                "壱億弐阡参佰肆拾伍萬陸阡漆佰捌拾玖円",
+                "壱萬円",
+                "零円",
+                "-壱阡弐佰参拾肆円",
+                None,
+            ],
+        ),
+        ("comma", ["123,456,789円", "10,000円", "0円", "-1,234円", None]),
+    ],
+)
+def test_format_amount(style, expected):
+    """数値を金額の表記に変換できることを確認"""
+    df = pl.DataFrame({"test": [123456789, 10000, 0, -1234, None]})
+    result = df.select(pl.col("test").ja.format_amount(style=style)).to_series()
+
+    assert result.to_list() == expected
+
+
+def test_format_amount_decimal():
+    """Decimal 型の小数点以下の桁を残して変換できることを確認"""
+    df = pl.DataFrame(
+        {"test": [Decimal("12345.60"), Decimal("-0.50")]},
+        schema={"test": pl.Decimal(38, 2)},
+    )
+    result = df.select(
+        mixed=pl.col("test").ja.format_amount(),
+        daiji=pl.col("test").ja.format_amount(style="daiji", suffix=""),
+    )
+
+    assert result["mixed"].to_list() == ["1万2,345.60円", "-0.50円"]
+    assert result["daiji"].to_list() == ["壱萬弐阡参佰肆拾伍", "零"]
+
+
+def test_format_amount_roundtrip():
+    """mixed の表記を parse_amount で元の値に戻せることを確認"""
+    df = pl.DataFrame({"test": [123456789, -1000, 0]})
+    result = df.select(pl.col("test").ja.format_amount().ja.parse_amount())
+
+    assert result["test"].to_list() == [123456789, -1000, 0]
+
+
+def test_format_amount_invalid_style():
+    """未対応の表記を指定するとエラーになることを確認"""
+    with pytest.raises(ValueError):
+        pl.col("test").ja.format_amount(style="kanji")
@@ -0,0 +1,156 @@
+from datetime import date
+
+import polars as pl
+import polars_japanese  # noqa: F401
+import pytest
+from polars_japanese import calendar
+
+
+def test_register_extra_days():
+    """追加の休日・営業日を持つカレンダーで判定できることを確認"""
+    calendar.register(
+        "test_extra",
+        extra_holidays=["12-29", "12-30", "12-31", "01-02", "01-03"],
+        extra_workdays=[date(2024, 11, 16)],
+    )
+    data = [
+        date(2023, 12, 28),  # 木曜日
+        date(2023, 12, 29),  # 年末休業
+        date(2024, 1, 1),  # 元日
+        date(2024, 1, 3),  # 年始休業
+        date(2024, 1, 4),  # 木曜日
+        date(2024, 11, 16),  # 出勤日の土曜日
+        date(1900, 1, 1),  # 表の範囲外
+    ]
+    df = pl.DataFrame({"test": data})
+
+    result_df = df.select(
+        pl.col("test").ja.is_holiday(calendar="test_extra").alias("is_holiday"),
+        pl.col("test").ja.is_business_day(calendar="test_extra").alias("is_bd"),
+        pl.col("test").ja.holiday_name(calendar="test_extra").alias("name"),
+    )
+
+    assert result_df["is_holiday"].to_list() == [
+        False,
+        True,
+        True,
+        True,
+        False,
+        False,
+        None,
+    ]
+    assert result_df["is_bd"].to_list() == [True, False, False, False, True, True, None]
+    assert result_df["name"].to_list() == [
+        None,
+        "休日",
+        "元日",
+        "休日",
+        None,
+        None,
+        None,
+    ]
+
+    # 既定のカレンダーは変わらない
+    assert df.select(pl.col("test").ja.is_business_day()).to_series().to_list() == [
+        True,
+        True,
+        False,
+        True,
+        True,
+        False,
+        False,
+    ]
+
+
+def test_register_business_day_arithmetic():
+    """営業日の加算・営業日の数がカレンダーの休日を考慮することを確認"""
+    calendar.register("test_arith", extra_holidays={"2024-05-07": "創立記念日"})
+    df = pl.DataFrame({"test": [date(2024, 5, 2)]})
+
+    result_df = df.select(
+        pl.col("test").ja.add_business_days(1, calendar="test_arith").alias("next"),
+        pl.col("test")
+        .ja.business_days_between(date(2024, 5, 10), calendar="test_arith")
+        .alias("count"),
+        pl.col("test").ja.add_business_days(1).alias("default_next"),
+    )
+
+    assert result_df["next"].to_list() == [date(2024, 5, 8)]
+    assert result_df["count"].to_list() == [3]
+    assert result_df["default_next"].to_list() == [date(2024, 5, 7)]
+
+
+def test_register_from_csv(tmp_path):
+    """内閣府の syukujitsu.csv 形式 (Shift_JIS) の CSV を読み込めることを確認"""
+    path = tmp_path / "syukujitsu.csv"
+    path.write_bytes(
+        "国民の祝日・休日月日,国民の祝日・休日名称\r\n"
+        "2024/1/1,元日\r\n"
+        "2024/1/8,成人の日\r\n"
+        "2024/2/12,休日\r\n".encode("cp932")
+    )
+    calendar.register("test_csv", from_csv=path, extra_holidays=["2024-01-02"])
+    df = pl.DataFrame(
+        {
+            "test": [
+                date(2024, 1, 1),
+                date(2024, 1, 2),
+                date(2024, 1, 8),
+                date(2024, 2, 11),  # 建国記念の日 (CSV にない)
+                date(2024, 2, 12),
+            ]
+        }
+    )
+
+    result = df.select(pl.col("test").ja.holiday_name(calendar="test_csv"))
+
+    assert result.to_series().to_list() == ["元日", "休日", "成人の日", None, "休日"]
+
+
+def test_register_base(tmp_path):
+    """登録済みのカレンダーを元にしたカレンダーを登録できることを確認"""
+    path = tmp_path / "holidays.csv"
+    path.write_text("date\n2024-06-03\n", encoding="utf-8")
+    calendar.register("test_base", from_csv=path, extra_workdays=["2024-06-08"])
+    calendar.register("test_branch", base="test_base", extra_holidays=["2024-06-04"])
+    df = pl.DataFrame({"test": [date(2024, 6, 3), date(2024, 6, 4), date(2024, 6, 8)]})
+
+    result = df.select(pl.col("test").ja.is_business_day(calendar="test_branch"))
+
+    assert result.to_series().to_list() == [False, False, True]
+
+
+def test_register_base_workday_closed():
+    """base で営業日とした日を休日にすると、営業日でなくなることを確認"""
+    calendar.register("test_workday_base", extra_workdays=["2024-11-16"])
+    calendar.register(
+        "test_workday_branch",
+        base="test_workday_base",
+        extra_holidays=["2024-11-16"],
+    )
+    df = pl.DataFrame({"test": [date(2024, 11, 16)]})
+
+    result_df = df.select(
+        pl.col("test").ja.is_holiday(calendar="test_workday_branch").alias("hol"),
+        pl.col("test").ja.is_business_day(calendar="test_workday_branch").alias("bd"),
+        pl.col("test").ja.is_business_day(calendar="test_workday_base").alias("base"),
+    )
+
+    assert result_df["hol"].to_list() == [True]
+    assert result_df["bd"].to_list() == [False]
+    assert result_df["base"].to_list() == [True]
+
+
+def test_register_errors(tmp_path):
+    """未登録のカレンダーや不正な日付がエラーになることを確認"""
+    with pytest.raises(ValueError, match="未登録のカレンダー"):
+        pl.select(pl.lit(date(2024, 1, 1)).ja.is_holiday(calendar="unknown"))
+    with pytest.raises(ValueError, match="未登録のカレンダー"):
+        calendar.register("test_error", base="unknown")
+    with pytest.raises(ValueError, match="範囲"):
+        calendar.register("test_error", extra_holidays=[date(2100, 1, 1)])
+
+    path = tmp_path / "invalid.csv"
+    path.write_text("date\n2024年1月1日\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="日付を解析できません"):
+        calendar.register("test_error", from_csv=path)
@@ -4,6 +4,7 @@ import polars as pl
 import polars_japanese  # noqa: F401
 import pytest
 from polars.testing import assert_frame_equal
+from polars_japanese.datetime_util import WEEKDAY_ENUM, WEEKDAY_SHORT_ENUM
 
 
 def test_to_japanese_weekday_date_default_format():
@@ -25,21 +26,25 @@ def test_to_japanese_weekday_date_default_format():
             ],
             "weekday_ja": ["金曜日", "月曜日", None],
         }
-    ).with_columns(pl.col("weekday_ja").cast(pl.String))
+    ).with_columns(pl.col("weekday_ja").cast(WEEKDAY_ENUM))
     result = df.with_columns(weekday_ja=pl.col("dates").ja.to_weekday_name())
     assert_frame_equal(result, expected, check_dtypes=True)
 
 
 def test_to_japanese_weekday_date_format_A():
     df = pl.DataFrame({"dates": [date(2024, 5, 10)]})  # 金曜日
-    expected = pl.DataFrame({"dates": [date(2024, 5, 10)], "weekday_ja": ["金曜日"]})
+    expected = pl.DataFrame(
+        {"dates": [date(2024, 5, 10)], "weekday_ja": ["金曜日"]}
+    ).cast({"weekday_ja": WEEKDAY_ENUM})
     result = df.with_columns(weekday_ja=pl.col("dates").ja.to_weekday_name(format="%A"))
     assert_frame_equal(result, expected, check_dtypes=True)
 
 
 def test_to_japanese_weekday_date_format_a():
     df = pl.DataFrame({"dates": [date(2024, 5, 10)]})  # 金
-    expected = pl.DataFrame({"dates": [date(2024, 5, 10)], "weekday_ja": ["金"]})
+    expected = pl.DataFrame({"dates": [date(2024, 5, 10)], "weekday_ja": ["金"]}).cast(
+        {"weekday_ja": WEEKDAY_SHORT_ENUM}
+    )
     result = df.with_columns(weekday_ja=pl.col("dates").ja.to_weekday_name(format="%a"))
     assert_frame_equal(result, expected, check_dtypes=True)
 
@@ -61,7 +66,7 @@ def test_to_japanese_weekday_datetime_default_format():
             ],
             "weekday_ja": ["日曜日", None],
         }
-    ).with_columns(pl.col("weekday_ja").cast(pl.String))
+    ).with_columns(pl.col("weekday_ja").cast(WEEKDAY_ENUM))
     result = df.with_columns(weekday_ja=pl.col("datetimes").ja.to_weekday_name())
     assert_frame_equal(result, expected, check_dtypes=True)
 
@@ -70,7 +75,7 @@ def test_to_japanese_weekday_datetime_format_A():
     df = pl.DataFrame({"datetimes": [datetime(2024, 5, 12, 10, 30, 0)]})  # 日曜日
     expected = pl.DataFrame(
         {"datetimes": [datetime(2024, 5, 12, 10, 30, 0)], "weekday_ja": ["日曜日"]}
-    )
+    ).cast({"weekday_ja": WEEKDAY_ENUM})
     result = df.with_columns(
         weekday_ja=pl.col("datetimes").ja.to_weekday_name(format="%A")
     )
@@ -81,7 +86,7 @@ def test_to_japanese_weekday_datetime_format_a():
     df = pl.DataFrame({"datetimes": [datetime(2024, 5, 12, 10, 30, 0)]})  # 日
     expected = pl.DataFrame(
         {"datetimes": [datetime(2024, 5, 12, 10, 30, 0)], "weekday_ja": ["日"]}
-    )
+    ).cast({"weekday_ja": WEEKDAY_SHORT_ENUM})
     result = df.with_columns(
         weekday_ja=pl.col("datetimes").ja.to_weekday_name(format="%a")
     )
@@ -93,7 +98,7 @@ def test_to_japanese_weekday_empty():
     expected = pl.DataFrame(
         {
             "dates": pl.Series([], dtype=pl.Date),
-            "weekday_ja": pl.Series([], dtype=pl.String),
+            "weekday_ja": pl.Series([], dtype=WEEKDAY_ENUM),
         }
     )
     result = df.with_columns(weekday_ja=pl.col("dates").ja.to_weekday_name())
@@ -105,7 +110,7 @@ def test_to_japanese_weekday_all_null():
     expected = pl.DataFrame(
         {
             "dates": pl.Series([None, None], dtype=pl.Date),
-            "weekday_ja": pl.Series([None, None], dtype=pl.String),
+            "weekday_ja": pl.Series([None, None], dtype=WEEKDAY_ENUM),
         }
     )
     result = df.with_columns(weekday_ja=pl.col("dates").ja.to_weekday_name())
@@ -128,9 +133,12 @@ def test_weekday_values():
     expected_full = pl.Series(
         "weekday_full",
         ["月曜日", "火曜日", "水曜日", "木曜日", "金曜日", "土曜日", "日曜日"],
+        dtype=WEEKDAY_ENUM,
     )
     expected_short = pl.Series(
-        "weekday_short", ["月", "火", "水", "木", "金", "土", "日"]
+        "weekday_short",
+        ["月", "火", "水", "木", "金", "土", "日"],
+        dtype=WEEKDAY_SHORT_ENUM,
     )
 
     result_full = df.select(
@@ -144,6 +152,14 @@ def test_weekday_values():
     assert_frame_equal(result_short, expected_short.to_frame(), check_dtypes=True)
 
 
+def test_weekday_name_sort_order():
+    # Enum 型のため、曜日名は月曜日から順に並ぶ
+    dates = [date(2024, 5, 19), date(2024, 5, 15), date(2024, 5, 13)]  # 日, 水, 月
+    df = pl.DataFrame({"dates": dates})
+    result = df.select(pl.col("dates").ja.to_weekday_name().sort()).to_series()
+    assert result.to_list() == ["月曜日", "水曜日", "日曜日"]
+
+
 def test_to_jst_naive_utc():
     # naive datetime (UTCとみなされる)
     df = pl.DataFrame({"datetimes": [datetime(2024, 5, 17, 0, 0, 0)]})
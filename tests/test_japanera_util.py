@@ -87,6 +87,51 @@ def test_expr_to_datetime_with_format() -> None:
     assert_series_equal(result, expected)
 
 
+@pytest.mark.parametrize(
+    "format",
+    ["%-K%-y年%m月%d日", "%-h%-y.%m.%d", "%-K%-n年%-m月%-d日", "%-E %-y %B %d"],
+)
+def test_expr_to_datetime_matches_japanera(format: str) -> None:
+    """japanera の strptime と同じ結果になることを確認"""
+    from japanera import EraDate
+
+    dates = [
+        dt.date(2019, 4, 30),
+        dt.date(2019, 5, 1),
+        dt.date(1989, 1, 7),
+        dt.date(1989, 1, 8),
+        dt.date(1868, 10, 23),
+        dt.date(1350, 6, 1),
+        dt.date(645, 7, 20),
+    ]
+    data = [EraDate.from_date(d).strftime(format) for d in dates]
+    data += ["平成元年1月8日", "令和6年2月30日", "R6.4.1", "h02.1.8", "", "令和"]
+
+    def _expected(x: str) -> dt.date | None:
+        try:
+            return EraDate.strptime(x, format)[0].to_date()
+        except ValueError:
+            return None
+
+    series = pl.Series("date_str", data)
+    result_df = series.to_frame().select(
+        pl.col("date_str").ja.to_datetime(format=format, raise_error=False)
+    )
+    expected = pl.Series("date_str", [_expected(x) for x in data], dtype=pl.Date)
+
+    assert_series_equal(result_df.to_series(), expected)
+
+
+def test_expr_to_datetime_categorical() -> None:
+    """Categorical 型の和暦を日付型に変換できることを確認"""
+    series = pl.Series("date_str", ["令和6年4月12日", None], dtype=pl.Categorical)
+
+    result_df = series.to_frame().select(pl.col("date_str").ja.to_datetime())
+    expected = pl.Series("date_str", [dt.date(2024, 4, 12), None], dtype=pl.Date)
+
+    assert_series_equal(result_df.to_series(), expected)
+
+
 def test_expr_to_wareki() -> None:
     """日付型を和暦に変換できることを確認"""
     data = [
@@ -139,3 +184,202 @@ def test_expr_to_wareki_with_format() -> None:
     expected = pl.Series("date", expected_data, dtype=pl.Utf8)
 
     assert_series_equal(result, expected)
+
+
+def test_expr_to_wareki_matches_japanera() -> None:
+    """japanera の strftime と同じ結果になることを確認"""
+    from japanera import EraDate
+
+    format = "%-K%-n年%-m月%-d日(%-a) %-E %-e %-h %-N %-y %-Y %Y/%m/%d"
+    data = [
+        dt.date(2019, 4, 30),
+        dt.date(2019, 5, 1),
+        dt.date(1989, 1, 7),
+        dt.date(1989, 1, 8),
+        dt.date(1868, 10, 23),
+        dt.date(1845, 1, 9),
+        dt.date(1350, 6, 1),
+        dt.date(600, 1, 1),
+        dt.date(2100, 12, 31),
+    ]
+    series = pl.Series("date", data, dtype=pl.Date)
+
+    result = series.to_frame().select(pl.col("date").ja.to_wareki(format=format))
+    expected = [EraDate.from_date(d).strftime(format) for d in data]
+
+    assert result.to_series().to_list() == expected
+
+
+@pytest.mark.parametrize(
+    "format",
+    [
+        "%-K%-y年 %A %a %B %b %h %j %e %u %w %H:%M:%S %I%p %y %%",
+        "%-K%-y年 %-A",
+        "%-E %-B %-b",
+        "%-E%-o",
+        "%-O",
+        "%c",
+    ],
+)
+def test_expr_to_wareki_matches_japanera_strftime(format: str) -> None:
+    """strftime の指定子を含むフォーマットで japanera と同じ結果になることを確認"""
+    from japanera import EraDate
+
+    data = [dt.date(2020, 5, 1), dt.date(1989, 1, 7), dt.date(1350, 6, 1), None]
+    series = pl.Series("date", data, dtype=pl.Date)
+
+    result = series.to_frame().select(pl.col("date").ja.to_wareki(format=format))
+    expected = [
+        None if d is None else EraDate.from_date(d).strftime(format) for d in data
+    ]
+
+    assert result.to_series().to_list() == expected
+    assert result.columns == ["date"]
+
+
+def test_expr_to_wareki_unsupported_directive_out_of_range() -> None:
+    """japanera で変換するフォーマットでも範囲外の日付を扱えることを確認"""
+    series = pl.Series("date", [dt.date(2020, 5, 1), dt.date.max, None])
+    df = series.to_frame()
+
+    with pytest.raises(Exception, match="和暦に変換できない日付"):
+        df.select(pl.col("date").ja.to_wareki(format="%-K %-A"))
+
+    result = df.select(pl.col("date").ja.to_wareki(format="%-K %-A", raise_error=False))
+
+    assert result.to_series().to_list() == ["令和 Friday", None, None]
+
+
+def test_expr_to_wareki_datetime() -> None:
+    """Datetime 型の日付部分を和暦に変換できることを確認"""
+    data = [dt.datetime(2019, 5, 1, 12, 30), None]
+    series = pl.Series("datetime", data, dtype=pl.Datetime)
+
+    result_df = series.to_frame().select(
+        pl.col("datetime").ja.to_wareki(format="%-K%-n年%-m月%-d日 %H時")
+    )
+    expected = pl.Series("datetime", ["令和元年五月一日 00時", None], dtype=pl.Utf8)
+
+    assert_series_equal(result_df.to_series(), expected)
+
+
+def test_expr_to_wareki_out_of_range() -> None:
+    """和暦に変換できない日付がエラーまたは null になることを確認"""
+    series = pl.Series("date", [dt.date(2024, 4, 12), dt.date.max, None])
+    df = series.to_frame()
+
+    with pytest.raises(Exception, match="和暦に変換できない日付"):
+        df.select(pl.col("date").ja.to_wareki())
+
+    result_df = df.select(pl.col("date").ja.to_wareki(raise_error=False))
+    expected = pl.Series("date", ["令和6年04月12日", None, None], dtype=pl.Utf8)
+
+    assert_series_equal(result_df.to_series(), expected)
+
+
+def test_expr_era_and_era_year() -> None:
+    """日付から元号と元号の年を求められることを確認"""
+    from japanera import EraDate
+
+    data = [
+        dt.date(2020, 5, 1),
+        dt.date(2019, 4, 30),
+        dt.date(1989, 1, 7),
+        dt.date(1989, 1, 8),
+        dt.date(1845, 1, 9),
+        dt.date(1350, 6, 1),
+        None,
+    ]
+    df = pl.Series("date", data, dtype=pl.Date).to_frame()
+
+    result = df.select(
+        pl.col("date").ja.era().alias("era"),
+        pl.col("date").ja.era_year().alias("year"),
+    )
+
+    assert isinstance(result.schema["era"], pl.Enum)
+    assert result.schema["year"] == pl.Int32
+    expected = [
+        None if d is None else EraDate.from_date(d).strftime("%-K %-Y") for d in data
+    ]
+    assert [
+        None if era is None else f"{era} {year}" for era, year in result.iter_rows()
+    ] == expected
+
+
+def test_expr_to_wareki_struct() -> None:
+    """日付を元号・年・月・日の構造体に変換できることを確認"""
+    data = [dt.datetime(2020, 5, 1, 12), dt.datetime(1989, 1, 7), None]
+    df = pl.Series("date", data, dtype=pl.Datetime).to_frame()
+
+    result = df.select(pl.col("date").ja.to_wareki_struct()).to_series()
+
+    assert result.name == "date"
+    assert result.to_list() == [
+        {"era": "令和", "year": 2, "month": 5, "day": 1},
+        {"era": "昭和", "year": 64, "month": 1, "day": 7},
+        None,
+    ]
+
+
+def test_expr_era_group_by() -> None:
+    """元号で集計でき、元号の開始日の順に並ぶことを確認"""
+    data = [dt.date(2020, 1, 1), dt.date(1990, 1, 1), dt.date(2021, 1, 1)]
+    df = pl.Series("date", data, dtype=pl.Date).to_frame()
+
+    result = df.group_by(pl.col("date").ja.era().alias("era")).len().sort("era")
+
+    assert result["era"].cast(pl.String).to_list() == ["平成", "令和"]
+    assert result["len"].to_list() == [1, 2]
+
+
+def test_expr_parse_wareki() -> None:
+    """フォーマットを指定せずに和暦を日付型に変換できることを確認"""
+    data = [
+        "R5.1.1",
+        "令和5年1月1日",
+        "H31/4/30",
+        "平成元年",
+        "令和五年十二月一日",
+        "Ｒ５．１２．１",
+        "S64-01-07",
+        "H31/5/1",
+        "令和5年2月30日",
+        "存在しない元号1年1月1日",
+        None,
+    ]
+    df = pl.Series("date_str", data).to_frame()
+
+    result_df = df.select(pl.col("date_str").ja.parse_wareki())
+
+    expected_data = [
+        dt.date(2023, 1, 1),
+        dt.date(2023, 1, 1),
+        dt.date(2019, 4, 30),
+        dt.date(1989, 1, 8),
+        dt.date(2023, 12, 1),
+        dt.date(2023, 12, 1),
+        dt.date(1989, 1, 7),
+        None,
+        None,
+        None,
+        None,
+    ]
+    expected = pl.Series("date_str", expected_data, dtype=pl.Date)
+
+    assert_series_equal(result_df.to_series(), expected)
+
+
+def test_expr_parse_wareki_return_pattern() -> None:
+    """一致したパターンを返せることを確認"""
+    data = ["R5.1.1", "令和5年1月1日", "令和五年一月一日", "不正な文字列"]
+    df = pl.Series("date_str", data).to_frame()
+
+    result = df.select(pl.col("date_str").ja.parse_wareki(return_pattern=True))
+
+    assert result.to_series().to_list() == [
+        {"date": dt.date(2023, 1, 1), "pattern": "alphabet"},
+        {"date": dt.date(2023, 1, 1), "pattern": "kanji"},
+        {"date": dt.date(2023, 1, 1), "pattern": "kanji_numeral"},
+        {"date": None, "pattern": None},
+    ]
@@ -1,6 +1,7 @@
-from datetime import date
+from datetime import date, datetime, timedelta
 
 import polars as pl
+import pytest
 from polars.testing import assert_series_equal
 
 import polars_japanese  # noqa: F401
@@ -62,3 +63,332 @@ def test_is_business_day():
     result = result_df.to_series()
 
     assert_series_equal(result, expected)
+
+
+def test_is_holiday_matches_jpholiday():
+    """祝日の表による判定が jpholiday と一致することを確認"""
+    import jpholiday
+
+    data = pl.date_range(date(2019, 1, 1), date(2020, 12, 31), eager=True)
+    df = data.alias("test").to_frame()
+
+    result = df.select(pl.col("test").ja.is_holiday()).to_series()
+    expected = pl.Series("test", [jpholiday.is_holiday(d) for d in data])
+
+    assert_series_equal(result, expected)
+
+
+def test_is_holiday_outside_table():
+    """祝日の表の範囲外の日付や Datetime 型・null も判定できることを確認"""
+    data = [
+        datetime(1900, 1, 1, 12),
+        datetime(1900, 1, 2),
+        datetime(2150, 1, 1),
+        datetime(2024, 5, 6, 9),
+        None,
+    ]
+    df = pl.Series("test", data).to_frame()
+
+    result_df = df.select(
+        pl.col("test").ja.is_holiday().alias("is_holiday"),
+        pl.col("test").ja.is_business_day().alias("is_business_day"),
+    )
+
+    assert result_df["is_holiday"].to_list() == [True, False, True, True, None]
+    assert result_df["is_business_day"].to_list() == [False, True, False, False, None]
+
+
+def test_holiday_name():
+    """祝日名を取得できることを確認"""
+    import jpholiday
+
+    data = [
+        date(2023, 1, 1),
+        date(2023, 1, 2),
+        date(2023, 1, 3),
+        date(2019, 4, 30),
+        date(1900, 1, 1),
+        None,
+    ]
+    df = pl.Series("test", data).to_frame()
+
+    result = df.select(pl.col("test").ja.holiday_name()).to_series()
+
+    assert isinstance(result.dtype, pl.Enum)
+    assert result.to_list() == [
+        None if d is None else jpholiday.is_holiday_name(d) for d in data
+    ]
+    assert result.to_list()[:4] == ["元日", "元日 振替休日", None, "国民の休日"]
+
+
+def _is_business_day(d: date) -> bool:
+    import jpholiday
+
+    return d.isoweekday() < 6 and not jpholiday.is_holiday(d)
+
+
+def _add_business_days(d: date, n: int) -> date:
+    step = 1 if n > 0 else -1
+    while n != 0:
+        d += timedelta(days=step)
+        if _is_business_day(d):
+            n -= step
+    return d
+
+
+def test_add_business_days():
+    """営業日の加算が1日ずつ数えた結果と一致することを確認"""
+    start = date(2023, 4, 25)
+    data = [start + timedelta(days=i) for i in range(20)]
+    df = pl.DataFrame({"test": data})
+
+    for n in [0, 1, 3, 10, -1, -3, -10]:
+        result = df.select(pl.col("test").ja.add_business_days(n)).to_series()
+        expected = pl.Series("test", [_add_business_days(d, n) for d in data])
+        assert_series_equal(result, expected)
+
+
+def test_add_business_days_expr():
+    """営業日数に列を指定でき、範囲外や null は null になることを確認"""
+    df = pl.DataFrame(
+        {
+            "test": [
+                date(2023, 1, 1),
+                date(2023, 1, 6),
+                date(2023, 1, 6),
+                date(2099, 12, 30),
+                date(1900, 1, 1),
+                None,
+            ],
+            "n": [1, 1, -2, 5, 1, 1],
+        },
+        schema={"test": pl.Date, "n": pl.Int32},
+    )
+
+    result = df.select(pl.col("test").ja.add_business_days("n")).to_series()
+
+    assert result.to_list() == [
+        date(2023, 1, 3),
+        date(2023, 1, 10),
+        date(2023, 1, 4),
+        None,
+        None,
+        None,
+    ]
+
+
+def test_business_days_between():
+    """営業日の数が numpy の busday_count と同じ数え方になることを確認"""
+    start = date(2023, 4, 20)
+    data = [start + timedelta(days=i) for i in range(30)]
+    end = date(2023, 5, 10)
+    df = pl.DataFrame({"test": data, "end": [end] * len(data)})
+
+    result = df.select(pl.col("test").ja.business_days_between("end")).to_series()
+    expected = [
+        sum(_is_business_day(d + timedelta(days=i)) for i in range((end - d).days))
+        - sum(_is_business_day(end + timedelta(days=i)) for i in range((d - end).days))
+        for d in data
+    ]
+
+    assert result.name == "test"
+    assert result.to_list() == expected
+    assert (
+        df.select(pl.col("test").ja.business_days_between(end)).to_series().to_list()
+        == expected
+    )
+
+
+def _roll_business_day(d: date, step: int) -> date:
+    while not _is_business_day(d):
+        d += timedelta(days=step)
+    return d
+
+
+def test_roll_business_day():
+    """営業日でない日付を前後の営業日に調整できることを確認"""
+    start = date(2023, 12, 20)
+    data = [start + timedelta(days=i) for i in range(30)] + [
+        date(2024, 3, 30),  # 土曜日 (翌営業日は翌月)
+        date(2099, 12, 31),  # 木曜日
+        None,
+    ]
+    df = pl.DataFrame({"test": data})
+
+    result_df = df.select(
+        pl.col("test").ja.roll_business_day().alias("forward"),
+        pl.col("test").ja.roll_business_day("backward").alias("backward"),
+        pl.col("test").ja.roll_business_day("modified_following").alias("modified"),
+    )
+
+    expected_forward = [None if d is None else _roll_business_day(d, 1) for d in data]
+    expected_backward = [None if d is None else _roll_business_day(d, -1) for d in data]
+    expected_modified = [
+        f if f is None or f.month == d.month else b
+        for d, f, b in zip(data, expected_forward, expected_backward)
+    ]
+    assert result_df["forward"].to_list() == expected_forward
+    assert result_df["backward"].to_list() == expected_backward
+    assert result_df["modified"].to_list() == expected_modified
+    assert result_df["modified"][30] == date(2024, 3, 29)
+
+    with pytest.raises(ValueError, match="未対応の調整方法"):
+        pl.col("test").ja.roll_business_day("nearest")
+
+
+def test_month_end_business_day():
+    """月末最終営業日を求められることを確認"""
+    data = [
+        date(2023, 9, 15),  # 9/30 は土曜日
+        datetime(2023, 12, 1, 9),  # 12/31 は日曜日
+        date(2024, 2, 29),  # 木曜日
+        date(2024, 11, 2),  # 11/30 は土曜日
+        date(1900, 1, 1),
+    ]
+    df = pl.Series("test", data, dtype=pl.Date, strict=False).to_frame()
+
+    result = df.select(pl.col("test").ja.month_end_business_day()).to_series()
+
+    assert result.name == "test"
+    assert result.to_list() == [
+        date(2023, 9, 29),
+        date(2023, 12, 29),
+        date(2024, 2, 29),
+        date(2024, 11, 29),
+        None,
+    ]
+
+
+def test_business_day_of_month_and_nth_business_day():
+    """月の何営業日目かと第 n 営業日を求められることを確認"""
+    start = date(2023, 12, 1)
+    data = [start + timedelta(days=i) for i in range(70)]
+    df = pl.DataFrame({"test": data})
+
+    result_df = df.select(
+        pl.col("test").ja.business_day_of_month().alias("index"),
+        pl.col("test").ja.nth_business_day(3).alias("third"),
+        pl.col("test").ja.nth_business_day(-1).alias("last"),
+        pl.col("test").ja.month_end_business_day().alias("month_end"),
+    )
+
+    business_days: dict[tuple[int, int], list[date]] = {}
+    for d in data:
+        if _is_business_day(d):
+            business_days.setdefault((d.year, d.month), []).append(d)
+    assert result_df["index"].to_list() == [
+        business_days[(d.year, d.month)].index(d) + 1 if _is_business_day(d) else None
+        for d in data
+    ]
+    assert result_df["third"].to_list() == [
+        business_days[(d.year, d.month)][2] for d in data
+    ]
+    assert result_df["last"].to_list() == result_df["month_end"].to_list()
+    assert result_df["third"][40] == date(2024, 1, 4)
+
+
+def test_nth_business_day_out_of_month():
+    """月の営業日の数を超える場合は null になることを確認"""
+    df = pl.DataFrame(
+        {"test": [date(2024, 2, 10)] * 5 + [None], "n": [1, 19, 20, -19, -20, 1]}
+    )
+
+    result = df.select(pl.col("test").ja.nth_business_day("n")).to_series()
+
+    assert result.to_list() == [
+        date(2024, 2, 1),
+        date(2024, 2, 29),
+        None,
+        date(2024, 2, 1),
+        None,
+        None,
+    ]
+
+
+def test_is_gotobi():
+    """五十日 (営業日でない場合は前営業日) を判定できることを確認"""
+    data = [
+        date(2024, 2, 5),  # 月曜日
+        date(2024, 2, 9),  # 金曜日 (2/10 は土曜日)
+        date(2024, 2, 10),  # 土曜日
+        date(2024, 2, 22),  # 木曜日 (2/23 は祝日、2/25 は日曜日)
+        date(2024, 2, 23),  # 天皇誕生日
+        date(2024, 2, 26),  # 月曜日
+        date(2024, 2, 29),  # 月末
+        date(2024, 3, 29),  # 金曜日 (3/31 は日曜日)
+        date(2024, 3, 30),  # 土曜日
+        date(1900, 1, 5),
+    ]
+    df = pl.DataFrame({"test": data})
+
+    result = df.select(pl.col("test").ja.is_gotobi()).to_series()
+
+    assert result.to_list() == [
+        True,
+        True,
+        False,
+        True,
+        False,
+        False,
+        True,
+        True,
+        False,
+        None,
+    ]
+
+
+def test_business_date_range():
+    """営業日だけの日付の範囲を生成できることを確認"""
+    start, end = date(2023, 12, 20), date(2024, 1, 20)
+    expected = [
+        start + timedelta(days=i)
+        for i in range((end - start).days + 1)
+        if _is_business_day(start + timedelta(days=i))
+    ]
+
+    result = polars_japanese.business_date_range(start, end, eager=True)
+
+    assert result.dtype == pl.Date
+    assert result.to_list() == expected
+    assert polars_japanese.business_date_range(end, start, eager=True).len() == 0
+    assert polars_japanese.business_date_range(
+        date(2099, 12, 30), date(2100, 1, 10), eager=True
+    ).to_list() == [date(2099, 12, 30), date(2099, 12, 31)]
+
+
+def test_business_date_range_group_by():
+    """グループごとの範囲をエクスプレッションで生成できることを確認"""
+    df = pl.DataFrame(
+        {
+            "store": ["a", "a", "b", "b"],
+            "date": [
+                datetime(2024, 4, 26, 9),
+                datetime(2024, 5, 7, 10),
+                datetime(2024, 1, 1),
+                datetime(2024, 1, 1),
+            ],
+        },
+        schema={"store": pl.String, "date": pl.Datetime},
+    )
+
+    result = (
+        df.lazy()
+        .group_by("store", maintain_order=True)
+        .agg(
+            polars_japanese.business_date_range(
+                pl.col("date").min(), pl.col("date").max()
+            )
+        )
+        .collect()
+    )
+
+    assert result["date"].to_list() == [
+        [
+            date(2024, 4, 26),
+            date(2024, 4, 30),
+            date(2024, 5, 1),
+            date(2024, 5, 2),
+            date(2024, 5, 7),
+        ],
+        [],
+    ]
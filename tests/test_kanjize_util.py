@@ -1,4 +1,9 @@
+from decimal import Decimal
+
+import kanjize
 import polars as pl
+import pytest
+from kanjize import KanjizeConfiguration, KanjizeStyle, KanjizeZero
 from polars.testing import assert_series_equal
 
 import polars_japanese  # noqa: F401
@@ -19,6 +24,56 @@ def test_to_kanji():
     assert_series_equal(result, expected)
 
 
+@pytest.mark.parametrize(
+    "config",
+    [
+        KanjizeConfiguration(),
+        KanjizeConfiguration(style=KanjizeStyle.MIXED),
+        KanjizeConfiguration(style=KanjizeStyle.MIXED, kanji_thousand=False),
+        KanjizeConfiguration(style=KanjizeStyle.FLAT),
+        KanjizeConfiguration(use_daiji=True),
+        KanjizeConfiguration(style=KanjizeStyle.FLAT, zero=KanjizeZero.KANJI),
+    ],
+)
+def test_to_kanji_matches_kanjize(config):
+    """kanjize の設定ごとに kanjize と同じ結果になることを確認"""
+    data = [0, 1, 10, 11, 101, 1000, 1010, 3000, 10000, 20005, -45230003, 2**63 - 1]
+    df = pl.DataFrame({"test": data})
+
+    result = df.select(pl.col("test").ja.to_kanji(config=config)).to_series()
+
+    assert result.to_list() == [kanjize.number2kanji(n, config=config) for n in data]
+
+
+def test_to_kanji_large_numbers():
+    """Int64 の範囲を超える値を UInt64 型・Decimal 型から変換できることを確認"""
+    df = pl.DataFrame(
+        {
+            "uint": pl.Series([2**64 - 1, 10**16, None], dtype=pl.UInt64),
+            "decimal": pl.Series(
+                [Decimal("123456789012345678901234.9"), Decimal("-0.5"), None],
+                dtype=pl.Decimal(30, 1),
+            ),
+            "float": [12.9, float("nan"), -3.0],
+        }
+    )
+
+    result_df = df.select(pl.all().ja.to_kanji())
+
+    assert result_df["uint"].to_list() == [
+        "千八百四十四京六千七百四十四兆七百三十七億九百五十五万千六百十五",
+        "一京",
+        None,
+    ]
+    assert result_df["decimal"].to_list() == [
+        kanjize.number2kanji(123456789012345678901234),
+        kanjize.number2kanji(Decimal("-0.5")),
+        None,
+    ]
+    assert result_df["decimal"][0].startswith("千二百三十四垓")
+    assert result_df["float"].to_list() == ["十二", None, "-三"]
+
+
 def test_to_number():
     """漢数字を数値に変換できることを確認"""
     data = ["百二十三", None]
@@ -32,3 +87,84 @@ def test_to_number():
     result = result_df.to_series()
 
     assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("1万2千", 12000),
+        ("一二三四", 1234),
+        ("二〇二四", 2024),
+        ("壱萬弐阡", 12000),
+        ("１２，３４５", 12345),
+        ("1,200万", 12000000),
+        ("十二万三千四百五十六", 123456),
+        ("-三百", -300),
+        ("922京", 922 * 10**16),
+        ("万", None),
+        ("千二千", None),
+        ("abc", None),
+        ("", None),
+        ("1000京", None),
+        (None, None),
+    ],
+)
+def test_to_number_mixed_forms(value, expected):
+    """混在した表記・大字を変換し、解析できない値は null になることを確認"""
+    df = pl.DataFrame({"test": [value]}, schema={"test": pl.String})
+    result = df.select(pl.col("test").ja.to_number()).to_series()
+
+    assert result.to_list() == [expected]
+
+
+def test_to_number_return_error():
+    """return_error=True で行ごとのエラーを返すことを確認"""
+    df = pl.DataFrame({"test": ["百二十三", "万", "1.2.3", None]})
+    result = df.select(pl.col("test").ja.to_number(return_error=True)).unnest("test")
+
+    assert result["value"].to_list() == [123, None, None, None]
+    assert result["error"].to_list() == [
+        None,
+        "単位の前に数がありません: '万'",
+        "数値として解釈できない文字です: '.'",
+        None,
+    ]
+
+
+def test_extract_numbers():
+    """文字列の中の数を取り出せることを確認"""
+    df = pl.DataFrame(
+        {
+            "test": [
+                "三丁目十二番地",
+                "第二十一回",
+                "１２階",
+                "1,200万円",
+                "2024.1.5",
+                "万一の場合",
+                None,
+            ]
+        }
+    )
+    result = df.select(pl.col("test").ja.extract_numbers()).to_series()
+
+    assert result.dtype == pl.List(pl.Int64)
+    assert result.to_list() == [
+        [3, 12],
+        [21],
+        [12],
+        [12000000],
+        [2024, 1, 5],
+        [],
+        None,
+    ]
+
+
+def test_replace_kanji_numerals():
+    """文字列の中の数をアラビア数字に置き換えられることを確認"""
+    data = ["三丁目十二番地", "第二十一回", "１，２００円", "1-2-3", "１．５倍", None]
+    expected = ["3丁目12番地", "第21回", "1200円", "1-2-3", "１．５倍", None]
+    df = pl.DataFrame({"test": data})
+    result = df.select(pl.col("test").ja.replace_kanji_numerals()).to_series()
+
+    assert result.to_list() == expected
@@ -1,7 +1,12 @@
 import polars as pl
+import pytest
 from polars.testing import assert_series_equal
 
 import polars_japanese  # noqa: F401
+from polars_japanese.normalize_util import (
+    _normalize_with_replace,
+    register_normalize_profile,
+)
 
 
 def test_to_half_width():
@@ -116,6 +121,91 @@ def test_to_full_width_mixed():
     assert_series_equal(result, expected)
 
 
+def test_to_half_width_options():
+    """ja.to_half_width の変換対象の指定をテストします。"""
+    df = pl.DataFrame({"test": ["ＡＢＣ　１２３　ｶﾀｶﾅ　カタカナ"]})
+    result = df.select(
+        pl.col("test").ja.to_half_width(ascii=False, digit=False).alias("kana"),
+        pl.col("test").ja.to_half_width(kana=False).alias("ascii_digit"),
+        pl.col("test").ja.to_half_width(ignore="　").alias("ignore"),
+    ).row(0)
+    assert result == (
+        "ＡＢＣ　１２３　ｶﾀｶﾅ　ｶﾀｶﾅ",
+        "ABC 123 ｶﾀｶﾅ カタカナ",
+        "ABC　123　ｶﾀｶﾅ　ｶﾀｶﾅ",
+    )
+
+
+def test_to_full_width_options():
+    """ja.to_full_width の変換対象の指定をテストします。"""
+    df = pl.DataFrame({"test": ["ABC 123 ｶﾞｷﾞ ﾊﾟﾋﾟ"]})
+    result = df.select(
+        pl.col("test").ja.to_full_width(ascii=False, digit=False).alias("kana"),
+        pl.col("test").ja.to_full_width(digit=False, kana=False).alias("ascii"),
+        pl.col("test").ja.to_full_width(ignore=" ").alias("ignore"),
+    ).row(0)
+    assert result == (
+        "ABC 123 ガギ パピ",
+        "ＡＢＣ　123　ｶﾞｷﾞ　ﾊﾟﾋﾟ",
+        "ＡＢＣ １２３ ガギ パピ",
+    )
+
+
+def test_to_katakana():
+    """ja.to_katakana をテストします。"""
+    data = [
+        "ひらがな",
+        "ゔぁいおりん",
+        "ゕゖ",
+        "いすゞ",
+        "わ\u3099",
+        "カナ・漢字abc",
+        None,
+    ]
+    expected = [
+        "ヒラガナ",
+        "ヴァイオリン",
+        "ヵヶ",
+        "イスヾ",
+        "ヷ",
+        "カナ・漢字abc",
+        None,
+    ]
+    df = pl.DataFrame({"test": data})
+    result = df.select(pl.col("test").ja.to_katakana()).to_series()
+    assert_series_equal(result, pl.Series("test", expected))
+
+
+def test_to_hiragana():
+    """ja.to_hiragana をテストします。"""
+    data = [
+        "カタカナ",
+        "ヴァイオリン",
+        "ヵヶ",
+        "イスヾ",
+        "ヷ",
+        "ｶﾀｶﾅ",
+        "ひらがな",
+        None,
+    ]
+    expected = [
+        "かたかな",
+        "ゔぁいおりん",
+        "ゕゖ",
+        "いすゞ",
+        "わ\u3099",
+        "ｶﾀｶﾅ",
+        "ひらがな",
+        None,
+    ]
+    df = pl.DataFrame({"test": data})
+    result = df.select(pl.col("test").ja.to_hiragana()).to_series()
+    assert_series_equal(result, pl.Series("test", expected))
+
+    result = df.select(pl.col("test").ja.to_hiragana(ignore="ヶ")).to_series()
+    assert result[2] == "ゕヶ"
+
+
 def test_normalize():
     """ja.normalize をテストします。NFKC + 日本語特有ルール"""
     data = [
@@ -153,3 +243,136 @@ def test_normalize():
     result_df = df.select(pl.col("test").ja.normalize())
     result = result_df.to_series()
     assert_series_equal(result, expected)
+
+
+def test_normalize_matches_replace_chain():
+    """ja.normalize が従来のreplace_allの連結と同じ結果になることをテストします。"""
+    data = [
+        "〜～﹣－—―━─",  # 長音記号類
+        "‐˗֊‑‒–⁃⁻₋−",  # ハイフン類
+        "\"引用\"と'引用'",  # クォート
+        "\t改行\nを含む\r\n文字列\u0085",  # 空白類
+        "　  前後の空白  ",
+        "ﾊﾞﾋﾟﾌﾟ①㈱¨",  # NFKCで変換される文字
+        "",
+        "   ",
+        None,
+    ]
+    df = pl.DataFrame({"test": data})
+    result = df.select(pl.col("test").ja.normalize()).to_series()
+    expected = df.select(_normalize_with_replace(pl.col("test"))).to_series()
+    assert_series_equal(result, expected)
+
+
+def test_normalize_profile_neologdn():
+    """組み込みの neologdn プロファイルをテストします。"""
+    data = ["ｽｰﾊﾟｰーーー", "日本 語 と English words", "ラーメン〜〜", None]
+    expected = ["スーパー", "日本語とEnglish words", "ラーメンー", None]
+    df = pl.DataFrame({"test": data})
+    result = df.select(pl.col("test").ja.normalize(profile="neologdn")).to_series()
+    assert_series_equal(result, pl.Series("test", expected))
+
+
+def test_normalize_profile_user_defined():
+    """ユーザー定義のプロファイルをテストします。"""
+    register_normalize_profile(
+        "test_itaiji", mapping={"髙": "高", "﨑": "崎"}, keep="！"
+    )
+    data = ["髙﨑　さん！", "ＡＢＣ！？", None]
+    expected = ["高崎 さん！", "ABC！?", None]
+    df = pl.DataFrame({"test": data})
+    result = df.select(pl.col("test").ja.normalize(profile="test_itaiji")).to_series()
+    assert_series_equal(result, pl.Series("test", expected))
+
+
+def test_normalize_profile_errors():
+    """不正なプロファイル指定でエラーになることをテストします。"""
+    with pytest.raises(ValueError):
+        pl.col("test").ja.normalize(profile="not_registered")
+    with pytest.raises(ValueError):
+        register_normalize_profile("test_error", base="not_registered")
+    with pytest.raises(ValueError):
+        register_normalize_profile("test_error", mapping={"ab": "c"})
+
+
+def test_pipeline():
+    """ja.pipeline が各変換を連結した結果と一致することをテストします。"""
+    df = pl.DataFrame({"test": ["  ｶﾌﾞｼｷｶﾞｲｼｬ　abc！ ", "ﾃｽﾄ１２３", "test", "", None]})
+    result = df.select(
+        pl.col("test").ja.pipeline(
+            ["normalize", ("half_width", {"digit": False}), "upper", "strip"]
+        )
+    ).to_series()
+    expected = df.select(
+        pl.col("test")
+        .ja.normalize()
+        .ja.to_half_width(digit=False)
+        .str.to_uppercase()
+        .str.strip_chars()
+    ).to_series()
+    assert_series_equal(result, expected)
+    assert result.to_list() == ["ｶﾌﾞｼｷｶﾞｲｼｬ ABC!", "ﾃｽﾄ123", "TEST", "", None]
+
+
+def test_pipeline_errors():
+    """ja.pipeline に未対応のステップ・オプションを指定した場合のエラー"""
+    with pytest.raises(ValueError):
+        pl.col("test").ja.pipeline(["unknown"])
+    with pytest.raises(ValueError):
+        pl.col("test").ja.pipeline([("upper", {"ignore": "a"})])
+    with pytest.raises(ValueError):
+        pl.col("test").ja.pipeline([("normalize", {"profile": "unknown"})])
+
+
+def test_is_normalized():
+    """ja.is_normalized をテストします。"""
+    data = [
+        "customer-000123",  # ASCII
+        "東京都 千代田区",  # 正規化済み
+        "ＡＢＣ",  # NFKCで変化
+        " 前後の空白 ",
+        'quote"',
+        "",
+        None,
+    ]
+    expected = [True, True, False, False, False, True, None]
+    df = pl.DataFrame({"test": data})
+    result = df.select(pl.col("test").ja.is_normalized()).to_series()
+    assert_series_equal(result, pl.Series("test", expected))
+
+    # normalize の結果は常に正規化済み
+    result = df.select(pl.col("test").ja.normalize().ja.is_normalized()).to_series()
+    assert result.drop_nulls().all()
+
+
+def test_half_full_width_unchanged():
+    """変換対象を含まない文字列がそのまま返ることをテストします。"""
+    data = ["abc-123", "漢字とひらがな", None]
+    df = pl.DataFrame({"test": data})
+    assert_series_equal(
+        df.select(pl.col("test").ja.to_half_width()).to_series(), df.to_series()
+    )
+    data = ["漢字とひらがな", "ＡＢＣ", None]
+    df = pl.DataFrame({"test": data})
+    assert_series_equal(
+        df.select(pl.col("test").ja.to_full_width()).to_series(), df.to_series()
+    )
+
+
+def test_categorical_input():
+    """Categorical/Enum の列ではカテゴリの辞書に対して変換されることをテストします。"""
+    data = ["ＡＢＣ", "ｶﾀｶﾅ", "ABC", None, "ＡＢＣ"]
+    for dtype in [pl.Categorical, pl.Enum(["ＡＢＣ", "ｶﾀｶﾅ", "ABC"])]:
+        df = pl.DataFrame({"test": pl.Series(data, dtype=dtype)})
+
+        result = df.select(pl.col("test").ja.normalize()).to_series()
+        assert result.dtype == pl.Categorical
+        assert result.to_list() == ["ABC", "カタカナ", "ABC", None, "ABC"]
+
+        result = df.select(pl.col("test").ja.to_half_width()).to_series()
+        assert result.dtype == pl.Categorical
+        assert result.to_list() == ["ABC", "ｶﾀｶﾅ", "ABC", None, "ABC"]
+
+        result = df.select(pl.col("test").ja.to_full_width()).to_series()
+        assert result.dtype == pl.Categorical
+        assert result.to_list() == ["ＡＢＣ", "カタカナ", "ＡＢＣ", None, "ＡＢＣ"]
@@ -2,6 +2,12 @@ import polars as pl
 import polars_japanese  # noqa: F401
 import pytest
 from polars.testing import assert_frame_equal
+from polars_japanese.prefecture import (
+    _PREFECTURE_DATA,
+    PREFECTURE_ENUM,
+    PREFECTURE_ROMAJI_ENUM,
+    REGION_ENUM,
+)
 
 
 def test_to_code():
@@ -139,7 +145,8 @@ def test_to_kanji_from_code():
     data = {"pref_code": ["1", "13", "47", "99", None]}
     df = pl.DataFrame(data)
     expected = pl.DataFrame(
-        {"pref_code": ["北海道", "東京都", "沖縄県", None, None]}
+        {"pref_code": ["北海道", "東京都", "沖縄県", None, None]},
+        schema={"pref_code": PREFECTURE_ENUM},
     )
     result_df = df.with_columns(pl.col("pref_code").ja_pref.to_kanji())
     assert_frame_equal(result_df, expected)
@@ -158,7 +165,8 @@ def test_to_kanji_from_name():
     }
     df = pl.DataFrame(data)
     expected = pl.DataFrame(
-        {"pref_code": ["北海道", "東京都", "大阪府", None, None]}
+        {"pref_code": ["北海道", "東京都", "大阪府", None, None]},
+        schema={"pref_code": PREFECTURE_ENUM},
     )
     result_df = df.with_columns(pl.col("pref_code").ja_pref.to_kanji())
     assert_frame_equal(result_df, expected)
@@ -249,7 +257,8 @@ def test_to_romaji_from_code():
     data = {"pref_code": ["1", "13", "27", "99", None]}
     df = pl.DataFrame(data)
     expected = pl.DataFrame(
-        {"pref_code": ["HOKKAIDO", "TOKYO", "OSAKA", None, None]}
+        {"pref_code": ["HOKKAIDO", "TOKYO", "OSAKA", None, None]},
+        schema={"pref_code": PREFECTURE_ROMAJI_ENUM},
     )
     result_df = df.with_columns(pl.col("pref_code").ja_pref.to_romaji())
     assert_frame_equal(result_df, expected)
@@ -268,7 +277,8 @@ def test_to_romaji_from_name():
     }
     df = pl.DataFrame(data)
     expected = pl.DataFrame(
-        {"pref_code": ["HOKKAIDO", "TOKYO", "OSAKA", None, None]}
+        {"pref_code": ["HOKKAIDO", "TOKYO", "OSAKA", None, None]},
+        schema={"pref_code": PREFECTURE_ROMAJI_ENUM},
     )
     result_df = df.with_columns(pl.col("pref_code").ja_pref.to_romaji())
     assert_frame_equal(result_df, expected)
@@ -279,7 +289,8 @@ def test_to_region_from_code():
     data = {"pref_code": ["1", "13", "27", "40", "99", None]}
     df = pl.DataFrame(data)
     expected = pl.DataFrame(
-        {"pref_code": ["北海道", "関東", "近畿", "九州・沖縄", None, None]}
+        {"pref_code": ["北海道", "関東", "近畿", "九州・沖縄", None, None]},
+        schema={"pref_code": REGION_ENUM},
     )
     result_df = df.with_columns(pl.col("pref_code").ja_pref.to_region())
     assert_frame_equal(result_df, expected)
@@ -299,7 +310,8 @@ def test_to_region_from_name():
     }
     df = pl.DataFrame(data)
     expected = pl.DataFrame(
-        {"pref_code": ["北海道", "関東", "近畿", "九州・沖縄", None, None]}
+        {"pref_code": ["北海道", "関東", "近畿", "九州・沖縄", None, None]},
+        schema={"pref_code": REGION_ENUM},
     )
     result_df = df.with_columns(pl.col("pref_code").ja_pref.to_region())
     assert_frame_equal(result_df, expected)
@@ -382,3 +394,98 @@ def test_expr_methods_scalar(input_val, method_name, expected_val):
         assert result is None
     else:
         assert result == expected_val
+
+
+def test_to_code_categorical():
+    # Categorical の列からコードへの変換テスト
+    df = pl.DataFrame(
+        {"pref_name": pl.Series(["東京", "ｵｵｻｶ", None, "tokyo"], dtype=pl.Categorical)}
+    )
+    expected = pl.DataFrame({"pref_name": [13, 27, None, 13]})
+    result_df = df.select(pl.col("pref_name").ja_pref.to_code())
+    assert_frame_equal(result_df, expected)
+
+
+@pytest.mark.parametrize(
+    "input_val, expected_val",
+    [
+        ("TOKYO-TO", 13),
+        ("osakafu", 27),
+        ("Aichi-Ken", 23),
+        ("ｔｏｋｙｏ", 13),
+        ("　神奈川県 ", 14),
+        ("ﾎｯｶｲﾄﾞｳ", 1),
+        ("01", 1),
+        ("１３", 13),
+        ("0", None),
+        ("TOKY", None),
+    ],
+)
+def test_to_code_variants(input_val, expected_val):
+    # 接尾辞・全角/半角・空白などの表記揺れの照合テスト
+    df = pl.DataFrame({"a": [input_val]})
+    result = df.select(pl.col("a").ja_pref.to_code()).to_series()
+    assert result.to_list() == [expected_val]
+
+
+def test_to_kanji_from_integer_code():
+    # 整数のコードから漢字への変換テスト
+    df = pl.DataFrame({"pref_code": [1, 13, 47, 0, 99, None]})
+    result = df.select(pl.col("pref_code").ja_pref.to_kanji()).to_series()
+    assert result.to_list() == ["北海道", "東京都", "沖縄県", None, None, None]
+
+
+def test_outputs_match_prefecture_data():
+    # プラグインの照合・変換の結果が Python 側の表と一致する
+    data = list(_PREFECTURE_DATA.values())
+    df = pl.DataFrame(
+        {
+            "code": [d["code"] for d in data],
+            "name": [d["kanji"] for d in data],
+        }
+    )
+    for column in ["code", "name"]:
+        result = df.select(
+            code=pl.col(column).ja_pref.to_code(),
+            kanji=pl.col(column).ja_pref.to_kanji(),
+            hira=pl.col(column).ja_pref.to_hiragana(),
+            kana=pl.col(column).ja_pref.to_katakana(),
+            roman=pl.col(column).ja_pref.to_romaji(),
+            region=pl.col(column).ja_pref.to_region(),
+        )
+        for key in ["code", "kanji", "hira", "kana", "roman", "region"]:
+            assert result[key].to_list() == [d[key] for d in data]
+
+
+def test_enum_outputs():
+    # 漢字表記・ローマ字表記・地方名は JIS コード順・地方の順の Enum になる
+    data = list(_PREFECTURE_DATA.values())
+    df = pl.DataFrame({"pref": [d["hira"] for d in data]})
+    result = df.select(
+        kanji=pl.col("pref").ja_pref.to_kanji(),
+        romaji=pl.col("pref").ja_pref.to_romaji(),
+        region=pl.col("pref").ja_pref.to_region(),
+    )
+    assert result.schema == pl.Schema(
+        {
+            "kanji": PREFECTURE_ENUM,
+            "romaji": PREFECTURE_ROMAJI_ENUM,
+            "region": REGION_ENUM,
+        }
+    )
+    assert result["kanji"].to_list() == [d["kanji"] for d in data]
+    assert result["romaji"].to_list() == [d["roman"] for d in data]
+    assert result["region"].to_list() == [d["region"] for d in data]
+    assert PREFECTURE_ENUM.categories.to_list() == [d["kanji"] for d in data]
+    assert PREFECTURE_ROMAJI_ENUM.categories.to_list() == [d["roman"] for d in data]
+    # 地方名の Enum は北から順に並ぶ
+    assert REGION_ENUM.categories.to_list() == list(
+        dict.fromkeys(d["region"] for d in data)
+    )
+
+
+def test_to_region_sort_order():
+    # 地方名は北から順に並ぶ
+    df = pl.DataFrame({"pref": ["沖縄", "東京", "北海道", "大阪"]})
+    result = df.select(pl.col("pref").ja_pref.to_region().sort()).to_series()
+    assert result.to_list() == ["北海道", "関東", "近畿", "九州・沖縄"]